@@ -1,9 +1,15 @@
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget, QApplication
+from PyQt6.QtWidgets import QWidget, QApplication
+import math
+import time
 import numpy as np
 import cv2
 
+from app.dithered_frame_source import DitheredFrameSource
+from app.exposure_scheduler import ExposureScheduler
+from app.print_surface import PrintSurface
+
 
 # noinspection PyUnresolvedReferences
 class PrintingWindow(QWidget):
@@ -13,27 +19,41 @@ class PrintingWindow(QWidget):
     """
     finished = pyqtSignal()  # Signal emitted when printing sequence finishes
 
-    def __init__(self, screen_index=1, fps=16):
+    # Bytes of converted pixmaps a print may keep. Qt stores pixmaps as 32-bit
+    # RGB on the raster backend, so an 8K frame costs about 133 MB: this fits a
+    # five-frame bit-plane cycle but not a 16-frame temporal one.
+    pixmap_cache_bytes = 5 * 7680 * 4320 * 4
+
+    def __init__(self, screen_index=1, fps=16, cache_pixmaps=True, pixmap_cache_bytes=None, clock=None):
         """
         Initialize the printing window.
 
         Args:
             screen_index (int): Index of the display screen to use.
-            fps (int): Frames per second to display the frames.
+            fps (int): Display time units per second; a frame lasting one unit is
+                shown for 1/fps seconds (frame sources may give frames longer durations).
+            cache_pixmaps (bool): Keep each frame's QPixmap after its first display so
+                later cycles skip the numpy → QImage → QPixmap conversion. A print
+                only caches when the pixmaps of its whole cycle fit in ``pixmap_cache_bytes``.
+            pixmap_cache_bytes (int, optional): Memory budget of the pixmap cache.
+                Defaults to PrintingWindow.pixmap_cache_bytes.
+            clock (callable, optional): Monotonic clock in ns for the exposure scheduler.
+                Defaults to time.monotonic_ns.
         """
         super().__init__()
         self.screen_index = screen_index
         self.fps = fps
+        self.cache_pixmaps = cache_pixmaps
+        if pixmap_cache_bytes is not None:
+            self.pixmap_cache_bytes = pixmap_cache_bytes
+        self.clock = clock
 
         self.setWindowTitle("Secondary Display - Darkroom Enlarger")
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
         self.setStyleSheet("background-color: black;")  # Ensure background light-blocking
 
-        # Set up layout and QLabel for image rendering
-        self.layout = QVBoxLayout(self)
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layout.addWidget(self.image_label)
+        # Print surface covering the whole window; sized in resizeEvent, not by a layout
+        self.print_surface = PrintSurface(self)
 
         # Retrieve target screen's geometry
         screens = self.screen().virtualSiblings()
@@ -45,38 +65,72 @@ class PrintingWindow(QWidget):
         self.setGeometry(self.screen_geometry)
         self.move(self.screen_geometry.left(), self.screen_geometry.top())
 
-        self.frames = []  # List of 8-bit grayscale frames to display
+        self.frames = []  # 8-bit grayscale frames to display (list or DitheredFrameSource)
+        self.frame_durations = []  # Display time of each frame, in units of 1/fps seconds
         self.current_frame = 0  # Index of the current frame being shown
-        self.total_frames_to_show = 0  # How many frames to show in total for given duration
+        self.exposure_duration_ms = 0  # Wall-clock exposure time of the current print
         self.frames_displayed = 0  # Counter for how many frames have been displayed
+        self.scheduler = None  # ExposureScheduler driving the current print
+        self._pixmap_cache = {}  # Frame index -> QPixmap converted during the first cycle
+        self._caching = False  # Whether the current print caches its pixmaps
+        self._display_times_ns = {'first_cycle': [], 'steady_state': []}
 
-        # Timer that triggers frame updates
+        # Precise single-shot timer that fires at the next frame boundary
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.update_frame)
 
+    def resizeEvent(self, event):
+        """Keep the print surface covering the whole window."""
+        self.print_surface.setGeometry(self.rect())
+        super().resizeEvent(event)
+
     def _begin_printing_frame_loop(self):
-        """Start the timer that cycles through the image frames at the specified FPS."""
-        self.timer.start(1000 // self.fps)
+        """Start the exposure clock, show the first frame and arm the timer."""
+        if not len(self.frames):
+            return  # Stopped before the loop began
+        unit_ns = 1_000_000_000 / self.fps
+        self.scheduler = ExposureScheduler(
+            [round(units * unit_ns) for units in self.frame_durations],
+            self.exposure_duration_ms * 1_000_000,
+            clock=self.clock
+        )
+        self.current_frame, delay_ns = self.scheduler.start()
+        self._show_current_frame()
+        self._arm_timer(delay_ns)
 
-    def start_printing(self, frames: list[np.ndarray], duration: int):
+    def start_printing(self, frames: list[np.ndarray] | DitheredFrameSource, duration: int):
         """
         Start printing the provided frames for a specified duration.
 
         Args:
-            frames (list[np.ndarray]): List of 2D np.uint8 frames to be displayed.
+            frames (list[np.ndarray] | DitheredFrameSource): List of 2D np.uint8 frames,
+                or a frame source that builds each frame when it is displayed.
             duration (int): Total display duration in milliseconds.
         """
         # Validate input frames
-        if not isinstance(frames, list) or not frames:
+        if isinstance(frames, DitheredFrameSource):
+            if len(frames) == 0:
+                raise ValueError("frame source must provide at least one frame.")
+        elif not isinstance(frames, list) or not frames:
             raise ValueError("frames must be a non-empty list of 2D np.uint8 arrays.")
+        else:
+            for i, frame in enumerate(frames):
+                if not isinstance(frame, np.ndarray):
+                    raise ValueError(f"Frame {i} is not a NumPy array.")
+                if frame.ndim != 2:
+                    raise ValueError(f"Frame {i} is not 2D (grayscale).")
+                if frame.dtype != np.uint8:
+                    raise ValueError(f"Frame {i} must have dtype np.uint8, but got {frame.dtype}.")
 
-        for i, frame in enumerate(frames):
-            if not isinstance(frame, np.ndarray):
-                raise ValueError(f"Frame {i} is not a NumPy array.")
-            if frame.ndim != 2:
-                raise ValueError(f"Frame {i} is not 2D (grayscale).")
-            if frame.dtype != np.uint8:
-                raise ValueError(f"Frame {i} must have dtype np.uint8, but got {frame.dtype}.")
+        # A print still exposing is replaced: its pending tick must not reach the new one
+        self.timer.stop()
+        self.scheduler = None  # Created when the frame loop begins
+        self._pixmap_cache = {}
+        if isinstance(self.frames, DitheredFrameSource):
+            self.frames.release()
+        self.frames = []
 
         # Select appropriate screen and apply geometry
         screen = QApplication.screens()[self.screen_index]
@@ -87,26 +141,58 @@ class PrintingWindow(QWidget):
         self.screen_width = screen.geometry().width()
         self.screen_height = screen.geometry().height()
 
-        # Decide whether to scale frames (only scale if not Sumopai screen)
-        if (self.screen_width, self.screen_height) == (7680, 4320):
+        # Frame sources carry per-frame durations (e.g. bit-plane PWM); lists are uniform
+        self.frame_durations = list(getattr(frames, 'frame_durations', [1] * len(frames)))
+
+        # Frames already generated at screen resolution are shown as-is; otherwise
+        # fall back to scaling every frame (prefer dithering at get_target_screen_size())
+        frame_shape = frames.shape if isinstance(frames, DitheredFrameSource) else frames[0].shape
+        if frame_shape == (self.screen_height, self.screen_width):
             self.frames = frames
         else:
             self.frames = self._scale_frames_to_screen(frames)
 
-        # Compute number of frames to display for the given duration
-        self.total_frames_to_show = int((duration / 1000) * self.fps)
+        # The exposure ends on wall-clock time, measured by the scheduler
+        self.exposure_duration_ms = duration
         self.frames_displayed = 0
         self.current_frame = 0
+        self._pixmap_cache = {}
+        self._caching = self.cache_pixmaps and self.pixmap_cycle_bytes() <= self.pixmap_cache_bytes
+        self._display_times_ns = {'first_cycle': [], 'steady_state': []}
+        self.print_surface.reset_paint_stats()
 
         self.showFullScreen()
         QTimer.singleShot(100, self._begin_printing_frame_loop)
 
+    def pixmap_cycle_bytes(self):
+        """Estimate the memory needed to cache the pixmaps of the current frame cycle.
+
+        Returns:
+            int: Bytes of one 32-bit pixmap per frame
+        """
+        if not len(self.frames):
+            return 0
+        height, width = self.frames.shape if isinstance(self.frames, DitheredFrameSource) else self.frames[0].shape
+        return len(self.frames) * height * width * 4
+
+    def get_target_screen_size(self):
+        """Get the resolution frames should be generated at for this window's screen.
+
+        Returns:
+            tuple: (width, height) of the target screen in pixels
+        """
+        screens = QApplication.screens()
+        if self.screen_index < len(screens):
+            geometry = screens[self.screen_index].geometry()
+            return geometry.width(), geometry.height()
+        return self.screen_width, self.screen_height
+
     def _scale_frames_to_screen(self, frames):
         """
         Scale and letterbox each frame to fit the screen resolution.
 
         Args:
-            frames (list[np.ndarray]): Original frames.
+            frames (list[np.ndarray] | DitheredFrameSource): Original frames.
 
         Returns:
             list[np.ndarray]: Scaled and padded frames.
@@ -117,7 +203,9 @@ class PrintingWindow(QWidget):
         target_w = int(w * scale)
 
         scaled_frames = []
-        for frame in frames:
+        for index in range(len(frames)):
+            # Index explicitly: a frame source reuses its buffers between requests
+            frame = frames[index]
             resized = cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_AREA)
             top = (self.screen_height - target_h) // 2
             bottom = self.screen_height - target_h - top
@@ -131,28 +219,102 @@ class PrintingWindow(QWidget):
     def stop_printing(self):
         """
         Stop the timer and emit the finished signal.
-        Called either manually or automatically after the last frame.
+        Called either manually or automatically when the exposure time has elapsed;
+        does nothing once the print has already stopped.
         """
         self.timer.stop()
+        if not len(self.frames):
+            return  # Nothing is printing
+        if self.scheduler is not None:
+            self.scheduler.stop()
+        self._pixmap_cache = {}  # Release the converted frames
+        # Hand the frame buffers back to the pipeline's pool; nothing shows them any more
+        if isinstance(self.frames, DitheredFrameSource):
+            self.frames.release()
+        self.frames = []
         self.finished.emit()
 
+    def get_timing_stats(self):
+        """Get exposure timing statistics for the current or last print.
+
+        Returns:
+            dict: Per-frame lateness and exposure timing (see ExposureScheduler),
+            empty if no print has started.
+        """
+        if self.scheduler is None:
+            return {}
+        return self.scheduler.get_timing_stats()
+
+    def get_frame_timing_report(self):
+        """Get the cost of putting frames on screen, first cycle vs steady state.
+
+        Every display includes converting the frame to a QPixmap, except
+        steady-state displays of a print whose pixmaps are cached.
+
+        Returns:
+            dict: Count, mean and max display cost in ms for each phase, whether
+            the print cached its pixmaps, and the print surface's paint cost.
+        """
+        report = {'pixmap_cache': self._caching, 'paint': self.print_surface.get_paint_stats()}
+        for phase, samples in self._display_times_ns.items():
+            report[phase] = {
+                'count': len(samples),
+                'mean_ms': round(sum(samples) / len(samples) / 1e6, 3) if samples else 0.0,
+                'max_ms': round(max(samples) / 1e6, 3) if samples else 0.0
+            }
+        return report
+
     def update_frame(self):
         """
-        Display the current frame, then schedule the next one.
-        Stops automatically when all expected frames have been shown.
+        Show the frame that should be on screen now, then arm the timer for the next boundary.
+        Late ticks skip straight to the current frame; stops once the exposure time has elapsed.
         """
-        frame = self.frames[self.current_frame]
-        h, w = frame.shape
-        stride = frame.strides[0]
+        if self.scheduler is None:
+            return  # The frame loop has not begun (e.g. a print was just restarted)
+        result = self.scheduler.tick()
+        if result is None:
+            self.stop_printing()
+            return
 
-        # Convert to QImage and show in QLabel
-        qimage = QImage(frame.data, w, h, stride, QImage.Format.Format_Grayscale8)
-        self.image_label.setPixmap(QPixmap.fromImage(qimage))
+        frame_index, delay_ns = result
+        if frame_index != self.current_frame:
+            # Consecutive frames of a frame source only differ in its dirty tiles
+            consecutive = frame_index == (self.current_frame + 1) % len(self.frames)
+            self.current_frame = frame_index
+            self._show_current_frame(incremental=consecutive)
+        self._arm_timer(delay_ns)
 
-        self.current_frame = (self.current_frame + 1) % len(self.frames)
-        self.frames_displayed += 1
+    def _arm_timer(self, delay_ns):
+        """Start the single-shot timer so it fires no earlier than delay_ns from now."""
+        self.timer.start(math.ceil(delay_ns / 1_000_000))
 
-        # Stop after total desired frames have been displayed
-        if self.frames_displayed >= self.total_frames_to_show:
-            self.stop_printing()
+    def _show_current_frame(self, incremental=False):
+        """Display the current frame, converting it to a pixmap unless one is cached.
+
+        Args:
+            incremental (bool): The previous frame shown was this frame's predecessor,
+                so only the frame source's dirty tiles need repainting.
+        """
+        start_ns = time.perf_counter_ns()
+
+        first_cycle = self.frames_displayed < len(self.frames)
+        pixmap = self._pixmap_cache.get(self.current_frame)
+        if pixmap is None:
+            frame = self.frames[self.current_frame]
+            h, w = frame.shape
+            stride = frame.strides[0]
+
+            # Convert to QImage, then to a display-native pixmap
+            qimage = QImage(frame.data, w, h, stride, QImage.Format.Format_Grayscale8)
+            pixmap = QPixmap.fromImage(qimage)
+            if self._caching:
+                self._pixmap_cache[self.current_frame] = pixmap
+
+        dirty_rects = None
+        if incremental and isinstance(self.frames, DitheredFrameSource):
+            dirty_rects = self.frames.dirty_tiles(self.current_frame)
+        self.print_surface.set_pixmap(pixmap, dirty_rects)
+        self.frames_displayed += 1
 
+        phase = 'first_cycle' if first_cycle else 'steady_state'
+        self._display_times_ns[phase].append(time.perf_counter_ns() - start_ns)
@@ -0,0 +1,143 @@
+"""Background task execution for the Darkroom Enlarger Application.
+
+Full-resolution loading, processing and print preparation run on a thread
+pool so the touchscreen UI stays responsive. Results, errors and progress
+are delivered back on the UI thread through Qt signals, and a newer task
+with the same name supersedes (cancels) an older one.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task when its cancellation token has been cancelled."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared between the UI thread and one task."""
+
+    def __init__(self):
+        """Initialize an uncancelled token."""
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation of the task."""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """bool: Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Raise TaskCancelled if cancellation has been requested.
+
+        Raises:
+            TaskCancelled: If the token has been cancelled.
+        """
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+class BackgroundWorker(QObject):
+    """Runs named tasks on a thread pool and delivers their outcome on the UI thread.
+
+    A task is a callable ``func(token, report_progress)``; it should call
+    ``token.raise_if_cancelled()`` between stages and may call
+    ``report_progress(percent)``. Submitting a task under a name that is
+    still running cancels the older one, whose outcome is then discarded.
+    """
+
+    progress = pyqtSignal(str, int)  # Task name, percent complete
+    _task_done = pyqtSignal(object)  # Internal: queued from pool threads to the UI thread
+
+    def __init__(self, max_workers=2, parent=None):
+        """Initialize the worker.
+
+        Args:
+            max_workers (int): Number of pool threads.
+            parent (QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="enlarger-worker")
+        self._tokens = {}  # Task name -> token of the latest submission
+        self._task_done.connect(self._deliver)
+
+    def submit(self, name, func, on_result, on_error=None):
+        """Run a task in the background, superseding any running task of the same name.
+
+        Args:
+            name (str): Task name (e.g. "load", "process", "print").
+            func (callable): ``func(token, report_progress)`` returning the result.
+            on_result (callable): Called on the UI thread with the task's result.
+            on_error (callable, optional): Called on the UI thread with the raised exception.
+
+        Returns:
+            CancellationToken: Token that cancels this submission.
+        """
+        self.cancel(name)
+        token = CancellationToken()
+        self._tokens[name] = token
+
+        def report_progress(percent):
+            if not token.cancelled:
+                self.progress.emit(name, int(percent))
+
+        def run():
+            try:
+                outcome = ('result', func(token, report_progress))
+            except TaskCancelled:
+                outcome = ('cancelled', None)
+            except Exception as e:
+                outcome = ('error', e)
+            # Cancelled outcomes are discarded; not emitting them also keeps a task
+            # finishing after shutdown from signalling a worker that may be gone
+            if not token.cancelled:
+                self._task_done.emit((name, token, outcome, on_result, on_error))
+
+        self._executor.submit(run)
+        return token
+
+    def cancel(self, *names):
+        """Cancel the running tasks with the given names; their outcomes are discarded.
+
+        Args:
+            *names (str): Task names to cancel.
+        """
+        for name in names:
+            token = self._tokens.pop(name, None)
+            if token is not None:
+                token.cancel()
+
+    def is_busy(self, name):
+        """Check whether a task with the given name is pending.
+
+        Args:
+            name (str): Task name.
+
+        Returns:
+            bool: True if the task has been submitted and not yet delivered.
+        """
+        return name in self._tokens
+
+    def shutdown(self):
+        """Cancel all tasks and stop the thread pool.
+
+        Tasks already running are not waited for; they stop at their next
+        cancellation check and their outcomes are never delivered.
+        """
+        self.cancel(*list(self._tokens))
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _deliver(self, payload):
+        """Hand a finished task's outcome to its callback unless it was superseded."""
+        name, token, (kind, value), on_result, on_error = payload
+        if token.cancelled or self._tokens.get(name) is not token:
+            return
+        del self._tokens[name]
+
+        if kind == 'result':
+            on_result(value)
+        elif kind == 'error' and on_error is not None:
+            on_error(value)
@@ -0,0 +1,122 @@
+"""Reusable array buffers for the print pipeline.
+
+Display frames are 8K uint8 arrays and the print path needs a few 16-bit
+image-sized temporaries. A buffer pool hands these out by shape and dtype
+and takes them back when a stage or a print is done with them, so
+back-to-back prints of the same geometry reach a steady state where no
+large array is allocated at all.
+"""
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class BufferPool:
+    """Hands out numpy buffers by shape and dtype, and reclaims them for reuse.
+
+    Released buffers are kept up to ``max_bytes`` in total; beyond that the
+    least recently released are dropped and left to the garbage collector.
+    The pool is thread-safe: prints are prepared on a worker thread and
+    released from the UI thread.
+    """
+
+    # Bytes of released buffers kept for reuse (four 8K uint8 frames)
+    max_bytes = 4 * 7680 * 4320
+
+    def __init__(self, max_bytes=None):
+        """Initialize an empty pool.
+
+        Args:
+            max_bytes (int, optional): Bytes of released buffers kept for reuse.
+                Defaults to BufferPool.max_bytes.
+        """
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+
+        self._free = OrderedDict()  # (shape, dtype) -> released buffers, least recently released first
+        self._free_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, shape, dtype, zeroed=False):
+        """Hand out a buffer, reusing a released one of the same shape and dtype.
+
+        Args:
+            shape (tuple): Array shape
+            dtype (numpy.dtype): Array data type
+            zeroed (bool): Whether the buffer must be all zeros; otherwise its
+                contents are undefined
+
+        Returns:
+            numpy.ndarray: A C-contiguous buffer owned by the caller until released
+        """
+        key = (tuple(shape), np.dtype(dtype).str)
+        buffer = None
+        with self._lock:
+            released = self._free.get(key)
+            if released:
+                buffer = released.pop()
+                if not released:
+                    del self._free[key]
+                self._free_bytes -= buffer.nbytes
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if buffer is None:
+            return np.zeros(key[0], dtype=key[1]) if zeroed else np.empty(key[0], dtype=key[1])
+        if zeroed:
+            buffer.fill(0)
+        return buffer
+
+    def release(self, *buffers):
+        """Give buffers back to the pool; the caller must not use them afterwards.
+
+        Args:
+            *buffers (numpy.ndarray): Buffers obtained from ``acquire``
+
+        Raises:
+            ValueError: If a buffer is a view or has already been released.
+        """
+        with self._lock:
+            for buffer in buffers:
+                if buffer.base is not None or not buffer.flags.c_contiguous:
+                    raise ValueError("Only whole buffers can be released, not views")
+
+                key = (buffer.shape, buffer.dtype.str)
+                released = self._free.setdefault(key, [])
+                if any(existing is buffer for existing in released):
+                    raise ValueError("Buffer has already been released")
+                released.append(buffer)
+                self._free.move_to_end(key)
+                self._free_bytes += buffer.nbytes
+
+            while self._free_bytes > self.max_bytes:
+                key, released = next(iter(self._free.items()))
+                self._free_bytes -= released.pop(0).nbytes
+                if not released:
+                    del self._free[key]
+
+    def get_stats(self):
+        """Returns buffer pool statistics.
+
+        Returns:
+            dict: Reuse hits and allocation misses, plus the buffers currently kept.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'free_buffers': sum(len(released) for released in self._free.values()),
+                'free_bytes': self._free_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def clear(self):
+        """Drops every released buffer and resets the hit/miss counters."""
+        with self._lock:
+            self._free.clear()
+            self._free_bytes = 0
+            self.hits = 0
+            self.misses = 0
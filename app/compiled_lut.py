@@ -0,0 +1,168 @@
+"""Compiled print tables for the Darkroom Enlarger Application.
+
+This module folds the print-side per-pixel chain (LUT → inversion → 12-bit
+reduction → base/remainder split) into precomputed 65536-entry tables, so a
+raw 16-bit source image maps straight to the dither inputs in two gathers.
+"""
+import hashlib
+import numpy as np
+
+# Pixels gathered per chunk: np.take copies its indices to intp (8 bytes each),
+# so chunking bounds that temporary at 2 MB however large the image is
+GATHER_CHUNK_PIXELS = 1 << 18
+
+
+def gather(table, index, out=None, mode='raise'):
+    """Look up ``table[index]`` into ``out``, a bounded chunk of rows at a time.
+
+    Args:
+        table (numpy.ndarray): 1D lookup table
+        index (numpy.ndarray): Integer indices (e.g. 16-bit pixels); views are fine
+        out (numpy.ndarray, optional): Contiguous destination with the index's shape
+        mode (str): np.take out-of-range mode
+
+    Returns:
+        numpy.ndarray: The gathered values (``out`` if given)
+    """
+    if out is None:
+        out = np.empty(index.shape, dtype=table.dtype)
+    if index.ndim == 0 or index.size == 0:
+        np.take(table, index, out=out, mode=mode)
+        return out
+
+    rows = max(1, GATHER_CHUNK_PIXELS // (index.size // index.shape[0]))
+    for start in range(0, index.shape[0], rows):
+        np.take(table, index[start:start + rows], out=out[start:start + rows], mode=mode)
+    return out
+
+
+class CompiledLUT:
+    """A LUT compiled together with inversion and the 12-bit dither split.
+
+    The compiled tables are indexed directly by raw 16-bit pixel values:
+
+    - ``print_table`` (uint16): LUT applied and optionally inverted
+    - ``base_table`` (uint8): upper 8 bits of the 12-bit print value
+    - ``remainder_table`` (uint8): lower 4 bits of the 12-bit print value
+
+    Saturated entries (base 255) are stored as base 254 with remainder 15, so
+    ``base + (remainder >= f)`` stays at 255 for every frame without clipping.
+    """
+
+    TABLE_SIZE = 65536
+
+    # The remainder is 4 bits wide, so at most 16 frames carry information
+    MAX_FRAMES = 16
+
+    def __init__(self, lut, invert=True):
+        """Compile the print tables for a LUT.
+
+        Args:
+            lut (numpy.ndarray): 256x256 (or flat 65536-entry) 16-bit LUT
+            invert (bool): Whether to fold negative-to-positive inversion in
+
+        Raises:
+            ValueError: If the LUT is missing, not 16-bit or the wrong size.
+        """
+        if lut is None:
+            raise ValueError("Cannot compile a None LUT")
+
+        if lut.dtype != np.uint16:
+            raise ValueError(f"LUT must be 16-bit (uint16). Found: {lut.dtype}")
+
+        if lut.size != self.TABLE_SIZE:
+            raise ValueError(f"LUT must have {self.TABLE_SIZE} entries. Found: {lut.size}")
+
+        lut_1d = np.ascontiguousarray(lut).reshape(-1)
+        self.invert = invert
+        self.content_hash = self.hash_lut(lut_1d)
+
+        print_table = np.invert(lut_1d) if invert else lut_1d.copy()
+
+        image_12bit = print_table >> 4
+        base_table = (image_12bit >> 4).astype(np.uint8)
+        remainder_table = (image_12bit & 0xF).astype(np.uint8)
+
+        # Fold the 8-bit clip into the tables (see class docstring)
+        saturated = base_table == 255
+        base_table[saturated] = 254
+        remainder_table[saturated] = 15
+
+        for table in (print_table, base_table, remainder_table):
+            table.flags.writeable = False
+
+        self.print_table = print_table
+        self.base_table = base_table
+        self.remainder_table = remainder_table
+
+    @staticmethod
+    def hash_lut(lut):
+        """Compute a content hash for LUT data.
+
+        Args:
+            lut (numpy.ndarray): LUT data of any shape
+
+        Returns:
+            str: Hex digest identifying the LUT contents
+        """
+        return hashlib.blake2b(np.ascontiguousarray(lut).tobytes(), digest_size=16).hexdigest()
+
+    def apply(self, image, out=None, executor=None):
+        """Apply the LUT (and inversion) to an image in one gather.
+
+        Args:
+            image (numpy.ndarray): Input 16-bit image data
+            out (numpy.ndarray, optional): uint16 destination with the image's shape
+            executor (TileExecutor, optional): Runs the gather over row bands in parallel
+
+        Returns:
+            numpy.ndarray: Print-ready 16-bit image data
+        """
+        self._check_image(image)
+        if executor is None:
+            return gather(self.print_table, image, out, mode='wrap')
+
+        if out is None:
+            out = np.empty(image.shape, dtype=np.uint16)
+        executor.run(lambda rows: gather(self.print_table, image[rows], out[rows], mode='wrap'), image.shape)
+        return out
+
+    def split(self, image, base_out=None, remainder_out=None, executor=None):
+        """Map a raw 16-bit image straight to the dither base and remainder planes.
+
+        Args:
+            image (numpy.ndarray): Input 16-bit image data
+            base_out (numpy.ndarray, optional): uint8 destination for the base plane
+            remainder_out (numpy.ndarray, optional): uint8 destination for the remainder plane
+            executor (TileExecutor, optional): Runs the gathers over row bands in parallel
+
+        Returns:
+            tuple: (base, remainder) uint8 planes with the image's shape
+        """
+        self._check_image(image)
+        if executor is None:
+            base = gather(self.base_table, image, base_out, mode='wrap')
+            remainder = gather(self.remainder_table, image, remainder_out, mode='wrap')
+            return base, remainder
+
+        base = np.empty(image.shape, dtype=np.uint8) if base_out is None else base_out
+        remainder = np.empty(image.shape, dtype=np.uint8) if remainder_out is None else remainder_out
+
+        def split_rows(rows):
+            gather(self.base_table, image[rows], base[rows], mode='wrap')
+            gather(self.remainder_table, image[rows], remainder[rows], mode='wrap')
+
+        executor.run(split_rows, image.shape)
+        return base, remainder
+
+    def _check_image(self, image):
+        """Validate that an image can index the compiled tables.
+
+        Raises:
+            ValueError: If the image is None or not 16-bit.
+        """
+        if image is None:
+            raise ValueError("Cannot apply compiled LUT to None image")
+
+        if image.dtype != np.uint16:
+            raise ValueError(f"Expected 16-bit image data, got {image.dtype}")
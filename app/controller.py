@@ -1,39 +1,167 @@
 """Controller for the Darkroom Enlarger Application with separated preview/print concerns."""
 import os
-import cv2
-import numpy as np
+import time
+from PyQt6.QtCore import QTimer
 from app.lut_manager import LUTManager
 from app.image_processor import ImageProcessor
 from app.PrintingWindow import PrintingWindow
 from app.testmode_display_window import TestDisplayWindow
 from app.preview_image_manager import PreviewImageManager
 from app.print_image_manager import PrintImageManager
+from app.background_worker import BackgroundWorker
+from app.tile_executor import TileExecutor
+from app.buffer_pool import BufferPool
+from app.frame_set_cache import FrameSetCache
+from app.stage_graph import StageGraph
 
 class Controller:
     """Handles the logic and interactions with separated preview and print processing pipelines."""
+
+    # Minimum size of the preview area (16:9, matches preview_label)
+    PREVIEW_SIZE = (768, 432)
+
+    # Quiet period after the last preview resize before re-rendering
+    preview_resize_debounce_ms = 150
+
+    # Process previews at preview resolution and defer full resolution to print
+    proxy_processing = True
+
+    # Labels used when logging background task progress
+    TASK_LABELS = {'load': "Loading image", 'process': "Processing image", 'print': "Preparing print"}
+
+    # On-disk cache of prepared dither planes: None stores them under FrameSetCache's
+    # default directory; a size bound of 0 disables the cache
+    frame_cache_directory = None
+    frame_cache_max_bytes = FrameSetCache.max_bytes
     
-    def __init__(self, main_window):
+    def __init__(self, main_window, frame_cache_directory=None, frame_cache_max_bytes=None):
         """Initializes the Controller with separated preview and print managers.
 
         Args:
             main_window: The main application window (MainWindow instance).
+            frame_cache_directory (str, optional): Where prepared dither planes are cached.
+                Defaults to Controller.frame_cache_directory.
+            frame_cache_max_bytes (int, optional): Size bound of the frame cache; 0 disables it.
+                Defaults to Controller.frame_cache_max_bytes.
         """
+        if frame_cache_directory is not None:
+            self.frame_cache_directory = frame_cache_directory
+        if frame_cache_max_bytes is not None:
+            self.frame_cache_max_bytes = frame_cache_max_bytes
+
         self.main_window = main_window
         self.lut_manager = LUTManager()
-        self.image_processor = ImageProcessor()
+        # Per-pixel stages share one thread pool across all cores
+        self.tile_executor = TileExecutor()
+        self.image_processor = ImageProcessor(executor=self.tile_executor)
         self.printing_window = PrintingWindow()
         self.test_display_window = TestDisplayWindow()
         
+        # Display frames and print temporaries are recycled from one print to the next
+        self.buffer_pool = BufferPool()
+        # Prepared dither planes persist on disk, so reprints start almost immediately
+        self.frame_cache = None
+        if self.frame_cache_max_bytes:
+            self.frame_cache = FrameSetCache(self.frame_cache_directory, self.frame_cache_max_bytes)
+
         # Separate managers for preview and print concerns
         self.preview_manager = PreviewImageManager()
-        self.print_manager = PrintImageManager()
+        self.print_manager = PrintImageManager(
+            executor=self.tile_executor, buffer_pool=self.buffer_pool, frame_cache=self.frame_cache
+        )
+
+        # Full-resolution work runs here so the UI stays responsive
+        self.worker = BackgroundWorker()
+
+        # Images, LUTs and frames are stages recomputed only when their inputs change
+        self.pipeline = self._build_pipeline()
 
         self.connect_signals()
 
         self.current_image_path = None
-        self.loaded_image = None
-        self.loaded_lut = None
-        self.processed_image = None  # Store processed image (LUT + inversion applied)
+        self.preview_processed = False  # Preview shows the current LUT applied (proxy or full resolution)
+        self.show_original_preview = False  # Show the loaded image even when a processed one exists
+
+        # Re-render the preview once resizing settles
+        self._preview_resize_timer = QTimer()
+        self._preview_resize_timer.setSingleShot(True)
+        self._preview_resize_timer.setInterval(self.preview_resize_debounce_ms)
+        self._preview_resize_timer.timeout.connect(self.update_preview_display)
+
+    def _build_pipeline(self):
+        """Declare the processing stages and their dependencies.
+
+        The selected image's probe, the selected LUT, the print screen size and
+        the dither mode are inputs. Loading (decode + orientation) depends on
+        the image only, so selecting another LUT never re-decodes; LUT and
+        inversion, and the dither frames (LUT, inversion, padding and 12-bit
+        split fused), are recomputed only when the image, LUT or print geometry
+        change. The exposure time is not an input: it only drives presentation,
+        so changing it never regenerates frames.
+
+        Returns:
+            StageGraph: The pipeline, with no inputs set.
+        """
+        pipeline = StageGraph()
+        pipeline.add_input('probe')
+        pipeline.add_input('lut_entry')
+        pipeline.add_input('screen')
+        pipeline.add_input('dither_mode')
+
+        pipeline.add_stage('image', ['probe'], lambda probe: self.image_processor.load_image(probe.path, probe))
+        pipeline.add_stage('pyramid', ['image'], lambda result: self.preview_manager.build_pyramid(
+            result.image, result.quarter_turns
+        ))
+        pipeline.add_stage('lut', ['lut_entry'], lambda entry: entry.lut)
+        pipeline.add_stage('print_table', ['lut_entry'], lambda entry: self.lut_manager.get_derived_for(
+            entry, "print_table", self.print_manager.compile_lut
+        ))
+        pipeline.add_stage('processed', ['image', 'lut'], self._process_full_resolution)
+        pipeline.add_stage('processed_pyramid', ['processed'], self.preview_manager.build_pyramid)
+        # Frame cache key of the image content; not needed without a frame cache
+        pipeline.add_stage('image_hash', ['image'], lambda result: FrameSetCache.hash_image(
+            result.image, result.quarter_turns
+        ) if self.frame_cache is not None else None)
+        pipeline.add_stage('frames', ['image', 'image_hash', 'print_table', 'screen', 'dither_mode'],
+                           self._prepare_frames)
+        return pipeline
+
+    @property
+    def loaded_image(self):
+        """numpy.ndarray or None: The loaded, landscape-oriented image."""
+        load_result = self.pipeline.peek('image')
+        return load_result.image if load_result is not None else None
+
+    @property
+    def image_probe(self):
+        """ImageProbe or None: Header information of the loaded image."""
+        load_result = self.pipeline.peek('image')
+        return load_result.probe if load_result is not None else None
+
+    @property
+    def loaded_pyramid(self):
+        """ImagePyramid or None: Preview pyramid of the loaded image."""
+        return self.pipeline.peek('pyramid')
+
+    @property
+    def loaded_lut(self):
+        """numpy.ndarray or None: The selected 256x256 LUT."""
+        return self.pipeline.peek('lut')
+
+    @property
+    def compiled_lut(self):
+        """CompiledLUT or None: Compiled print tables for the selected LUT (cached by LUTManager)."""
+        return self.pipeline.peek('print_table')
+
+    @property
+    def processed_image(self):
+        """numpy.ndarray or None: Full-resolution image with LUT and inversion applied, if current."""
+        return self.pipeline.peek('processed')
+
+    @property
+    def processed_pyramid(self):
+        """ImagePyramid or None: Preview pyramid of the processed image, if current."""
+        return self.pipeline.peek('processed_pyramid')
 
     def connect_signals(self):
         """Connects UI signals to controller slots."""
@@ -43,38 +171,92 @@ class Controller:
         self.main_window.print_button.clicked.connect(self.start_print)
         self.main_window.stop_button.clicked.connect(self.stop_print)
         self.main_window.test_mode_button.clicked.connect(self.main_window.toggle_test_mode)
+        self.printing_window.finished.connect(self.on_print_finished)
+        self.worker.progress.connect(self.on_task_progress)
+        self.main_window.preview_resized.connect(self.on_preview_resized)
+
+    def shutdown(self):
+        """Cancel background work and stop the worker and tile thread pools.
+
+        Called when the application quits. Queued tasks and row bands are
+        cancelled and neither pool is waited for, so quitting is not blocked
+        here. A decode or gather already running cannot be interrupted: it
+        finishes on its pool thread (Python joins pool threads at exit) and
+        its outcome is discarded.
+        """
+        self._preview_resize_timer.stop()
+        self.worker.shutdown()
+        self.tile_executor.shutdown(wait=False)
+
+    def on_task_progress(self, name, percent):
+        """Log progress reported by a background task."""
+        self.main_window.add_log_entry(f"{self.TASK_LABELS.get(name, name)}... {percent}%")
 
     def select_image(self):
-        """Handles image selection from the file dialog and loads the image."""
+        """Handles image selection from the file dialog and loads the image in the background."""
         file_path = self.main_window.get_image_file()
         if file_path:
             self.current_image_path = file_path
             self.main_window.add_log_entry(
                 f"Image selected: {os.path.basename(file_path)}"
             )
+
+            # Reject files of the wrong format from the header, before decoding
             try:
-                # Load image and check if rotation was applied
-                original_image = self.image_processor.cv2_reader(file_path, cv2.IMREAD_UNCHANGED)
-                self.loaded_image = self.image_processor.load_image(file_path)
-                
-                # Clear any previously processed image
-                self.processed_image = None
-                
-                # Validate that the image is 16-bit grayscale TIFF
-                self._validate_input_image(file_path, self.loaded_image)
-                
-                # Check if rotation was applied and log it
-                if (original_image is not None and 
-                    self.image_processor.is_portrait_orientation(original_image)):
-                    self.main_window.add_log_entry(
-                        "Portrait image detected - rotated 90° clockwise to landscape"
-                    )
-                
-                # Update preview display using preview manager
-                self.update_preview_display()
-                
-            except (ValueError, TypeError, RuntimeError) as e:
+                probe = self.image_processor.probe_image(file_path)
+                self._validate_input_image(file_path, probe)
+            except (FileNotFoundError, ValueError) as e:
                 self.main_window.add_log_entry(f"Error loading image: {e}")
+                return
+
+            # A new image supersedes any processing or print preparation in flight,
+            # and every stage computed from the previous one
+            self.worker.cancel('process', 'print')
+            self.pipeline.set('probe', probe)
+            pipeline = self.pipeline
+
+            def load(token, report_progress):
+                # One decode yields the image and its original orientation
+                load_result = pipeline.get('image')
+                token.raise_if_cancelled()
+                report_progress(50)
+                # Every later preview is resampled from the pyramid
+                return load_result, pipeline.get('pyramid')
+
+            self.worker.submit(
+                'load', load,
+                lambda result: self._on_image_loaded(file_path, *result),
+                lambda e: self.main_window.add_log_entry(f"Error loading image: {e}")
+            )
+
+    def _on_image_loaded(self, file_path, load_result, pyramid):
+        """Show a freshly loaded image and log how it was read (UI thread)."""
+        try:
+            # Processed results were already dropped with the previous image; reset the view
+            self.preview_processed = False
+            self.show_original_preview = False
+
+            # Check if rotation was applied and log it
+            if load_result.rotation_applied:
+                self.main_window.add_log_entry(
+                    "Portrait image detected - turned 90° clockwise to landscape (view, no copy)"
+                )
+
+            notes = []
+            if load_result.bytes_read is not None:
+                notes.append(f"{load_result.bytes_read / (1024 * 1024):.0f} MB")
+            if load_result.probe is not None:
+                notes.append(load_result.probe.compression_name + (", tiled" if load_result.probe.tiled else ""))
+            note = f" ({'; '.join(notes)})" if notes else ""
+            self.main_window.add_log_entry(
+                f"Image read via {load_result.decoder} in {load_result.decode_time_ms:.0f} ms{note}"
+            )
+
+            # Update preview display using preview manager
+            self.update_preview_display()
+
+        except (ValueError, TypeError, RuntimeError) as e:
+            self.main_window.add_log_entry(f"Error loading image: {e}")
 
     def update_preview_display(self):
         """Update the preview display using the preview manager (fast, preview-optimized)."""
@@ -83,24 +265,69 @@ class Controller:
             
         try:
             # Use processed image if available, otherwise use original loaded image
-            display_image = self.processed_image if self.processed_image is not None else self.loaded_image
+            display_image, version = self._preview_source()
+            lut = self.compiled_lut.print_table if self._showing_proxy() else None
             
-            # Use preview manager for fast preview display
-            preview_pixmap = self.preview_manager.create_preview_pixmap(
-                display_image, 
-                container_size=(768, 432)  # Match actual preview_label size (16:9 aspect ratio)
+            # Use preview manager for fast preview display; unchanged states come from its cache
+            preview_pixmap = self.preview_manager.get_preview_pixmap(
+                display_image,
+                version,
+                container_size=self._preview_container_size(),
+                lut=lut
             )
             
             # Display in preview area
             self.main_window.display_preview_pixmap(preview_pixmap)
             
             # Log what type of image is being displayed
-            image_type = "processed (LUT + inverted)" if self.processed_image is not None else "original"
+            image_type = "processed (LUT + inverted)" if self._has_processed_preview() else "original"
             self.main_window.add_log_entry(f"Preview updated ({image_type})")
             
         except (ValueError, TypeError, RuntimeError) as e:
             self.main_window.add_log_entry(f"Error updating preview: {e}")
 
+    def set_preview_original(self, show_original):
+        """Toggle the preview between the original and the processed image.
+
+        Args:
+            show_original (bool): Whether to show the original loaded image
+        """
+        self.show_original_preview = show_original
+        self.update_preview_display()
+
+    def on_preview_resized(self, width, height):
+        """Schedule a re-render of the preview once resizing has settled."""
+        self._preview_resize_timer.start()
+
+    def _preview_container_size(self):
+        """Return the current preview area size, at least PREVIEW_SIZE."""
+        width, height = self.main_window.get_preview_size()
+        return max(width, self.PREVIEW_SIZE[0]), max(height, self.PREVIEW_SIZE[1])
+
+    def _has_processed_preview(self):
+        """Whether the preview shows a processed image (full or proxy resolution)."""
+        if self.show_original_preview:
+            return False
+        return self.processed_pyramid is not None or self._showing_proxy()
+
+    def _showing_proxy(self):
+        """Whether the preview applies the LUT at preview resolution (no full-resolution result yet)."""
+        return (self.preview_processed and not self.show_original_preview
+                and self.processed_pyramid is None and self.compiled_lut is not None)
+
+    def _preview_source(self):
+        """Return the pyramid (or array) the preview is resampled from, and its version.
+
+        Stage version stamps key the preview cache: a recomputed image always
+        gets a new one. Stamps are unique across stages, so the loaded image
+        shown before its pyramid is built is keyed by the image stage's stamp.
+        """
+        if self.processed_pyramid is not None and not self.show_original_preview:
+            return self.processed_pyramid, self.pipeline.version('processed_pyramid')
+        if self.loaded_pyramid is not None:
+            return self.loaded_pyramid, self.pipeline.version('pyramid')
+        return self.loaded_image, self.pipeline.version('image')
+
     def select_lut(self):
         """Handles LUT selection from the file dialog and loads the LUT."""
         file_path = self.main_window.get_lut_file()
@@ -109,13 +336,35 @@ class Controller:
                 f"LUT selected: {os.path.basename(file_path)}"
             )
             try:
-                self.loaded_lut = self.lut_manager.load_lut(file_path)
-                self.main_window.add_log_entry("LUT loaded successfully")
-            except (ValueError, TypeError, RuntimeError) as e:
+                # Validate before touching the pipeline, so a bad file keeps the current LUT
+                misses_before = self.lut_manager.cache_misses
+                entry = self.lut_manager.load_lut_entry(file_path)
+                cached = self.lut_manager.cache_misses == misses_before
+            except (FileNotFoundError, ValueError, TypeError, RuntimeError) as e:
                 self.main_window.add_log_entry(f"Error loading LUT: {e}")
+                return
+
+            if self.pipeline.peek('lut_entry') is not entry:
+                # Results computed with the previous LUT are no longer wanted;
+                # the loaded image is kept
+                self.worker.cancel('process', 'print')
+                self.pipeline.set('lut_entry', entry)
+            self.pipeline.get('lut')
+            self.pipeline.get('print_table')
+            self.main_window.add_log_entry(
+                "LUT loaded successfully" + (" (cached)" if cached else "")
+            )
+            if self.preview_processed:
+                self.update_preview_display()
 
     def process_image(self):
-        """Process the image by applying LUT and inversion, then display in preview."""
+        """Process the image by applying LUT and inversion, then display in preview.
+
+        In proxy mode only the preview-resolution pyramid levels are processed,
+        immediately; full-resolution processing is deferred until printing.
+        Otherwise the full-resolution image is processed in the background,
+        unless it is already current for this image and LUT.
+        """
         if self.loaded_image is None:
             self.main_window.add_log_entry("Please load an image first.")
             return
@@ -123,24 +372,97 @@ class Controller:
             self.main_window.add_log_entry("Please select a LUT first.")
             return
 
-        try:
-            self.main_window.add_log_entry("Processing image (applying LUT and inversion)...")
-            
-            # Apply LUT using image processor
-            lut_applied = self.image_processor.apply_lut(self.loaded_image, self.loaded_lut)
-            
-            # Apply inversion using image processor  
-            self.processed_image = self.image_processor.invert_image(lut_applied)
-            
-            # Update preview display to show processed image
-            self.update_preview_display()
-            self.main_window.add_log_entry("Image processed and displayed in preview (LUT applied + inverted).")
+        if self.proxy_processing and self.loaded_pyramid is not None:
+            self._process_proxy()
+            return
 
-        except (ValueError, TypeError, RuntimeError) as e:
-            self.main_window.add_log_entry(f"Error during processing: {e}")
+        self.main_window.add_log_entry("Processing image (applying LUT and inversion)...")
+        pipeline = self.pipeline
+
+        def process(token, report_progress):
+            processed_image = pipeline.get('processed')
+            token.raise_if_cancelled()
+            report_progress(50)
+            return processed_image, pipeline.get('processed_pyramid')
+
+        self.worker.submit(
+            'process', process, lambda result: self._on_image_processed(*result),
+            lambda e: self.main_window.add_log_entry(f"Error during processing: {e}")
+        )
+
+    def _process_full_resolution(self, load_result, lut):
+        """Apply the LUT and inversion to the full-resolution image (the 'processed' stage).
+
+        Args:
+            load_result (ImageLoadResult): Output of the 'image' stage
+            lut (numpy.ndarray): Output of the 'lut' stage
+
+        Returns:
+            numpy.ndarray: Print-ready image
+        """
+        # Apply LUT using image processor
+        lut_applied = self.image_processor.apply_lut(load_result.image, lut)
+
+        # Apply inversion using image processor
+        return self.image_processor.invert_image(lut_applied)
+
+    def _process_proxy(self):
+        """Show the LUT and inversion applied at preview resolution only (UI thread).
+
+        The preview pyramid of the loaded image is rendered through a fused
+        display table built from the compiled print table, which already
+        folds the LUT and inversion together.
+        """
+        # Superseded by the proxy; a full-resolution result is produced at print time
+        self.worker.cancel('process')
+
+        start = time.perf_counter()
+        self.preview_processed = True
+        self.show_original_preview = False
+
+        self.update_preview_display()
+        self.main_window.add_log_entry(
+            f"Preview processed at proxy resolution in {(time.perf_counter() - start) * 1000:.0f} ms "
+            f"(full resolution deferred to print)"
+        )
+
+    def _on_image_processed(self, processed_image, pyramid):
+        """Show the processed image in the preview (UI thread)."""
+        self.preview_processed = True
+        self.show_original_preview = False
+
+        # Update preview display to show processed image
+        self.update_preview_display()
+        self.main_window.add_log_entry("Image processed and displayed in preview (LUT applied + inverted).")
+
+    def _prepare_frames(self, load_result, image_hash, compiled_lut, screen_size, dither_mode):
+        """Build the dither frame source for the print screen (the 'frames' stage).
+
+        LUT, inversion and 12-bit split go straight from the loaded image to the
+        dither planes through the compiled print tables; frames are built on
+        demand by the printing loop. Dithering happens at the print screen's
+        native resolution, so a non-8K screen costs one resample of the 16-bit
+        image instead of one per frame. Planes prepared before for the same
+        image content, LUT and screen are loaded from the frame cache instead;
+        newly prepared planes are stored once the print has started.
+
+        Returns:
+            tuple: (DitheredFrameSource, resample info dict or None, whether it came from the
+            frame cache, frame cache entry to store or None)
+        """
+        frame_source = self.print_manager.create_frame_source(
+            load_result.image, compiled_lut, screen_size=screen_size, dither_mode=dither_mode, image_key=image_hash,
+            defer_cache_store=True
+        )
+        return (frame_source, self.print_manager.last_resample_info, self.print_manager.last_frame_cache_hit,
+                self.print_manager.last_frame_cache_entry)
 
     def start_print(self):
-        """Initiates the high-quality print processing and display loop."""
+        """Prepares the print in the background, then starts the display loop.
+
+        Only stages whose inputs changed since the last print are recomputed;
+        reprinting with another exposure time reuses the prepared frames.
+        """
         if self.loaded_image is None:
             self.main_window.add_log_entry("Please load an image first.")
             return
@@ -149,51 +471,134 @@ class Controller:
             return
 
         self.main_window.add_log_entry("Processing image for printing...")
+
+        # Get exposure duration from UI
+        exposure_duration_str = self.main_window.exposure_input.text()
         try:
-            # Use processed image if available, otherwise use original image with LUT processing
-            if self.processed_image is not None:
-                # Use already processed image (LUT + inversion applied)
-                print_ready_image = self.processed_image
+            exposure_duration_s = float(exposure_duration_str)
+            exposure_duration_ms = int(exposure_duration_s * 1000)
+        except ValueError:
+            self.main_window.add_log_entry("Invalid exposure duration. Using default 30s.")
+            exposure_duration_ms = 30000
+
+        pipeline = self.pipeline
+
+        # Configure and start display based on test mode
+        if self.main_window.is_test_mode_enabled():
+            # Use processed image if current, otherwise process it now
+            reused = pipeline.is_current('processed')
+
+            def prepare(token, report_progress):
+                print_ready = pipeline.get('processed')
+                token.raise_if_cancelled()
+                return print_ready, pipeline.get('processed_pyramid'), reused
+
+            self.worker.submit(
+                'print', prepare, lambda result: self._start_test_print(*result),
+                lambda e: self.main_window.add_log_entry(f"Error during print processing: {e}")
+            )
+        else:
+            pipeline.set('screen', self.printing_window.get_target_screen_size())
+            pipeline.set('dither_mode', self.print_manager.dither_mode)
+            reused = pipeline.is_current('frames')
+
+            self.worker.submit(
+                'print', lambda token, report_progress: pipeline.get('frames'),
+                lambda result: self._start_secondary_print(*result, exposure_duration_ms, reused),
+                lambda e: self.main_window.add_log_entry(f"Error during print processing: {e}")
+            )
+
+    def _start_test_print(self, print_ready_image, pyramid, reused):
+        """Show a prepared print in the windowed test display (UI thread).
+
+        Args:
+            print_ready_image (numpy.ndarray): Full-resolution print-ready image
+            pyramid (ImagePyramid): Its preview pyramid
+            reused (bool): Whether the image was already processed; otherwise the
+                new full-resolution result supersedes any proxy preview
+        """
+        try:
+            if reused:
                 self.main_window.add_log_entry("Using processed image for printing (LUT + inversion already applied)")
             else:
-                # Use print manager for high-quality print processing
-                print_ready_image = self.print_manager.prepare_print_image(
-                    self.loaded_image, 
-                    self.loaded_lut
-                )
                 self.main_window.add_log_entry("Print processing completed")
+                # The full-resolution result supersedes any proxy preview
+                self.update_preview_display()
 
-            # Get exposure duration from UI
-            exposure_duration_str = self.main_window.exposure_input.text()
-            try:
-                exposure_duration_s = float(exposure_duration_str)
-                exposure_duration_ms = int(exposure_duration_s * 1000)
-            except ValueError:
-                self.main_window.add_log_entry("Invalid exposure duration. Using default 30s.")
-                exposure_duration_ms = 30000
-
-
-            # Configure and start display based on test mode
-            if self.main_window.is_test_mode_enabled():
-                # Test mode: use windowed display
-                self.test_display_window.show_test_window()
-                self.test_display_window.display_simple_print_image(print_ready_image)
-                self.main_window.add_log_entry("Print started in test mode (windowed display)")
-            else:
-                # Normal mode: use fullscreen secondary monitor
-                print("about to generate array of 8bit frames")
-                assert isinstance(print_ready_image, np.ndarray), "Input is not a NumPy array"
-                frames_8bit = self.print_manager.generate_dithered_frames_from_array(print_ready_image)
-                self.printing_window.finished.connect(lambda: print("Printing complete."))
-                self.printing_window.show()
-                self.printing_window.start_printing(frames_8bit, exposure_duration_ms)
-                self.main_window.add_log_entry("Print started on secondary monitor")
+            # Test mode: use windowed display
+            self.test_display_window.show_test_window()
+            self.test_display_window.display_simple_print_image(print_ready_image)
+            self.main_window.add_log_entry("Print started in test mode (windowed display)")
 
         except (ValueError, TypeError, RuntimeError) as e:
             self.main_window.add_log_entry(f"Error during print processing: {e}")
 
+    def _start_secondary_print(self, frame_source, resample_info, cache_hit, cache_entry, exposure_duration_ms,
+                               reused=False):
+        """Start exposing a prepared frame source on the secondary monitor (UI thread).
+
+        Newly prepared planes are written to the frame cache in the background
+        once the exposure is running, so the disk write never delays it.
+        """
+        try:
+            if reused:
+                self.main_window.add_log_entry("Reusing prepared frames (image, LUT and screen unchanged)")
+            elif cache_hit:
+                self.main_window.add_log_entry("Loaded prepared frames from the frame cache")
+            elif resample_info is not None:
+                self.main_window.add_log_entry(
+                    f"Resampled {resample_info['source_size'][0]}×{resample_info['source_size'][1]} → "
+                    f"{resample_info['resampled_size'][0]}×{resample_info['resampled_size'][1]} "
+                    f"for {resample_info['screen_size'][0]}×{resample_info['screen_size'][1]} screen "
+                    f"in {resample_info['resample_ms']:.0f} ms"
+                )
+            if not reused:
+                self.main_window.add_log_entry(
+                    f"Print processing completed ({frame_source.nbytes / (1024 * 1024):.0f} MB frame planes, "
+                    f"{len(frame_source)} unique frames of {len(frame_source.schedule)})"
+                )
+            self.printing_window.show()
+            self.printing_window.start_printing(frame_source, exposure_duration_ms)
+            self.main_window.add_log_entry("Print started on secondary monitor")
+            if cache_entry is not None and not reused:
+                self.worker.submit(
+                    'cache', lambda token, report_progress: self.print_manager.store_frame_set(cache_entry),
+                    lambda stored: None,
+                    lambda e: self.main_window.add_log_entry(f"Could not cache prepared frames: {e}")
+                )
+
+        except (ValueError, TypeError, RuntimeError) as e:
+            self.main_window.add_log_entry(f"Error during print processing: {e}")
+
+    def on_print_finished(self):
+        """Log exposure timing accuracy when the printing window finishes."""
+        stats = self.printing_window.get_timing_stats()
+        if not stats:
+            return
+        self.main_window.add_log_entry(
+            f"Printing complete: {stats['elapsed_ms'] / 1000:.3f}s of {stats['exposure_ms'] / 1000:.3f}s, "
+            f"frame lateness mean {stats['mean_lateness_ms']:.1f} ms / "
+            f"p95 {stats['p95_lateness_ms']:.1f} ms / max {stats['max_lateness_ms']:.1f} ms, "
+            f"{stats['frames_skipped']} frames skipped"
+        )
+        report = self.printing_window.get_frame_timing_report()
+        self.main_window.add_log_entry(
+            f"Frame display cost: first cycle {report['first_cycle']['mean_ms']:.1f} ms/frame, "
+            f"steady state {report['steady_state']['mean_ms']:.1f} ms/frame, "
+            f"paint {report['paint']['mean_ms']:.1f} ms (max {report['paint']['max_ms']:.1f} ms), "
+            f"{report['paint']['mean_pixels_per_frame']} px repainted per frame, "
+            f"pixmap cache {'on' if report['pixmap_cache'] else 'off'}"
+        )
+        pool = self.buffer_pool.get_stats()
+        self.main_window.add_log_entry(
+            f"Frame buffers: {pool['hits']} reused, {pool['misses']} allocated, "
+            f"{pool['free_bytes'] / (1024 * 1024):.0f} MB kept for the next print"
+        )
+
     def stop_print(self):
         """Stops the image display loop for both normal and test mode."""
+        # Abandon a print that is still being prepared
+        self.worker.cancel('print')
         # Stop both display windows to ensure clean state
         self.printing_window.stop_printing()
         self.test_display_window.stop_display()
@@ -209,7 +614,8 @@ class Controller:
             return {'error': 'No image loaded'}
             
         # Get preview info from preview manager
-        preview_image = self.preview_manager.prepare_preview_image(self.loaded_image)
+        source = self.loaded_pyramid if self.loaded_pyramid is not None else self.loaded_image
+        preview_image = self.preview_manager.prepare_preview_image(source)
         return self.preview_manager.get_preview_info(self.loaded_image, preview_image)
         
     def get_print_info(self):
@@ -218,11 +624,12 @@ class Controller:
         Returns:
             dict: Print processing information
         """
-        if self.loaded_image is None:
+        image_format = self._image_format()
+        if image_format is None:
             return {'error': 'No image loaded'}
             
-        # Get print info from print manager
-        return self.print_manager.calculate_8k_display_info(self.loaded_image)
+        # Get print info from print manager; the header probe serves without touching pixels
+        return self.print_manager.calculate_8k_display_info(image_format)
         
     def validate_print_readiness(self):
         """Validate if current image and LUT are ready for printing.
@@ -230,7 +637,18 @@ class Controller:
         Returns:
             dict: Validation results
         """
-        return self.print_manager.validate_print_readiness(self.loaded_image, self.loaded_lut)
+        return self.print_manager.validate_print_readiness(self._image_format(), self.loaded_lut)
+
+    def _image_format(self):
+        """Return the selected image's header probe, or the loaded image if it was not probed.
+
+        The probe is set as soon as the header is validated, so pre-flight
+        checks answer while the pixels are still being decoded.
+        """
+        probe = self.pipeline.peek('probe')
+        if probe is None:
+            probe = self.image_probe
+        return probe if probe is not None else self.loaded_image
 
 
     def _validate_input_image(self, file_path, image_data):
@@ -238,7 +656,7 @@ class Controller:
         
         Args:
             file_path (str): Path to the image file
-            image_data (numpy.ndarray): Loaded image data
+            image_data (numpy.ndarray or ImageProbe): Loaded image data or its header probe
             
         Raises:
             ValueError: If the image doesn't meet requirements
@@ -0,0 +1,327 @@
+"""On-demand dithered frame source for the printing loop.
+
+Instead of materializing every 8-bit frame of the 12-bit emulation up front,
+a frame source keeps only the dither base and remainder planes and fills a
+small ring of reusable output buffers when a frame is requested.
+
+The planes may cover just the image window of a larger display canvas: the
+output buffers are blackened once when allocated and every per-pixel
+operation is then restricted to the window, so the letterbox around the
+image costs nothing and stays black in every frame.
+"""
+import numpy as np
+
+
+class DitheredFrameSource:
+    """Sequence of 8-bit dithered frames built on demand.
+
+    Two dithering modes deliver the same light dose per cycle of 16 time units:
+
+    - ``MODE_TEMPORAL``: ``num_frames`` equal frames, frame ``f`` is
+      ``base + (remainder >= f)``.
+    - ``MODE_BITPLANE``: five binary-weighted frames shown for 1, 1, 2, 4 and
+      8 units. Frame 0 is ``base + 1``; frame ``k`` adds bit ``k - 1`` of the
+      remainder.
+
+    ``frame_durations`` gives each frame's display time in units, and
+    ``dirty_tiles`` lists the tiles that change on each frame transition. Frames are
+    written into a ring of ``ring_size`` reusable buffers, so a returned frame
+    is only valid until ``ring_size`` further frames have been requested; use
+    ``materialize`` for independent copies. With a buffer pool the ring is
+    acquired from the pool and handed back by ``release`` when a print ends;
+    otherwise it lives as long as the source.
+
+    With ``deduplicate``, consecutive cycle positions that produce identical
+    frames (no pixel has a remainder value that tells them apart) are merged
+    into one frame shown for their combined duration. Frame indices, ``len``,
+    ``frame_durations`` and ``dirty_tiles`` then refer to the unique frames;
+    ``schedule`` maps each cycle position to its unique frame.
+    """
+
+    MODE_TEMPORAL = "temporal"
+    MODE_BITPLANE = "bitplane"
+    MODES = (MODE_TEMPORAL, MODE_BITPLANE)
+
+    # Display time of each bit-plane frame, in units
+    BITPLANE_DURATIONS = (1, 1, 2, 4, 8)
+
+    # Edge length of the square tiles used for dirty-region tracking
+    TILE_SIZE = 128
+
+    def __init__(self, base, remainder, num_frames=None, ring_size=2, mode=MODE_TEMPORAL, executor=None,
+                 canvas_shape=None, offset=(0, 0), pool=None, deduplicate=False):
+        """Initialize the frame source.
+
+        Args:
+            base (numpy.ndarray): uint8 base plane (already clip-safe, see CompiledLUT)
+            remainder (numpy.ndarray): uint8 4-bit remainder plane with base's shape
+            num_frames (int, optional): Frames per cycle in temporal mode (1 to 16,
+                default 16). Bit-plane mode always uses five frames.
+            ring_size (int): Number of reusable output buffers
+            mode (str): One of ``MODES``
+            executor (TileExecutor, optional): Fills frames over row bands in parallel
+            canvas_shape (tuple, optional): (height, width) of the frames when the planes
+                cover only an image window of the display; pixels outside the window
+                are black. Defaults to the planes' shape.
+            offset (tuple): (y, x) position of the planes' window within the canvas
+            pool (BufferPool, optional): Pool the output ring is acquired from and
+                released to
+            deduplicate (bool): Merge consecutive identical frames (see class docstring)
+
+        Raises:
+            ValueError: If the planes or parameters are invalid.
+        """
+        if base.dtype != np.uint8 or remainder.dtype != np.uint8:
+            raise ValueError(f"Dither planes must be uint8, got {base.dtype} and {remainder.dtype}")
+
+        if base.ndim != 2 or base.shape != remainder.shape:
+            raise ValueError(f"Dither planes must be 2D with equal shapes, got {base.shape} and {remainder.shape}")
+
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown dither mode {mode!r}; expected one of {self.MODES}")
+
+        if mode == self.MODE_BITPLANE:
+            if num_frames not in (None, len(self.BITPLANE_DURATIONS)):
+                raise ValueError(f"Bit-plane mode uses {len(self.BITPLANE_DURATIONS)} frames, got {num_frames}")
+            num_frames = len(self.BITPLANE_DURATIONS)
+            frame_durations = self.BITPLANE_DURATIONS
+        else:
+            num_frames = 16 if num_frames is None else num_frames
+            if not 1 <= num_frames <= 16:
+                raise ValueError(f"num_frames must be between 1 and 16, got {num_frames}")
+            frame_durations = (1,) * num_frames
+
+        if ring_size < 1:
+            raise ValueError(f"ring_size must be at least 1, got {ring_size}")
+
+        canvas_shape = base.shape if canvas_shape is None else tuple(canvas_shape)
+        y, x = offset
+        height, width = base.shape
+        if y < 0 or x < 0 or y + height > canvas_shape[0] or x + width > canvas_shape[1]:
+            raise ValueError(f"Window of {width}x{height} at {(x, y)} does not fit a "
+                             f"{canvas_shape[1]}x{canvas_shape[0]} canvas")
+
+        self.base = base
+        self.remainder = remainder
+        self.mode = mode
+        self.num_frames = num_frames
+        self.frame_durations = frame_durations
+        self.shape = canvas_shape
+        self.offset = (y, x)
+        self.window = (slice(y, y + height), slice(x, x + width))
+        self.dtype = np.dtype(np.uint8)
+        self.executor = executor
+        self.pool = pool
+
+        self.ring_size = ring_size
+        self._ring = []  # Output buffers, allocated on first use
+        self._next_slot = 0
+
+        values = np.arange(16)
+        if mode == self.MODE_BITPLANE:
+            lit = [np.ones(16, dtype=bool)] + [((values >> bit) & 1).astype(bool) for bit in range(4)]
+        else:
+            lit = [values >= f for f in range(num_frames)]
+        # lit_table[f, v]: whether a pixel with remainder v is lit (base + 1) in frame f
+        self.lit_table = np.array(lit)
+        self.schedule = list(range(num_frames))  # Cycle position -> frame index
+        self._positions = list(range(num_frames))  # Frame index -> first cycle position it shows
+        self._value_masks = None  # Remainder values present per tile, computed on first use
+        self._dirty_tiles = None  # Per-frame dirty rectangles, computed on first use
+
+        if deduplicate:
+            self._merge_identical_frames()
+
+    def __len__(self):
+        """Return the number of (unique) frames in one dither cycle."""
+        return self.num_frames
+
+    def __getitem__(self, index):
+        """Fill the next ring buffer with frame ``index`` and return it.
+
+        Args:
+            index (int): Frame index within the cycle (negative indices allowed)
+
+        Returns:
+            numpy.ndarray: 2D uint8 frame backed by a ring buffer
+
+        Raises:
+            IndexError: If the index is outside the cycle.
+        """
+        if index < 0:
+            index += self.num_frames
+        if not 0 <= index < self.num_frames:
+            raise IndexError(f"Frame index {index} out of range for {self.num_frames} frames")
+
+        if not self._ring:
+            # Blackened once; only the image window is ever written afterwards
+            if self.pool is None:
+                self._ring = [np.zeros(self.shape, dtype=np.uint8) for _ in range(self.ring_size)]
+            else:
+                self._ring = [self.pool.acquire(self.shape, np.uint8, zeroed=True) for _ in range(self.ring_size)]
+
+        frame = self._ring[self._next_slot]
+        self._next_slot = (self._next_slot + 1) % self.ring_size
+        return self.fill_frame(index, frame)
+
+    def fill_frame(self, index, out):
+        """Write frame ``index`` into a caller-provided buffer.
+
+        Only the image window is written; the rest of ``out`` must already be
+        black (e.g. allocated with ``numpy.zeros`` or previously filled by this source).
+
+        Args:
+            index (int): Frame index within the cycle
+            out (numpy.ndarray): uint8 buffer with the source's shape
+
+        Returns:
+            numpy.ndarray: ``out``, holding the frame
+        """
+        window = out[self.window]
+        if self.executor is None:
+            self._fill_rows(index, window, slice(None))
+        else:
+            self.executor.run(lambda rows: self._fill_rows(index, window, rows), self.base.shape)
+        return out
+
+    def _fill_rows(self, index, out, rows):
+        """Write rows ``rows`` of frame ``index``'s window into the same rows of ``out``."""
+        base, remainder, out = self.base[rows], self.remainder[rows], out[rows]
+        position = self._positions[index]
+        if self.mode == self.MODE_BITPLANE:
+            if position == 0:
+                np.add(base, 1, out=out)
+                return
+            # Extract remainder bit (position - 1) in place, then add the base
+            np.right_shift(remainder, position - 1, out=out)
+            np.bitwise_and(out, 1, out=out)
+        else:
+            # Write the 0/1 increment straight into the buffer, then add the base
+            np.greater_equal(remainder, position, out=out.view(np.bool_))
+        np.add(out, base, out=out)
+
+    def _merge_identical_frames(self):
+        """Merge runs of consecutive cycle positions whose frames are identical.
+
+        Two positions give identical frames when their lit sets agree on every
+        remainder value present in the image. The values present are read from
+        the per-tile value masks (which ``dirty_tiles`` needs anyway), a
+        16-bin presence histogram at a fraction of the cost of counting pixels.
+        """
+        present_mask = int(np.bitwise_or.reduce(self._tile_value_masks(), axis=None))
+        present = [value for value in range(16) if present_mask >> value & 1]
+        signatures = [tuple(row[present]) for row in self.lit_table]
+
+        positions, durations, schedule = [], [], []
+        for position, (signature, duration) in enumerate(zip(signatures, self.frame_durations)):
+            if positions and signatures[positions[-1]] == signature:
+                durations[-1] += duration
+            else:
+                positions.append(position)
+                durations.append(duration)
+            schedule.append(len(positions) - 1)
+
+        self._positions = positions
+        self.schedule = schedule
+        self.frame_durations = tuple(durations)
+        self.lit_table = self.lit_table[positions]
+        self.num_frames = len(positions)
+
+    def release(self):
+        """Hand the output ring back to the pool (or drop it).
+
+        Frames previously returned must no longer be used. The source stays
+        valid: a new ring is acquired when the next frame is requested.
+        """
+        ring, self._ring = self._ring, []
+        self._next_slot = 0
+        if self.pool is not None and ring:
+            self.pool.release(*ring)
+
+    def materialize(self):
+        """Build every frame of the cycle as an independent array.
+
+        Returns:
+            list[numpy.ndarray]: One uint8 frame per frame index (per unique frame when deduplicated)
+        """
+        return [self.fill_frame(f, np.zeros(self.shape, dtype=np.uint8)) for f in range(self.num_frames)]
+
+    def dirty_tiles(self, index):
+        """Get the tiles that change when frame ``index`` replaces its predecessor.
+
+        A pixel changes between two frames only if its remainder value is lit in
+        one and not the other, so each transition is resolved from a per-tile
+        bitmask of the remainder values present. Tiles cover the image window
+        only, since the letterbox never changes. Horizontally adjacent dirty
+        tiles are merged into runs.
+
+        Args:
+            index (int): Frame index; its predecessor is ``index - 1`` (cyclically)
+
+        Returns:
+            list[tuple]: (x, y, width, height) rectangles in frame coordinates
+        """
+        if self._dirty_tiles is None:
+            self._dirty_tiles = self._compute_dirty_tiles()
+        return self._dirty_tiles[index % self.num_frames]
+
+    def _tile_value_masks(self):
+        """Return a (tiles_y, tiles_x) uint16 array of remainder values present per window tile."""
+        if self._value_masks is None:
+            self._value_masks = self._compute_tile_value_masks()
+        return self._value_masks
+
+    def _compute_tile_value_masks(self):
+        """Compute the remainder values present in every window tile."""
+        height, width = self.remainder.shape
+        tile = self.TILE_SIZE
+        column_starts = np.arange(0, width, tile)
+        masks = np.empty(((height + tile - 1) // tile, len(column_starts)), dtype=np.uint16)
+
+        # One band of tile rows at a time keeps the uint16 bit plane small
+        for tile_row, y in enumerate(range(0, height, tile)):
+            bits = np.left_shift(np.uint16(1), self.remainder[y:y + tile], dtype=np.uint16)
+            columns = np.bitwise_or.reduceat(bits, column_starts, axis=1)
+            masks[tile_row] = np.bitwise_or.reduce(columns, axis=0)
+
+        return masks
+
+    def _compute_dirty_tiles(self):
+        """Compute the dirty rectangles of every frame transition in the cycle."""
+        height, width = self.remainder.shape
+        top, left = self.offset
+        tile = self.TILE_SIZE
+        masks = self._tile_value_masks()
+        weights = (1 << np.arange(16)).astype(np.uint16)
+
+        dirty = []
+        for f in range(self.num_frames):
+            changed = self.lit_table[f] != self.lit_table[f - 1]
+            changed_values = np.uint16(weights[changed].sum())
+
+            rects = []
+            for tile_row, columns in enumerate((masks & changed_values) != 0):
+                y = tile_row * tile
+                tile_height = min(tile, height - y)
+                run_start = None
+                for tile_col, is_dirty in enumerate(np.append(columns, False)):
+                    if is_dirty and run_start is None:
+                        run_start = tile_col
+                    elif not is_dirty and run_start is not None:
+                        x = run_start * tile
+                        run_width = min(tile_col * tile, width) - x
+                        rects.append((left + x, top + y, run_width, tile_height))
+                        run_start = None
+            dirty.append(rects)
+
+        return dirty
+
+    @property
+    def cycle_units(self):
+        """int: Total display time of one cycle, in units."""
+        return sum(self.frame_durations)
+
+    @property
+    def nbytes(self):
+        """int: Bytes held by the planes and the allocated output ring."""
+        return self.base.nbytes + self.remainder.nbytes + sum(buffer.nbytes for buffer in self._ring)
@@ -0,0 +1,150 @@
+"""Drift-free exposure scheduling for the printing loop.
+
+The scheduler maps monotonic wall-clock time onto the cyclic frame schedule
+of an exposure, so timer jitter or UI stalls never stretch the exposure:
+the frame shown is always the one that should be showing *now*, and the
+exposure ends when its wall-clock duration has elapsed.
+"""
+import bisect
+import time
+
+
+class ExposureScheduler:
+    """Maps monotonic time onto a cyclic frame schedule for one exposure.
+
+    Frame boundaries are fixed relative to the exposure start. Each ``tick``
+    reports which frame should be on screen and how long until the next
+    boundary; a late tick lands in whatever frame is current, skipping any
+    frames whose slots have already passed. Lateness of every tick relative
+    to its scheduled boundary is recorded for ``get_timing_stats``.
+    """
+
+    def __init__(self, frame_durations_ns, exposure_ns, clock=None):
+        """Initialize the scheduler.
+
+        Args:
+            frame_durations_ns (list[int]): Display time of each frame in one cycle, in ns
+            exposure_ns (int): Total exposure time in ns
+            clock (callable, optional): Monotonic clock returning ns.
+                                      Defaults to time.monotonic_ns.
+
+        Raises:
+            ValueError: If the schedule or exposure time is invalid.
+        """
+        if not frame_durations_ns or any(d <= 0 for d in frame_durations_ns):
+            raise ValueError("frame_durations_ns must be a non-empty list of positive durations")
+
+        if exposure_ns < 0:
+            raise ValueError(f"exposure_ns must not be negative, got {exposure_ns}")
+
+        self.frame_durations_ns = list(frame_durations_ns)
+        self.exposure_ns = int(exposure_ns)
+        self.clock = clock or time.monotonic_ns
+
+        # Cycle-relative start time of each frame
+        self._frame_starts_ns = [0]
+        for duration in self.frame_durations_ns[:-1]:
+            self._frame_starts_ns.append(self._frame_starts_ns[-1] + duration)
+        self.cycle_ns = sum(self.frame_durations_ns)
+
+        self.start_ns = None
+        self.end_ns = None
+        self.current_frame = None
+        self.finished = False
+        self.stopped_ns = None
+        self._deadline_ns = None
+        self._current_slot = 0  # Frame slots since start (cycle * frames per cycle + frame)
+        self._lateness_ns = []
+        self.frames_shown = 0
+        self.frames_skipped = 0
+
+    def start(self):
+        """Start the exposure now.
+
+        Returns:
+            tuple: (frame index to show, ns until the next tick is due)
+        """
+        self.start_ns = self.clock()
+        self.end_ns = self.start_ns + self.exposure_ns
+        self.current_frame = 0
+        self.frames_shown = 1
+        self._deadline_ns = self.start_ns + min(self.frame_durations_ns[0], self.exposure_ns)
+        return 0, self._deadline_ns - self.start_ns
+
+    def tick(self):
+        """Advance the schedule to the current time.
+
+        Returns:
+            tuple or None: (frame index to show, ns until the next tick is due),
+            or None once the exposure time has elapsed.
+        """
+        if self.start_ns is None:
+            raise RuntimeError("Scheduler has not been started")
+
+        if self.finished:
+            return None
+
+        now = self.clock()
+        if now < self._deadline_ns:
+            # Early wake-up: keep the current frame until its boundary
+            return self.current_frame, self._deadline_ns - now
+
+        self._lateness_ns.append(now - self._deadline_ns)
+
+        if now >= self.end_ns:
+            self.finished = True
+            self.stopped_ns = now
+            return None
+
+        elapsed = now - self.start_ns
+        cycle, position = divmod(elapsed, self.cycle_ns)
+        frame = bisect.bisect_right(self._frame_starts_ns, position) - 1
+
+        # Frames whose slots passed entirely while we were late
+        slot = cycle * len(self.frame_durations_ns) + frame
+        self.frames_skipped += max(0, slot - self._current_slot - 1)
+        self._current_slot = slot
+
+        frame_end_ns = self.start_ns + cycle * self.cycle_ns + self._frame_starts_ns[frame] + self.frame_durations_ns[frame]
+        self._deadline_ns = min(frame_end_ns, self.end_ns)
+        self.current_frame = frame
+        self.frames_shown += 1
+        return frame, self._deadline_ns - now
+
+    def stop(self):
+        """Stop the exposure early (e.g. when printing is cancelled)."""
+        if self.start_ns is not None and not self.finished:
+            self.finished = True
+            self.stopped_ns = self.clock()
+
+    def get_timing_stats(self):
+        """Get per-tick lateness statistics for the exposure.
+
+        Returns:
+            dict: Tick count, mean/max/95th-percentile lateness in ms, frames shown
+            and skipped, and the requested and actual (start to stop) exposure time in ms.
+        """
+        samples = sorted(self._lateness_ns)
+        if samples:
+            p95 = samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+            mean = sum(samples) / len(samples)
+        else:
+            p95 = mean = 0
+
+        if self.start_ns is None:
+            elapsed_ms = 0.0
+        elif self.finished:
+            elapsed_ms = (self.stopped_ns - self.start_ns) / 1e6
+        else:
+            elapsed_ms = (self.clock() - self.start_ns) / 1e6
+
+        return {
+            'ticks': len(samples),
+            'mean_lateness_ms': round(mean / 1e6, 3),
+            'max_lateness_ms': round((samples[-1] if samples else 0) / 1e6, 3),
+            'p95_lateness_ms': round(p95 / 1e6, 3),
+            'frames_shown': self.frames_shown,
+            'frames_skipped': self.frames_skipped,
+            'exposure_ms': self.exposure_ns / 1e6,
+            'elapsed_ms': round(elapsed_ms, 3)
+        }
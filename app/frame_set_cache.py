@@ -0,0 +1,215 @@
+"""Persistent on-disk cache of prepared print frame sets.
+
+A frame set is stored in its compact form: the dither base and remainder
+planes of the image window plus the canvas geometry, from which a
+DitheredFrameSource rebuilds every frame. Planes are saved as ``.npy`` files
+and loaded memory-mapped, so a hit costs a header read and the planes are
+paged in as the printing loop touches them. Entries are evicted least
+recently used first once the cache exceeds its size bound.
+"""
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+
+
+class FrameSetCache:
+    """Size-bounded LRU cache of dither planes, keyed by content hashes and geometry."""
+
+    # Total bytes of cached planes (a full 8K frame set is about 66 MB)
+    max_bytes = 2 << 30
+
+    # Layout of the stored planes: which CompiledLUT split (saturation fold
+    # included) they hold and that they cover the image window only. Bump it
+    # whenever either changes, so entries written by older builds are not replayed.
+    FORMAT_VERSION = 1
+
+    # Default location, under the user's cache directory
+    default_directory = os.path.join(os.path.expanduser("~"), ".cache", "darkroom_enlarger", "frames")
+
+    def __init__(self, directory=None, max_bytes=None):
+        """Initialize the cache; the directory is created on first store.
+
+        Args:
+            directory (str, optional): Where entries are stored.
+                Defaults to FrameSetCache.default_directory.
+            max_bytes (int, optional): Size bound of all entries.
+                Defaults to FrameSetCache.max_bytes.
+        """
+        self.directory = directory or self.default_directory
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def hash_image(image, quarter_turns=0):
+        """Compute a content hash of an image's pixels, shape and orientation.
+
+        A rotated view (see ``ImageLoadResult.quarter_turns``) is hashed through
+        its stored layout, so no copy is made.
+
+        Args:
+            image (numpy.ndarray): Image data
+            quarter_turns (int): Clockwise quarter turns from the stored pixels to ``image``
+
+        Returns:
+            str: Hex digest identifying the image
+        """
+        stored = np.ascontiguousarray(np.rot90(image, quarter_turns % 4))
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{stored.shape}{stored.dtype.str}{quarter_turns % 4}".encode())
+        digest.update(stored.reshape(-1).view(np.uint8))
+        return digest.hexdigest()
+
+    @classmethod
+    def make_key(cls, *parts):
+        """Combine the values a frame set depends on, and the format version, into a cache key.
+
+        Args:
+            *parts: Content hashes, modes and geometry (anything with a stable repr)
+
+        Returns:
+            str: Hex key, usable as a file name
+        """
+        return hashlib.blake2b(repr((cls.FORMAT_VERSION,) + parts).encode(), digest_size=16).hexdigest()
+
+    def get(self, key):
+        """Look up a frame set.
+
+        Args:
+            key (str): Key from ``make_key``
+
+        Returns:
+            tuple or None: (base, remainder, metadata) with read-only memory-mapped
+            planes, or None on a miss.
+        """
+        with self._lock:
+            meta_path = self._path(key, "json")
+            try:
+                with open(meta_path, encoding="utf-8") as meta_file:
+                    metadata = json.load(meta_file)
+                if metadata.pop('format_version', None) != self.FORMAT_VERSION:
+                    raise ValueError("frame set written in another format")
+                base = np.load(self._path(key, "base.npy"), mmap_mode='r')
+                remainder = np.load(self._path(key, "remainder.npy"), mmap_mode='r')
+                os.utime(meta_path)  # Most recently used
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            except (OSError, ValueError, AttributeError):
+                # Truncated, corrupt or outdated entry: drop it and rebuild
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return base, remainder, metadata
+
+    def put(self, key, base, remainder, metadata):
+        """Store a frame set, then evict least recently used entries over the size bound.
+
+        Write failures (e.g. a full disk) are not fatal: the entry is skipped.
+
+        Args:
+            key (str): Key from ``make_key``
+            base (numpy.ndarray): uint8 base plane
+            remainder (numpy.ndarray): uint8 remainder plane
+            metadata (dict): JSON-serializable geometry needed to rebuild the frame source
+
+        Returns:
+            bool: Whether the entry was stored.
+        """
+        if base.nbytes + remainder.nbytes > self.max_bytes:
+            return False
+
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                for suffix, plane in (("base.npy", base), ("remainder.npy", remainder)):
+                    self._write(key, suffix, lambda file, plane=plane: np.save(file, plane))
+                # The metadata is written last: its presence marks a complete entry
+                stored = dict(metadata, format_version=self.FORMAT_VERSION)
+                self._write(key, "json", lambda file: file.write(json.dumps(stored).encode("utf-8")))
+            except OSError:
+                self._remove(key)
+                return False
+
+            self._evict()
+            return True
+
+    def get_stats(self):
+        """Returns frame set cache statistics.
+
+        Returns:
+            dict: Hits, misses, number of entries and their total size.
+        """
+        with self._lock:
+            entries = self._entries()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(entries),
+                'bytes': sum(size for _, size, _ in entries),
+                'max_bytes': self.max_bytes
+            }
+
+    def clear(self):
+        """Deletes every entry and resets the hit/miss counters."""
+        with self._lock:
+            for key, _, _ in self._entries():
+                self._remove(key)
+            self.hits = 0
+            self.misses = 0
+
+    def _path(self, key, suffix):
+        """Return the path of one file of an entry."""
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def _write(self, key, suffix, writer):
+        """Write one file of an entry atomically (lock held)."""
+        path = self._path(key, suffix)
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            writer(file)
+        os.replace(temporary, path)
+
+    def _entries(self):
+        """Return (key, bytes, last use) for every complete entry (lock held)."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+
+        entries = []
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            key = name[:-len(".json")]
+            try:
+                last_used = os.path.getmtime(self._path(key, "json"))
+                size = sum(os.path.getsize(self._path(key, suffix)) for suffix in ("base.npy", "remainder.npy"))
+            except OSError:
+                continue
+            entries.append((key, size, last_used))
+        return entries
+
+    def _evict(self):
+        """Delete least recently used entries beyond the size bound (lock held)."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def _remove(self, key):
+        """Delete an entry's files, metadata first (lock held)."""
+        for suffix in ("json", "base.npy", "remainder.npy"):
+            try:
+                os.remove(self._path(key, suffix))
+            except OSError:
+                pass
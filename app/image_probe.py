@@ -0,0 +1,125 @@
+"""Header-only image probing for the Darkroom Enlarger Application.
+
+A probe reads just the TIFF header and first IFD, so the format of a file
+can be checked, and print pre-flight information computed, in milliseconds
+without decoding any pixels.
+"""
+import sys
+import numpy as np
+import tifffile
+
+
+class ImageProbe:
+    """Format of a TIFF image as described by its header.
+
+    ``shape``, ``ndim``, ``dtype`` and ``itemsize`` describe the image as the
+    application will hold it after loading (portrait images rotated to
+    landscape), so a probe can stand in for the pixel array in pre-flight
+    checks such as ``PrintImageManager.validate_print_readiness``.
+    """
+
+    # TIFF compression code for uncompressed data
+    COMPRESSION_NONE = 1
+
+    def __init__(self, path, stored_shape, dtype, compression=COMPRESSION_NONE, tiled=False,
+                 bigtiff=False, memmappable=False, orientation=1, page_count=1):
+        """Initializes the probe.
+
+        Args:
+            path (str): Path of the probed file.
+            stored_shape (tuple): Image shape as stored in the file.
+            dtype (numpy.dtype): Native-byte-order pixel data type.
+            compression (int): TIFF compression code.
+            tiled (bool): Whether pixels are stored in tiles rather than strips.
+            bigtiff (bool): Whether the file is a BigTIFF.
+            memmappable (bool): Whether the pixels can be memory-mapped as stored.
+            orientation (int): Value of the TIFF Orientation tag.
+            page_count (int): Number of pages (IFDs) in the file.
+        """
+        self.path = path
+        self.stored_shape = tuple(stored_shape)
+        self.dtype = np.dtype(dtype)
+        self.compression = int(compression)
+        self.tiled = tiled
+        self.bigtiff = bigtiff
+        self.memmappable = memmappable
+        self.orientation = orientation
+        self.page_count = page_count
+
+    @classmethod
+    def from_file(cls, path):
+        """Probe a TIFF file by reading its header only.
+
+        Args:
+            path (str): Path to the TIFF file.
+
+        Returns:
+            ImageProbe: The file's image format.
+
+        Raises:
+            OSError: If the file cannot be opened.
+            ValueError: If the file is not a readable TIFF, or its sample
+                format has no numpy equivalent.
+        """
+        with tifffile.TiffFile(path) as tif:
+            page = tif.pages.first
+            if page.dtype is None:
+                raise ValueError(
+                    f"Unsupported TIFF sample format (SampleFormat {page.sampleformat}, "
+                    f"{page.bitspersample} bits per sample)"
+                )
+            native = tif.byteorder == ('<' if sys.byteorder == 'little' else '>')
+            return cls(
+                path,
+                page.shape,
+                page.dtype.newbyteorder('='),
+                compression=page.compression,
+                tiled=page.is_tiled,
+                bigtiff=tif.is_bigtiff,
+                memmappable=page.is_memmappable and native,
+                orientation=page.tags.valueof(274, 1),
+                page_count=len(tif.pages)
+            )
+
+    @property
+    def ndim(self):
+        """int: Number of image dimensions."""
+        return len(self.stored_shape)
+
+    @property
+    def shape(self):
+        """tuple: Image shape after portrait images are rotated to landscape."""
+        if self.ndim == 2 and self.stored_shape[0] > self.stored_shape[1]:
+            return self.stored_shape[1], self.stored_shape[0]
+        return self.stored_shape
+
+    @property
+    def itemsize(self):
+        """int: Bytes per pixel sample."""
+        return self.dtype.itemsize
+
+    @property
+    def is_portrait(self):
+        """bool: Whether the image is stored in portrait orientation."""
+        return self.ndim == 2 and self.stored_shape[0] > self.stored_shape[1]
+
+    @property
+    def compressed(self):
+        """bool: Whether the pixel data is compressed."""
+        return self.compression != self.COMPRESSION_NONE
+
+    @property
+    def compression_name(self):
+        """str: Lower-case name of the TIFF compression scheme (e.g. "none", "lzw", "adobe_deflate")."""
+        try:
+            return tifffile.COMPRESSION(self.compression).name.lower()
+        except ValueError:
+            return str(self.compression)
+
+    @property
+    def nbytes(self):
+        """int: Bytes the decoded pixels occupy in memory."""
+        count = 1
+        for extent in self.stored_shape:
+            count *= extent
+        return count * self.itemsize
@@ -1,13 +1,55 @@
 """Image processing functionalities for the Darkroom Enlarger Application using OpenCV."""
 import os
+import time
 import numpy as np
 import cv2
+import tifffile
+from app.compiled_lut import gather
+from app.image_probe import ImageProbe
+
+
+class ImageLoadResult:
+    """A loaded image together with what was learned while decoding it."""
+
+    def __init__(self, image, original_shape, rotation_applied, decode_time_ms, bytes_read, decoder="cv2",
+                 probe=None):
+        """Initializes the load result.
+
+        Args:
+            image (numpy.ndarray): Validated 16-bit grayscale image, in landscape orientation
+                (a rotated view of the decoded pixels for portrait images, not a copy).
+            original_shape (tuple): (height, width) of the image as stored in the file.
+            rotation_applied (bool): Whether the image was rotated 90° clockwise to landscape.
+            decode_time_ms (float): Time spent reading and decoding the file.
+            bytes_read (int or None): Size of the file on disk, if known.
+            decoder (str): How the pixels were obtained ("memmap", "tifffile" or "cv2").
+            probe (ImageProbe, optional): Header information read before decoding.
+        """
+        self.image = image
+        self.original_shape = original_shape
+        self.rotation_applied = rotation_applied
+        self.decode_time_ms = decode_time_ms
+        self.bytes_read = bytes_read
+        self.decoder = decoder
+        self.probe = probe
+
+    @property
+    def was_portrait(self):
+        """bool: Whether the image was stored in portrait orientation."""
+        height, width = self.original_shape
+        return height > width
+
+    @property
+    def quarter_turns(self):
+        """int: Clockwise quarter turns from the decoded pixels to ``image``."""
+        return 1 if self.rotation_applied else 0
 
 
 class ImageProcessor:
     """Handles loading, processing, and converting images for display using OpenCV."""
     
-    def __init__(self, file_checker=None, tiff_reader=None, cv2_reader=None):
+    def __init__(self, file_checker=None, tiff_reader=None, cv2_reader=None, executor=None, size_getter=None,
+                 memmap_reader=None, prober=None, parallel_reader=None):
         """Initializes the ImageProcessor with OpenCV backend.
         
         Args:
@@ -15,52 +57,195 @@ class ImageProcessor:
                                              Defaults to os.path.exists.
             cv2_reader (callable, optional): Function to read image files.
                                            Defaults to cv2.imread.
+            executor (TileExecutor, optional): Runs LUT and inversion over row bands
+                                             in parallel. Defaults to a single whole-image pass.
+            size_getter (callable, optional): Function returning a file's size in bytes.
+                                            Defaults to os.path.getsize.
+            memmap_reader (callable, optional): Function memory-mapping an uncompressed TIFF,
+                                              raising ValueError if it cannot.
+                                              Defaults to tifffile.memmap (read-only).
+            prober (callable, optional): Function reading an ImageProbe from a file header.
+                                       Defaults to ImageProbe.from_file.
+            parallel_reader (callable, optional): Function decoding a compressed or tiled TIFF
+                                                given (path, maxworkers).
+                                                Defaults to tifffile.imread.
         """
         self.file_checker = file_checker or os.path.exists
         # Support both old and new parameter names for backward compatibility
         self.cv2_reader = cv2_reader or tiff_reader or cv2.imread
+        self.executor = executor
+        self.size_getter = size_getter or os.path.getsize
+        self.memmap_reader = memmap_reader or (lambda path: tifffile.memmap(path, mode='r'))
+        self.prober = prober or ImageProbe.from_file
+        self.parallel_reader = parallel_reader or (
+            lambda path, maxworkers: tifffile.imread(path, key=0, maxworkers=maxworkers)
+        )
+
+    def probe_image(self, image_path):
+        """Reads and validates a TIFF image's format from its header, without decoding pixels.
+
+        Args:
+            image_path (str): The path to the 16-bit TIFF image file.
+
+        Returns:
+            ImageProbe: The image format, with the shape it will have once loaded.
+
+        Raises:
+            ValueError: If the file is not a readable 16-bit grayscale TIFF.
+            FileNotFoundError: If the image file does not exist.
+        """
+        self._check_path(image_path)
+
+        try:
+            probe = self.prober(image_path)
+        except (ValueError, OSError) as e:
+            raise ValueError(f"Failed to read TIFF header: {e}")
+
+        self._check_format(probe.dtype, probe.ndim, probe.stored_shape)
+        return probe
 
-    def load_image(self, image_path):
+    def load_image(self, image_path, probe=None):
         """Loads a 16-bit grayscale TIFF image using OpenCV and validates its format.
 
+        The header is probed first, so files of the wrong format are rejected
+        without decoding. Contiguous uncompressed files are memory-mapped, so pixels are read
+        straight from the OS page cache and reloading a file is nearly free;
+        compressed, tiled or otherwise unmappable files are decoded by OpenCV.
+        The file is decoded once; portrait images are turned to landscape as a
+        strided view, without copying, and the original orientation is reported
+        in the result. The first stage that touches every pixel (LUT gather,
+        padding into the print canvas or preview downsampling) reads through the
+        view and writes the turned result.
+
         Args:
             image_path (str): The path to the 16-bit TIFF image file.
+            probe (ImageProbe, optional): Header already read by ``probe_image``.
 
         Returns:
-            numpy.ndarray: The loaded image data as a NumPy array.
+            ImageLoadResult: The loaded image data and its load metadata.
 
         Raises:
             ValueError: If the image is not a 16-bit grayscale TIFF.
             FileNotFoundError: If the image file does not exist.
         """
+        self._check_path(image_path)
+
+        start = time.perf_counter()
+
+        # Reject wrong formats from the header alone; files tifffile cannot
+        # parse are still given to the decoder
+        if probe is None:
+            try:
+                probe = self.prober(image_path)
+            except (ValueError, OSError):
+                probe = None
+        if probe is not None:
+            self._check_format(probe.dtype, probe.ndim, probe.stored_shape)
+
+        image, decoder = self._decode(image_path, probe)
+        decode_time_ms = (time.perf_counter() - start) * 1000
+
+        # Validate image format
+        self._check_format(image.dtype, image.ndim, image.shape)
+
+        original_shape = image.shape
+
+        # Auto-rotate portrait images to landscape orientation (a view; no full-frame copy)
+        rotation_applied = self.is_portrait_orientation(image)
+        if rotation_applied:
+            image = np.rot90(image, -1)
+
+        try:
+            bytes_read = self.size_getter(image_path)
+        except OSError:
+            bytes_read = None
+
+        return ImageLoadResult(image, original_shape, rotation_applied, round(decode_time_ms, 1), bytes_read, decoder,
+                               probe)
+
+    def _check_path(self, image_path):
+        """Checks that an image path exists and names a TIFF file.
+
+        Raises:
+            FileNotFoundError: If the image file does not exist.
+            ValueError: If the file is not a TIFF file.
+        """
         # Check if file exists
         if not self.file_checker(image_path):
             raise FileNotFoundError(f"Image file not found: {image_path}")
-        
+
         # Check if file is a TIFF file
         if not image_path.lower().endswith(('.tif', '.tiff')):
             raise ValueError("Input file must be a TIFF file (.tif or .tiff)")
-        
+
+    def _check_format(self, dtype, ndim, shape):
+        """Checks that an image format is 16-bit grayscale.
+
+        Raises:
+            ValueError: If the image is not 16-bit or not 2D.
+        """
+        if dtype != np.uint16:
+            raise ValueError(f"Input image must be 16-bit (uint16). Found: {dtype}")
+
+        if ndim != 2:  # Grayscale images have 2 dimensions (height, width)
+            raise ValueError(f"Input image must be grayscale (2D). Found {ndim} dimensions with shape {shape}")
+
+    def _decode(self, image_path, probe):
+        """Reads an image's pixels with the backend best suited to its layout.
+
+        - ``memmap``: contiguous uncompressed files are mapped, not decoded
+        - ``tifffile``: compressed, tiled and BigTIFF files decode their
+          independent strips/tiles in parallel
+        - ``cv2``: everything else, and the fallback if the others cannot
+          read the file (e.g. a codec tifffile lacks)
+
+        Returns:
+            tuple: (image, decoder name)
+
+        Raises:
+            ValueError: If no backend can read the file.
+        """
+        if probe is None or probe.memmappable:
+            image = self._memmap_image(image_path)
+            if image is not None:
+                return image, "memmap"
+
+        if probe is not None and (probe.compressed or probe.tiled or probe.bigtiff):
+            try:
+                return self.parallel_reader(image_path, self.decode_workers), "tifffile"
+            except (ValueError, OSError, MemoryError):
+                pass
+
         try:
             # Load image with OpenCV - use IMREAD_UNCHANGED to preserve bit depth
             image = self.cv2_reader(image_path, cv2.IMREAD_UNCHANGED)
-            
+
             if image is None:
                 raise ValueError("Failed to read image file - file may be corrupted or unsupported")
-                
+
         except Exception as e:
             raise ValueError(f"Failed to read TIFF file: {e}")
 
-        # Validate image format
-        if image.dtype != np.uint16:
-            raise ValueError(f"Input image must be 16-bit (uint16). Found: {image.dtype}")
-        
-        if image.ndim != 2:  # Grayscale images have 2 dimensions (height, width)
-            raise ValueError(f"Input image must be grayscale (2D). Found {image.ndim} dimensions with shape {image.shape}")
+        return image, "cv2"
+
+    @property
+    def decode_workers(self):
+        """int or None: Threads used to decode strips/tiles (None lets tifffile choose)."""
+        return self.executor.workers if self.executor is not None else None
+
+    def _memmap_image(self, image_path):
+        """Memory-maps a 2D native-endian 16-bit TIFF, or returns None if it cannot be mapped.
 
-        # Auto-rotate portrait images to landscape orientation
-        if self.is_portrait_orientation(image):
-            image = self.rotate_image_clockwise_90(image)
+        Compressed and tiled files, multi-channel images and byte-swapped data
+        are left to the decoding path.
+        """
+        try:
+            image = self.memmap_reader(image_path)
+        except (ValueError, OSError):
+            return None
+
+        if image.ndim != 2 or image.dtype != np.uint16:
+            return None
 
         return image
 
@@ -82,9 +267,13 @@ class ImageProcessor:
         # The 256x256 LUT contains 65536 values for the full 16-bit range
         lut_1d = lut.flatten()
         
-        # Use manual indexing for 16-bit LUT application (more reliable than cv2.LUT for 16-bit)
-        processed_image = lut_1d[image]
+        # Use manual indexing for 16-bit LUT application (more reliable than cv2.LUT for 16-bit);
+        # the gather always writes a contiguous result, turning rotated views as it goes
+        if self.executor is None:
+            return gather(lut_1d, image)
 
+        processed_image = np.empty(image.shape, dtype=lut_1d.dtype)
+        self.executor.run(lambda rows: gather(lut_1d, image[rows], processed_image[rows]), image.shape)
         return processed_image
 
     def invert_image(self, image):
@@ -98,7 +287,12 @@ class ImageProcessor:
         """
         # Use OpenCV's bitwise_not for efficient inversion
         # This is faster than manual arithmetic for large images
-        return cv2.bitwise_not(image)
+        if self.executor is None:
+            return cv2.bitwise_not(image)
+
+        inverted = np.empty_like(image)
+        self.executor.run(lambda rows: cv2.bitwise_not(image[rows], dst=inverted[rows]), image.shape)
+        return inverted
 
 
     def is_portrait_orientation(self, image):
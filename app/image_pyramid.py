@@ -0,0 +1,122 @@
+"""Multi-resolution image pyramid for preview.
+
+A pyramid is built once per image: level 0 is the image itself and each
+further level halves the previous one. Any preview size is then resampled
+from the smallest level that still has at least the required resolution,
+so refreshing the preview never touches the full-resolution array.
+
+A portrait image loaded as a rotated view is downsampled in its stored
+layout; only the half-size level is turned, so the full-resolution pixels
+are never copied.
+"""
+import numpy as np
+import cv2
+
+
+class ImagePyramid:
+    """A 2x image pyramid with size-based resampling.
+
+    Levels are downsampled with area averaging. Final resamples use the
+    interpolation given at construction, from a level at most 2x larger than
+    the requested output.
+    """
+
+    # Levels are added until the longest side is at most this many pixels
+    min_level_size = 512
+
+    def __init__(self, image, interpolation=cv2.INTER_LINEAR, cv2_resize=None, min_level_size=None,
+                 quarter_turns=0):
+        """Build the pyramid.
+
+        Args:
+            image (numpy.ndarray): Full-resolution 2D image (level 0, not copied)
+            interpolation (int): OpenCV interpolation for final resamples
+            cv2_resize (callable, optional): cv2.resize replacement for dependency injection (testing)
+            min_level_size (int, optional): Longest side of the smallest level.
+                Defaults to ImagePyramid.min_level_size.
+            quarter_turns (int): Clockwise quarter turns by which ``image`` is a
+                rotated view of its stored pixels; the first level is downsampled
+                from the stored layout and then turned
+
+        Raises:
+            ValueError: If the image is missing or not 2D.
+        """
+        if image is None:
+            raise ValueError("Cannot build a pyramid for None image")
+
+        if image.ndim != 2:
+            raise ValueError(f"Expected 2D grayscale image, got {image.ndim}D")
+
+        self.interpolation = interpolation
+        self.cv2_resize = cv2_resize or cv2.resize
+        if min_level_size is not None:
+            self.min_level_size = min_level_size
+
+        self.levels = [image]
+        source = np.rot90(image, quarter_turns) if quarter_turns % 4 else image
+        while max(self.levels[-1].shape) > self.min_level_size and min(self.levels[-1].shape) > 1:
+            height, width = source.shape
+            half = ((width + 1) // 2, (height + 1) // 2)
+            level = self.cv2_resize(source, half, interpolation=cv2.INTER_AREA)
+            if source is not self.levels[-1]:
+                level = np.ascontiguousarray(np.rot90(level, -quarter_turns))
+            self.levels.append(level)
+            source = level
+
+    @property
+    def image(self):
+        """numpy.ndarray: The full-resolution image (level 0)."""
+        return self.levels[0]
+
+    @property
+    def shape(self):
+        """tuple: Shape of the full-resolution image."""
+        return self.levels[0].shape
+
+    @property
+    def ndim(self):
+        """int: Number of image dimensions."""
+        return 2
+
+    @property
+    def dtype(self):
+        """numpy.dtype: Pixel data type."""
+        return self.levels[0].dtype
+
+    @property
+    def nbytes(self):
+        """int: Bytes held by the downsampled levels (level 0 is not owned)."""
+        return sum(level.nbytes for level in self.levels[1:])
+
+    def level_for_scale(self, scale):
+        """Return the index of the smallest level with at least ``scale`` of full resolution.
+
+        Args:
+            scale (float): Output size relative to the full-resolution image
+
+        Returns:
+            int: Level index (0 for scales of 1 or more)
+        """
+        full_height, full_width = self.shape
+        chosen = 0
+        for index, level in enumerate(self.levels):
+            height, width = level.shape
+            if width < full_width * scale or height < full_height * scale:
+                break
+            chosen = index
+        return chosen
+
+    def image_for_size(self, size):
+        """Resample the whole image to ``size`` from the nearest level.
+
+        Args:
+            size (tuple): Output (width, height)
+
+        Returns:
+            numpy.ndarray: Resampled image (a copy of the level if it already has that size)
+        """
+        width, height = size
+        level = self.levels[self.level_for_scale(max(width / self.shape[1], height / self.shape[0]))]
+        if (level.shape[1], level.shape[0]) == (width, height):
+            return level.copy()
+        return self.cv2_resize(level, (width, height), interpolation=self.interpolation)
@@ -1,12 +1,42 @@
 import os
+import hashlib
+import threading
+from collections import OrderedDict
 import tifffile
 import numpy as np
 
+
+class LUTCacheEntry:
+    """A validated LUT held in the LUTManager cache, plus forms derived from it."""
+
+    def __init__(self, path, content_hash, table):
+        """Initializes the cache entry.
+
+        Args:
+            path (str): Path the LUT was last loaded from.
+            content_hash (str): Hex digest of the LUT contents.
+            table (numpy.ndarray): Validated, contiguous, read-only 1D uint16 table.
+        """
+        self.path = path
+        self.content_hash = content_hash
+        self.table = table
+        self.derived = {}  # name -> derived form (e.g. compiled print tables)
+
+    @property
+    def lut(self):
+        """numpy.ndarray: The LUT as a read-only 256x256 view of the table."""
+        return self.table.reshape((256, 256))
+
+
 class LUTManager:
     """Manages loading and validation of Look-Up Table (LUT) files."""
-    def __init__(self, file_checker=None, dir_lister=None, tiff_reader=None):
+
+    # Maximum number of distinct LUTs kept in the cache
+    cache_size = 8
+
+    def __init__(self, file_checker=None, dir_lister=None, tiff_reader=None, stat_func=None, cache_size=None):
         """Initializes the LUTManager.
-        
+
         Args:
             file_checker (callable, optional): Function to check if file/dir exists.
                                              Defaults to os.path.exists.
@@ -14,19 +44,55 @@ class LUTManager:
                                            Defaults to os.listdir.
             tiff_reader (callable, optional): Function to read TIFF files.
                                             Defaults to tifffile.imread.
+            stat_func (callable, optional): Function returning file stats (st_mtime_ns, st_size).
+                                          Defaults to os.stat.
+            cache_size (int, optional): Maximum number of cached LUTs.
+                                      Defaults to LUTManager.cache_size.
         """
         self.file_checker = file_checker or os.path.exists
         self.dir_lister = dir_lister or os.listdir
         self.tiff_reader = tiff_reader or tifffile.imread
+        self.stat_func = stat_func or os.stat
+        if cache_size is not None:
+            self.cache_size = cache_size
+
+        self._entries = OrderedDict()  # content hash -> LUTCacheEntry, least recent first
+        self._signatures = {}  # (path, mtime_ns, size) -> content hash
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Pipeline stages may load LUTs and build derived forms on worker threads
+        self._lock = threading.RLock()
 
     def load_lut(self, lut_path):
         """Loads and validates a 16-bit TIFF LUT file that is 256x256 pixels.
 
+        Repeat loads of an unchanged file are served from the cache without
+        touching the TIFF.
+
+        Args:
+            lut_path (str): The path to the LUT file.
+
+        Returns:
+            numpy.ndarray: The loaded LUT data as a read-only NumPy array.
+
+        Raises:
+            FileNotFoundError: If the LUT file does not exist.
+            ValueError: If the LUT is not a 16-bit TIFF file or not 256x256 pixels.
+        """
+        return self.load_lut_entry(lut_path).lut
+
+    def load_lut_entry(self, lut_path):
+        """Loads a LUT through the cache and returns its cache entry.
+
+        Entries are keyed by path + modification time + size for the fast path,
+        and by content hash so identical LUTs share one entry (and its derived
+        forms) even under different paths.
+
         Args:
             lut_path (str): The path to the LUT file.
 
         Returns:
-            numpy.ndarray: The loaded LUT data as a NumPy array.
+            LUTCacheEntry: The validated LUT and its derived forms.
 
         Raises:
             FileNotFoundError: If the LUT file does not exist.
@@ -35,27 +101,134 @@ class LUTManager:
         # Handle absolute path
         if not os.path.isabs(lut_path):
             raise FileNotFoundError(f"invalid path: {lut_path}")
-        
+
         # Check if file exists
         if not self.file_checker(lut_path):
             raise FileNotFoundError(f"LUT file not found: {lut_path}")
-        
+
         # Check if file is a TIFF file
         if not lut_path.lower().endswith(('.tif', '.tiff')):
             raise ValueError("LUT file must be a TIFF file (.tif or .tiff)")
-        
+
+        with self._lock:
+            return self._load_entry(lut_path)
+
+    def _load_entry(self, lut_path):
+        """Looks up or reads a LUT whose path has been checked; call with the lock held."""
+        signature = self._file_signature(lut_path)
+        content_hash = self._signatures.get(signature) if signature is not None else None
+        if content_hash in self._entries:
+            self.cache_hits += 1
+            self._entries.move_to_end(content_hash)
+            return self._entries[content_hash]
+
+        self.cache_misses += 1
+        table = self._read_lut_table(lut_path)
+        content_hash = hashlib.blake2b(table.tobytes(), digest_size=16).hexdigest()
+
+        entry = self._entries.get(content_hash)
+        if entry is None:
+            entry = LUTCacheEntry(lut_path, content_hash, table)
+            self._entries[content_hash] = entry
+        else:
+            entry.path = lut_path
+            self._entries.move_to_end(content_hash)
+
+        if signature is not None:
+            self._signatures[signature] = content_hash
+        self._evict()
+
+        return entry
+
+    def get_derived(self, lut_path, name, builder):
+        """Returns a form derived from a LUT, building and caching it on first use.
+
+        Args:
+            lut_path (str): The path to the LUT file.
+            name (str): Name of the derived form (e.g. "print_table").
+            builder (callable): Function building the derived form from the 256x256 LUT.
+
+        Returns:
+            The cached derived form.
+        """
+        return self.get_derived_for(self.load_lut_entry(lut_path), name, builder)
+
+    def get_derived_for(self, entry, name, builder):
+        """Returns a form derived from an already loaded LUT entry.
+
+        Unlike get_derived, the LUT is not looked up again, so the file is not
+        re-stat'ed and no cache hit is counted.
+
+        Args:
+            entry (LUTCacheEntry): Entry returned by load_lut_entry.
+            name (str): Name of the derived form (e.g. "print_table").
+            builder (callable): Function building the derived form from the 256x256 LUT.
+
+        Returns:
+            The cached derived form.
+        """
+        with self._lock:
+            if name not in entry.derived:
+                entry.derived[name] = builder(entry.lut)
+            return entry.derived[name]
+
+    def get_cache_stats(self):
+        """Returns LUT cache statistics.
+
+        Returns:
+            dict: Cache hits, misses, current and maximum number of entries.
+        """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'entries': len(self._entries),
+            'max_entries': self.cache_size
+        }
+
+    def clear_cache(self):
+        """Drops all cached LUTs and resets the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._signatures.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def _read_lut_table(self, lut_path):
+        """Reads and validates a LUT file, returning a read-only contiguous 1D table.
+
+        Raises:
+            ValueError: If the LUT cannot be read or is not 16-bit 256x256.
+        """
         try:
             lut = self.tiff_reader(lut_path)
         except Exception as e:
             raise ValueError(f"Failed to read TIFF LUT file: {e}")
-        
+
         # Validate LUT format
         if lut.dtype != np.uint16:
             raise ValueError(f"LUT must be 16-bit (uint16). Found: {lut.dtype}")
-        
+
         if lut.shape != (256, 256):
             raise ValueError(f"LUT must be 256x256 pixels. Found: {lut.shape}")
-            
-        return lut
 
+        table = np.array(lut, dtype=np.uint16, order='C').reshape(-1)
+        table.flags.writeable = False
+        return table
+
+    def _file_signature(self, lut_path):
+        """Returns (path, mtime_ns, size) for a LUT file, or None if it cannot be stat'ed."""
+        try:
+            stat = self.stat_func(lut_path)
+        except OSError:
+            return None
+        return (lut_path, stat.st_mtime_ns, stat.st_size)
 
+    def _evict(self):
+        """Evicts least recently used entries beyond the cache size."""
+        while len(self._entries) > self.cache_size:
+            evicted_hash, _ = self._entries.popitem(last=False)
+            self._signatures = {
+                signature: content_hash
+                for signature, content_hash in self._signatures.items()
+                if content_hash != evicted_hash
+            }
@@ -1,15 +1,18 @@
 """Main application window for the Darkroom Enlarger Application."""
 from PyQt6.QtWidgets import (
     QMainWindow, QVBoxLayout, QWidget, QPushButton, QLabel,
-    QLineEdit, QHBoxLayout, QTextEdit
+    QLineEdit, QHBoxLayout, QTextEdit, QSizePolicy
 )
 from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
 from datetime import datetime
 from app.image_display_manager import ImageDisplayManager
 
 class MainWindow(QMainWindow):
     """The main window of the application, handling UI elements and user interactions."""
+
+    preview_resized = pyqtSignal(int, int)  # New preview area width, height
+
     def __init__(self, display_manager=None, file_dialog=None):
         """Initializes the MainWindow and sets up the UI.
         
@@ -68,10 +71,13 @@ class MainWindow(QMainWindow):
 
         # Preview Area
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Set fixed size with 16:9 aspect ratio (7680:4320 scaled down)
-        self.preview_label.setFixedSize(768, 432)  # 16:9 aspect ratio
+        # At least 768x432 (16:9, 7680:4320 scaled down); grows with the window.
+        # The pixmap must not drive the label's size, or previews would grow it.
+        self.preview_label.setMinimumSize(768, 432)
+        self.preview_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         self.preview_label.setStyleSheet("border: 1px solid gray;")
-        self.layout.addWidget(self.preview_label)
+        self.preview_label.installEventFilter(self)
+        self.layout.addWidget(self.preview_label, 1)  # Takes any extra height
 
         # Process Image Control
         process_layout = QHBoxLayout()
@@ -144,6 +150,21 @@ class MainWindow(QMainWindow):
             QPushButton:hover { background-color: #a00000; }
         """)
 
+    def eventFilter(self, watched, event):
+        """Announce preview area resizes so the preview can be re-rendered at the new size."""
+        if watched is self.preview_label and event.type() == QEvent.Type.Resize:
+            size = event.size()
+            self.preview_resized.emit(size.width(), size.height())
+        return super().eventFilter(watched, event)
+
+    def get_preview_size(self):
+        """Get the size of the preview area.
+
+        Returns:
+            tuple: (width, height) in pixels
+        """
+        return self.preview_label.width(), self.preview_label.height()
+
     def get_image_file(self):
         """Opens a file dialog to select a 16-bit TIFF image.
 
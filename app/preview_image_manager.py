@@ -4,11 +4,16 @@ This module handles image processing specifically optimized for preview display,
 focusing on speed and responsiveness rather than print quality.
 """
 
+import hashlib
+from collections import OrderedDict
+
 import cv2
 import numpy as np
 from PyQt6.QtGui import QPixmap, QImage, QPainter
 from PyQt6.QtCore import Qt
 
+from app.image_pyramid import ImagePyramid
+
 
 class PreviewImageManager:
     """Manages image processing and display for the main window preview area.
@@ -17,6 +22,12 @@ class PreviewImageManager:
     prioritizing speed and responsiveness over print-quality processing.
     """
     
+    # Number of fused display tables kept in memory
+    display_table_cache_size = 4
+
+    # Number of rendered preview pixmaps kept in memory
+    preview_cache_size = 16
+
     def __init__(self, cv2_resize=None):
         """Initialize the PreviewImageManager.
         
@@ -24,15 +35,127 @@ class PreviewImageManager:
             cv2_resize: Optional cv2.resize function for dependency injection (testing)
         """
         self.cv2_resize = cv2_resize or cv2.resize
+        self._display_tables = OrderedDict()  # (LUT digest, invert) -> uint8 table
+        self._previews = OrderedDict()  # (image version, LUT digest, invert, size) -> QPixmap
+        self.preview_cache_hits = 0
+        self.preview_cache_misses = 0
+
+    def get_preview_pixmap(self, image_data, image_version, container_size=(768, 432), lut=None, invert=False):
+        """Return a preview pixmap, rendering it only if this state has not been rendered recently.
+
+        Previews are cached by (image version, LUT contents, inversion and
+        container size), so returning to an earlier image state
+        or LUT is served without resampling.
+
+        Args:
+            image_data (numpy.ndarray or ImagePyramid): Input image data
+            image_version (hashable): Identifies the contents of image_data; must
+                change whenever the image does
+            container_size (tuple): Target container size as (width, height)
+            lut (numpy.ndarray, optional): LUT to apply for display
+            invert (bool): Whether to invert for display
+
+        Returns:
+            QPixmap: Preview-ready pixmap
+        """
+        key = (image_version, self._lut_digest(lut), invert, tuple(container_size))
+        pixmap = self._previews.get(key)
+        if pixmap is not None:
+            self.preview_cache_hits += 1
+            self._previews.move_to_end(key)
+            return pixmap
+
+        self.preview_cache_misses += 1
+        pixmap = self.create_preview_pixmap(image_data, container_size, lut, invert)
+        self._previews[key] = pixmap
+        while len(self._previews) > self.preview_cache_size:
+            self._previews.popitem(last=False)
+        return pixmap
+
+    def get_preview_cache_stats(self):
+        """Get preview cache statistics.
+
+        Returns:
+            dict: Cache hits, misses, current and maximum number of entries.
+        """
+        return {
+            'hits': self.preview_cache_hits,
+            'misses': self.preview_cache_misses,
+            'entries': len(self._previews),
+            'max_entries': self.preview_cache_size
+        }
+
+    def clear_preview_cache(self):
+        """Drop all cached preview pixmaps and reset the hit/miss counters."""
+        self._previews.clear()
+        self.preview_cache_hits = 0
+        self.preview_cache_misses = 0
+
+    @staticmethod
+    def _lut_digest(lut):
+        """Return a digest identifying LUT contents, or None for no LUT."""
+        if lut is None:
+            return None
+        return hashlib.blake2b(np.ascontiguousarray(lut).tobytes(), digest_size=16).digest()
+
+    def build_display_table(self, lut=None, invert=False):
+        """Build the fused 65536-entry table mapping raw 16-bit values to 8-bit display values.
+
+        The table folds the LUT, optional inversion and the preview tone
+        transfer (linear 16-bit to 8-bit, rounded) into a single lookup.
+        Tables are cached by LUT contents and inversion.
+
+        Args:
+            lut (numpy.ndarray, optional): 256x256 (or flat 65536-entry) 16-bit LUT
+            invert (bool): Whether to invert after the LUT
+
+        Returns:
+            numpy.ndarray: Read-only uint8 table of 65536 entries
+        """
+        if lut is not None and (lut.dtype != np.uint16 or lut.size != 65536):
+            raise ValueError(f"LUT must be 65536 16-bit entries, got {lut.size} of {lut.dtype}")
+
+        key = (self._lut_digest(lut), invert)
+        table = self._display_tables.get(key)
+        if table is not None:
+            self._display_tables.move_to_end(key)
+            return table
+
+        values = np.arange(65536, dtype=np.uint32) if lut is None else np.ascontiguousarray(lut).reshape(-1).astype(np.uint32)
+        if invert:
+            values = 65535 - values
+        # Round to the nearest 8-bit level (65535 / 255 == 257)
+        table = ((values + 128) // 257).astype(np.uint8)
+        table.flags.writeable = False
+
+        self._display_tables[key] = table
+        while len(self._display_tables) > self.display_table_cache_size:
+            self._display_tables.popitem(last=False)
+        return table
+
+    def build_pyramid(self, image_data, quarter_turns=0):
+        """Build the preview pyramid for an image, once per loaded or processed image.
+
+        Args:
+            image_data (numpy.ndarray): Full-resolution image data (16-bit grayscale)
+            quarter_turns (int): Clockwise quarter turns by which ``image_data`` is
+                a rotated view of its pixels (see ``ImageLoadResult.quarter_turns``)
+
+        Returns:
+            ImagePyramid: Pyramid whose levels serve every preview size
+        """
+        return ImagePyramid(image_data, interpolation=cv2.INTER_LINEAR, cv2_resize=self.cv2_resize,
+                            quarter_turns=quarter_turns)
         
     def prepare_preview_image(self, image_data, container_size=(768, 432)):
         """Prepare an image for fast preview display.
         
         Optimizes the image for preview display with fast scaling and good-enough quality.
-        Preserves aspect ratio within the container dimensions.
+        Preserves aspect ratio within the container dimensions. Given a pyramid,
+        the preview is resampled from its nearest level instead of full resolution.
         
         Args:
-            image_data (numpy.ndarray): Input image data (16-bit grayscale)
+            image_data (numpy.ndarray or ImagePyramid): Input image data (16-bit grayscale)
             container_size (tuple): Target container size as (width, height)
             
         Returns:
@@ -62,7 +185,9 @@ class PreviewImageManager:
             new_height = int(img_height * scale_factor)
         
         # Resize using cv2 with original bit depth preserved
-        if (new_width, new_height) != (img_width, img_height):
+        if isinstance(image_data, ImagePyramid):
+            preview_image = image_data.image_for_size((new_width, new_height))
+        elif (new_width, new_height) != (img_width, img_height):
             preview_image = self.cv2_resize(
                 image_data, 
                 (new_width, new_height), 
@@ -99,12 +224,18 @@ class PreviewImageManager:
         
         return (new_width, new_height)
         
-    def create_preview_pixmap(self, image_data, container_size=(768, 432)):
+    def create_preview_pixmap(self, image_data, container_size=(768, 432), lut=None, invert=False):
         """Create a QPixmap optimized for preview display.
+
+        The preview is resampled at 16 bits, then LUT, inversion and the
+        conversion to 8 bits happen in one gather through the fused display
+        table, straight into the Grayscale8 buffer Qt displays.
         
         Args:
-            image_data (numpy.ndarray): Input image data
+            image_data (numpy.ndarray or ImagePyramid): Input image data
             container_size (tuple): Target container size as (width, height)
+            lut (numpy.ndarray, optional): LUT to apply for display
+            invert (bool): Whether to invert for display
             
         Returns:
             QPixmap: Preview-ready pixmap
@@ -113,7 +244,27 @@ class PreviewImageManager:
         preview_image = self.prepare_preview_image(image_data, container_size)
         
         # Convert to QPixmap
-        return self.numpy_to_pixmap(preview_image)
+        return self.numpy_to_display_pixmap(preview_image, self.build_display_table(lut, invert))
+
+    def numpy_to_display_pixmap(self, image_data, display_table):
+        """Convert a 16-bit image to an 8-bit QPixmap through a fused display table.
+
+        Args:
+            image_data (numpy.ndarray): 16-bit grayscale image data
+            display_table (numpy.ndarray): uint8 table from ``build_display_table``
+
+        Returns:
+            QPixmap: Qt pixmap for display
+        """
+        if image_data.dtype != np.uint16:
+            raise ValueError(f"Expected 16-bit grayscale image data, got {image_data.dtype}")
+
+        height, width = image_data.shape
+        display = np.take(display_table, image_data)
+
+        # Grayscale8 needs no conversion when Qt builds the pixmap
+        q_image = QImage(display.data, width, height, width, QImage.Format.Format_Grayscale8)
+        return QPixmap.fromImage(q_image)
         
     def numpy_to_pixmap(self, image_data):
         """Convert numpy array to QPixmap for Qt display.
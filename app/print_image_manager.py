@@ -4,9 +4,16 @@ This module handles image processing specifically optimized for printing on the
 secondary 7680x4320 display, focusing on quality and print-specific optimizations.
 """
 
+import threading
+import time
+from collections import OrderedDict
+
 import cv2
 import numpy as np
 
+from app.compiled_lut import CompiledLUT, gather
+from app.dithered_frame_source import DitheredFrameSource
+from app.frame_set_cache import FrameSetCache
 
 
 class PrintImageManager:
@@ -22,16 +29,41 @@ class PrintImageManager:
 
     # Period of time within which to cycle the frame array
     loop_duration_ms = 1000
+
+    # Number of compiled print tables kept in memory
+    compiled_lut_cache_size = 4
+
+    # Dithering modes for frame sources (see DitheredFrameSource)
+    DITHER_TEMPORAL = DitheredFrameSource.MODE_TEMPORAL
+    DITHER_BITPLANE = DitheredFrameSource.MODE_BITPLANE
     
-    def __init__(self, cv2_rotate=None, cv2_bitwise_not=None):
+    def __init__(self, cv2_rotate=None, cv2_bitwise_not=None, dither_mode=DITHER_TEMPORAL, executor=None,
+                 buffer_pool=None, frame_cache=None):
         """Initialize the PrintImageManager.
         
         Args:
             cv2_rotate: Optional cv2.rotate function for dependency injection (testing)
             cv2_bitwise_not: Optional cv2.bitwise_not function for dependency injection (testing)
+            dither_mode: Default dithering mode for frame sources
+                (DITHER_TEMPORAL: 16 equal frames, DITHER_BITPLANE: binary-weighted bit-planes)
+            executor: Optional TileExecutor running per-pixel stages over row bands in parallel
+            buffer_pool: Optional BufferPool providing display frames and print temporaries
+            frame_cache: Optional FrameSetCache keeping prepared dither planes on disk
         """
+        if dither_mode not in DitheredFrameSource.MODES:
+            raise ValueError(f"Unknown dither mode {dither_mode!r}")
         self.cv2_rotate = cv2_rotate or cv2.rotate
         self.cv2_bitwise_not = cv2_bitwise_not or cv2.bitwise_not
+        self.dither_mode = dither_mode
+        self.executor = executor
+        self.buffer_pool = buffer_pool
+        self.frame_cache = frame_cache
+        self._compiled_luts = OrderedDict()
+        self._lock = threading.Lock()  # Guards the caches; print preparation runs on a worker thread
+        self.last_resample_info = None  # Timing of the last single resample for a non-8K screen
+        self.last_frame_cache_hit = False  # Whether the last frame source came from the frame cache
+        self.last_frame_cache_entry = None  # Planes of the last frame source awaiting store_frame_set
+        self._identity_split = None
         
     def prepare_print_image(self, image_data, lut_data):
         """Prepare an image for high-quality printing display.
@@ -79,9 +111,12 @@ class PrintImageManager:
         # Flatten the 2D LUT to create a 1D lookup table
         lut_1d = lut.flatten()
         
-        # Use manual indexing for 16-bit LUT application
-        processed_image = lut_1d[image]
-        
+        if self.executor is None:
+            # Use manual indexing for 16-bit LUT application (contiguous output, even for views)
+            return gather(lut_1d, image)
+
+        processed_image = np.empty(image.shape, dtype=lut_1d.dtype)
+        self.executor.run(lambda rows: gather(lut_1d, image[rows], processed_image[rows]), image.shape)
         return processed_image
         
     def invert_image(self, image):
@@ -97,7 +132,12 @@ class PrintImageManager:
             raise ValueError("Cannot invert None image")
             
         # Use OpenCV's bitwise_not for efficient inversion
-        return self.cv2_bitwise_not(image)
+        if self.executor is None:
+            return self.cv2_bitwise_not(image)
+
+        inverted = np.empty_like(image)
+        self.executor.run(lambda rows: self.cv2_bitwise_not(image[rows], dst=inverted[rows]), image.shape)
+        return inverted
 
 
         
@@ -137,7 +177,8 @@ class PrintImageManager:
         """Calculate display information for 8K preparation.
         
         Args:
-            image_data (numpy.ndarray): Input image data
+            image_data (numpy.ndarray or ImageProbe): Input image data, or its header
+                probe to compute the information without loading pixels
             
         Returns:
             dict: Display preparation information
@@ -171,7 +212,8 @@ class PrintImageManager:
         """Validate if image and LUT are ready for print processing.
         
         Args:
-            image_data (numpy.ndarray): Input image data
+            image_data (numpy.ndarray or ImageProbe): Input image data, or its header
+                probe to validate without loading pixels
             lut_data (numpy.ndarray): LUT data (optional for validation)
             
         Returns:
@@ -243,8 +285,28 @@ class PrintImageManager:
             draw_frame_numbers: bool = True
     ):
         """
-        Pads a 16-bit grayscale image, simulates 12-bit dithered output as 8-bit frames.
+        Centers a 16-bit grayscale image on the display, simulates 12-bit dithered output as 8-bit frames.
         Optionally draws frame numbers in a grey box rotating through screen corners.
+
+        The 12-bit split and dithering only touch the image rectangle; the
+        letterbox around it is black in every frame. Identical consecutive
+        frames are built once and share one array in the returned list; shared
+        arrays are read-only, so overlays such as frame numbers must be drawn
+        on a copy.
+
+        Args:
+            image_array (numpy.ndarray): Print-ready 16-bit (uint16) grayscale image
+            target_width (int): Display width in pixels
+            target_height (int): Display height in pixels
+            num_frames (int): Frames per cycle, 1 to 16 (the remainder is 4 bits wide)
+            draw_frame_numbers (bool): Frame-number overlay request (not drawn here)
+
+        Returns:
+            list[numpy.ndarray]: One 8-bit frame per cycle position
+
+        Raises:
+            ValueError: If the image is not uint16, does not fit the target, or
+                num_frames is outside 1 to 16.
         """
         assert isinstance(image_array, np.ndarray), "Input is not a NumPy array"
 
@@ -252,19 +314,270 @@ class PrintImageManager:
         if height > target_height or width > target_width:
             raise ValueError(f"Image size {width}x{height} exceeds target {target_width}x{target_height}.")
 
-        canvas = np.zeros((target_height, target_width), dtype=np.uint16)
-        y_offset = (target_height - height) // 2
-        x_offset = (target_width - width) // 2
-        canvas[y_offset:y_offset + height, x_offset:x_offset + width] = image_array
+        # The split-only tables apply the 12-bit split with the clip folded in
+        base, remainder = self._split_only_tables().split(image_array, executor=self.executor)
+        offset = self._centered_offset(base.shape, target_width, target_height)
+        return self._materialize_cycle(DitheredFrameSource(
+            base, remainder, num_frames, executor=self.executor,
+            canvas_shape=(target_height, target_width), offset=offset, deduplicate=True
+        ))
+
+    def _split_only_tables(self):
+        """Return CompiledLUT tables that only split values which are already print-ready."""
+        with self._lock:
+            if self._identity_split is None:
+                self._identity_split = CompiledLUT(np.arange(65536, dtype=np.uint16), invert=False)
+        return self._identity_split
+
+    def compile_lut(self, lut_data):
+        """Compile a LUT into fused print tables, reusing a cached compilation.
+
+        Args:
+            lut_data (numpy.ndarray or CompiledLUT): 256x256 16-bit LUT data
+
+        Returns:
+            CompiledLUT: Print tables folding LUT, inversion and the 12-bit split
+        """
+        if isinstance(lut_data, CompiledLUT):
+            return lut_data
+
+        if lut_data is None:
+            raise ValueError("Cannot compile print tables without LUT data")
+
+        key = CompiledLUT.hash_lut(lut_data)
+        with self._lock:
+            compiled = self._compiled_luts.get(key)
+            if compiled is None:
+                compiled = CompiledLUT(lut_data, invert=True)
+                self._compiled_luts[key] = compiled
+                while len(self._compiled_luts) > self.compiled_lut_cache_size:
+                    self._compiled_luts.popitem(last=False)
+            else:
+                self._compiled_luts.move_to_end(key)
+
+        return compiled
+
+    def prepare_dither_window(self, image_data, lut_data, target_width=7680, target_height=4320,
+                              screen_size=None):
+        """Map a raw 16-bit image to dither planes covering only its window on the display.
+
+        LUT, inversion and the 12-bit split run in one gather over the image
+        rectangle; the letterbox is never materialized.
+
+        If the print is shown on a screen other than the target canvas size, the
+        print-ready 16-bit image is resampled once to the screen's scale and
+        dithered at native screen resolution (see ``last_resample_info``).
+
+        Args:
+            image_data (numpy.ndarray): Input image data (16-bit grayscale)
+            lut_data (numpy.ndarray or CompiledLUT): LUT data for color correction
+            target_width (int): Display width in pixels
+            target_height (int): Display height in pixels
+            screen_size (tuple, optional): Actual (width, height) of the print screen,
+                if it differs from the target display
+
+        Returns:
+            tuple: (base, remainder, canvas_shape, offset): uint8 planes of the
+            (possibly resampled) image size, the (height, width) of the screen
+            (or target) canvas, and the (y, x) offset centering the image on it
+        """
+        if image_data is None:
+            raise ValueError("Cannot prepare print image for None image")
+
+        if image_data.ndim != 2:
+            raise ValueError(f"Expected 2D grayscale image, got {image_data.ndim}D")
+
+        height, width = image_data.shape
+        if height > target_height or width > target_width:
+            raise ValueError(f"Image size {width}x{height} exceeds target {target_width}x{target_height}.")
+
+        compiled = self.compile_lut(lut_data)
+        self.last_resample_info = None
+
+        canvas_width, canvas_height = target_width, target_height
+        resampled = None
+        if screen_size is not None and tuple(screen_size) != (target_width, target_height):
+            canvas_width, canvas_height = screen_size
+            resampled, compiled = self._resample_for_screen(
+                image_data, compiled, target_width, target_height, canvas_width, canvas_height
+            )
+            image_data = resampled
+            height, width = image_data.shape
+
+        base, remainder = compiled.split(image_data, executor=self.executor)
+        if resampled is not None:
+            self._release(resampled)
+        offset = self._centered_offset((height, width), canvas_width, canvas_height)
+        return base, remainder, (canvas_height, canvas_width), offset
+
+    @staticmethod
+    def _centered_offset(shape, canvas_width, canvas_height):
+        """Return the (y, x) offset centering an image of ``shape`` on the canvas."""
+        height, width = shape
+        return (canvas_height - height) // 2, (canvas_width - width) // 2
+
+    def _resample_for_screen(self, image_data, compiled, target_width, target_height, screen_width, screen_height):
+        """Resample the print-ready 16-bit image once for a screen of a different size.
+
+        The image keeps its size relative to the target display (never upscaled),
+        exactly as letterboxing the full target canvas onto the screen would.
+
+        Returns:
+            tuple: (resampled print-ready image, CompiledLUT that only splits it); the
+            image is a temporary to be handed back with ``_release``
+        """
+        start = time.perf_counter()
+
+        scale = min(screen_height / target_height, screen_width / target_width, 1.0)
+        height, width = image_data.shape
+        new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+        print_ready = self._acquire((height, width), np.uint16)
+        compiled.apply(image_data, out=print_ready, executor=self.executor)
+        if new_size != (width, height):
+            resized = self._acquire((new_size[1], new_size[0]), np.uint16)
+            cv2.resize(print_ready, new_size, dst=resized, interpolation=cv2.INTER_AREA)
+            self._release(print_ready)
+            print_ready = resized
+
+        self.last_resample_info = {
+            'scale': round(scale, 4),
+            'source_size': (width, height),
+            'resampled_size': new_size,
+            'screen_size': (screen_width, screen_height),
+            'resample_ms': round((time.perf_counter() - start) * 1000, 1)
+        }
+
+        # LUT and inversion are already applied; only the 12-bit split remains
+        return print_ready, self._split_only_tables()
+
+    def _acquire(self, shape, dtype):
+        """Get a temporary buffer from the buffer pool, or allocate one without a pool."""
+        if self.buffer_pool is None:
+            return np.empty(shape, dtype=dtype)
+        return self.buffer_pool.acquire(shape, dtype)
+
+    def _release(self, *buffers):
+        """Hand temporaries back to the buffer pool, if there is one."""
+        if self.buffer_pool is not None:
+            self.buffer_pool.release(*buffers)
+
+    def store_frame_set(self, entry):
+        """Write prepared dither planes to the frame cache.
+
+        Args:
+            entry (tuple): (key, base, remainder, metadata), as left in ``last_frame_cache_entry``
+
+        Returns:
+            bool: Whether the planes were stored.
+        """
+        if self.frame_cache is None:
+            return False
+        return self.frame_cache.put(*entry)
+
+    @staticmethod
+    def _materialize_cycle(frame_source):
+        """List a deduplicated frame source's frames once per cycle position, building each unique frame once.
 
-        image_12bit = (canvas >> 4).astype(np.uint16)
-        base = (image_12bit >> 4).astype(np.uint8)
-        remainder = image_12bit & 0xF
+        A frame listed at more than one position is one shared array, made
+        read-only so writing to one position cannot silently change the others.
+        """
+        unique = frame_source.materialize()
+        for index in set(frame_source.schedule):
+            if frame_source.schedule.count(index) > 1:
+                unique[index].flags.writeable = False
+        return [unique[index] for index in frame_source.schedule]
+
+    def generate_print_frames(self, image_data, lut_data, target_width=7680, target_height=4320, num_frames=16):
+        """Generate dithered 8-bit print frames directly from a raw image and LUT.
+
+        Produces the same frames as ``generate_dithered_frames_from_array`` applied
+        to ``prepare_print_image(image_data, lut_data)``, using the compiled print
+        tables instead of full-frame 16-bit temporaries.
+
+        Args:
+            image_data (numpy.ndarray): Input image data (16-bit grayscale)
+            lut_data (numpy.ndarray or CompiledLUT): LUT data for color correction
+            target_width (int): Display width in pixels
+            target_height (int): Display height in pixels
+            num_frames (int): Number of frames per cycle (at most 16)
+
+        Returns:
+            list[numpy.ndarray]: 8-bit frames sized for the target display
+            (identical consecutive frames share one read-only array)
+        """
+        return self._materialize_cycle(
+            self.create_frame_source(image_data, lut_data, target_width, target_height, num_frames)
+        )
+
+    def create_frame_source(self, image_data, lut_data, target_width=7680, target_height=4320,
+                            num_frames=None, ring_size=2, dither_mode=None, screen_size=None, image_key=None,
+                            deduplicate=True, defer_cache_store=False):
+        """Create an on-demand frame source instead of materializing every frame.
+
+        Only the base and remainder planes of the image window are kept; frames
+        are filled into a small ring of pre-blackened buffers as the printing
+        loop requests them, touching only the image rectangle.
 
-        frames = []
-        for f in range(num_frames):
-            dithered = base.astype(np.uint16) + (remainder >= f).astype(np.uint16)
-            clipped = np.clip(dithered, 0, 255).astype(np.uint8)
-            frames.append(clipped)
+        With a frame cache and an ``image_key``, the planes are looked up on disk
+        by image, LUT and geometry first, and stored there after being prepared
+        (see ``last_frame_cache_hit``). The dither mode is not part of the key:
+        every mode is built from the same planes. Writing the planes takes
+        about as long as preparing them, so callers on the way to an exposure
+        pass ``defer_cache_store`` and hand ``last_frame_cache_entry`` to
+        ``store_frame_set`` once printing has started.
+
+        Consecutive frames that no remainder value in the image tells apart
+        are merged into one frame with their combined duration, so low-key and
+        high-key images need fewer frames, pixmaps and display updates.
+
+        Args:
+            image_data (numpy.ndarray): Input image data (16-bit grayscale)
+            lut_data (numpy.ndarray or CompiledLUT): LUT data for color correction
+            target_width (int): Display width in pixels
+            target_height (int): Display height in pixels
+            num_frames (int, optional): Frames per cycle in temporal mode (at most 16)
+            ring_size (int): Number of reusable output buffers
+            dither_mode (str, optional): Dithering mode; defaults to ``self.dither_mode``
+            screen_size (tuple, optional): Actual (width, height) of the print screen;
+                frames are dithered at this resolution (see ``prepare_dither_window``)
+            image_key (str, optional): Content hash of the image (see ``FrameSetCache.hash_image``)
+            deduplicate (bool): Merge identical consecutive frames (see ``DitheredFrameSource``)
+            defer_cache_store (bool): Leave newly prepared planes in ``last_frame_cache_entry``
+                instead of writing them to the frame cache
+
+        Returns:
+            DitheredFrameSource: Frame sequence sized for the print screen
+        """
+        compiled = self.compile_lut(lut_data)
+        self.last_frame_cache_hit = False
+        self.last_frame_cache_entry = None
+
+        key = cached = None
+        if self.frame_cache is not None and image_key is not None:
+            screen = tuple(screen_size) if screen_size is not None else (target_width, target_height)
+            key = FrameSetCache.make_key(
+                image_key, compiled.content_hash, compiled.invert, (target_width, target_height), screen
+            )
+            cached = self.frame_cache.get(key)
+
+        if cached is not None:
+            base, remainder, metadata = cached
+            canvas_shape, offset = tuple(metadata['canvas_shape']), tuple(metadata['offset'])
+            self.last_resample_info = None
+            self.last_frame_cache_hit = True
+        else:
+            base, remainder, canvas_shape, offset = self.prepare_dither_window(
+                image_data, compiled, target_width, target_height, screen_size
+            )
+            if key is not None:
+                entry = (key, base, remainder, {'canvas_shape': canvas_shape, 'offset': offset})
+                if defer_cache_store:
+                    self.last_frame_cache_entry = entry
+                else:
+                    self.store_frame_set(entry)
 
-        return frames
\ No newline at end of file
+        return DitheredFrameSource(
+            base, remainder, num_frames, ring_size, mode=dither_mode or self.dither_mode, executor=self.executor,
+            canvas_shape=canvas_shape, offset=offset, pool=self.buffer_pool, deduplicate=deduplicate
+        )
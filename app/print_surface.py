@@ -0,0 +1,106 @@
+"""Print surface widget for the Darkroom Enlarger Application.
+
+The print surface is the widget that puts exposure frames on the secondary
+display. It paints the current frame directly in ``paintEvent`` at 1:1 with
+no scaling, no size hints and no layout involvement.
+"""
+import time
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QPainter, QRegion
+from PyQt6.QtWidgets import QWidget
+
+
+class PrintSurface(QWidget):
+    """An opaque widget that blits the current frame pixmap and measures each paint."""
+
+    def __init__(self, parent=None):
+        """Initialize the print surface.
+
+        Args:
+            parent (QWidget, optional): Parent widget.
+        """
+        super().__init__(parent)
+        # Every paint covers the whole surface, so Qt need not clear the background first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+
+        self._pixmap = None
+        self._paint_times_ns = []
+        self._frame_pixels = []  # Pixels scheduled for repaint per frame change
+
+    def set_pixmap(self, pixmap, dirty_rects=None):
+        """Show a new frame and schedule a repaint.
+
+        Args:
+            pixmap (QPixmap): Frame to display, centered at 1:1 scale.
+            dirty_rects (list[tuple], optional): (x, y, width, height) rectangles, in
+                frame coordinates, outside of which the new frame equals the one
+                currently shown. Only these regions are repainted; an empty list
+                repaints nothing. Ignored if the frame size changes.
+        """
+        previous = self._pixmap
+        self._pixmap = pixmap
+
+        if dirty_rects is None or previous is None or previous.size() != pixmap.size():
+            self._frame_pixels.append(pixmap.width() * pixmap.height())
+            self.update()
+            return
+
+        x, y = self._frame_origin(pixmap)
+        region = QRegion()
+        pixels = 0
+        for rect_x, rect_y, width, height in dirty_rects:
+            region = region.united(QRect(x + rect_x, y + rect_y, width, height))
+            pixels += width * height
+        self._frame_pixels.append(pixels)
+        if not region.isEmpty():
+            self.update(region)
+
+    def clear(self):
+        """Remove the current frame, leaving the surface black."""
+        self._pixmap = None
+        self.update()
+
+    def _frame_origin(self, pixmap):
+        """Return the (x, y) widget position of a centered frame."""
+        return (self.width() - pixmap.width()) // 2, (self.height() - pixmap.height()) // 2
+
+    def paintEvent(self, event):
+        """Blit the exposed part of the current frame, filling any uncovered area black."""
+        start_ns = time.perf_counter_ns()
+
+        painter = QPainter(self)
+        pixmap = self._pixmap
+        if pixmap is None:
+            painter.fillRect(event.rect(), Qt.GlobalColor.black)
+        else:
+            x, y = self._frame_origin(pixmap)
+            if x > 0 or y > 0:
+                painter.fillRect(event.rect(), Qt.GlobalColor.black)
+            # Qt clips to the exposed region; only its bounding box is blitted
+            target = event.rect().intersected(QRect(x, y, pixmap.width(), pixmap.height()))
+            painter.drawPixmap(target, pixmap, target.translated(-x, -y))
+        painter.end()
+
+        self._paint_times_ns.append(time.perf_counter_ns() - start_ns)
+
+    def get_paint_stats(self):
+        """Get the cost of the paints since the last reset.
+
+        Returns:
+            dict: Paint count, mean/max paint time in ms, and the mean number of
+            pixels scheduled for repaint per frame change.
+        """
+        samples = self._paint_times_ns
+        pixels = self._frame_pixels
+        return {
+            'paints': len(samples),
+            'mean_ms': round(sum(samples) / len(samples) / 1e6, 3) if samples else 0.0,
+            'max_ms': round(max(samples) / 1e6, 3) if samples else 0.0,
+            'mean_pixels_per_frame': round(sum(pixels) / len(pixels)) if pixels else 0
+        }
+
+    def reset_paint_stats(self):
+        """Discard recorded paint times and pixel counts."""
+        self._paint_times_ns = []
+        self._frame_pixels = []
@@ -0,0 +1,220 @@
+"""Dependency-tracked processing stages for the Darkroom Enlarger Application.
+
+The controller's pipeline (load → LUT → process → frames → present) is a
+small graph of named stages. Inputs carry version stamps; a derived stage
+remembers the versions of the inputs it was computed from and is recomputed
+only when one of them has changed. Stale values are dropped as soon as an
+upstream input changes, so a superseded full-resolution image or frame set
+never lingers in memory or gets reused by mistake.
+"""
+import itertools
+import threading
+
+
+class _Node:
+    """One input or derived stage of a StageGraph."""
+
+    def __init__(self, name, inputs=(), func=None):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.func = func
+        self.value = None
+        self.version = 0  # 0: no value yet
+        self.input_versions = None
+        self.dependents = []
+        self.lock = threading.Lock()  # Serializes computation of this stage
+
+
+class StageGraph:
+    """A graph of named stages that recomputes only what is out of date.
+
+    Input stages are set with ``set``; derived stages are declared with
+    ``add_stage`` and computed on demand by ``get``. Values are computed on
+    whichever thread calls ``get`` (typically a background worker); ``peek``
+    and ``version`` never compute and are cheap to call from the UI thread.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._nodes = {}
+        self._versions = itertools.count(1)
+        self._lock = threading.Lock()  # Guards values and version stamps
+        self.computations = {}  # Stage name -> number of times computed
+
+    def add_input(self, name, value=None):
+        """Declare an input stage.
+
+        Args:
+            name (str): Stage name
+            value: Initial value; None leaves the input unset
+        """
+        self._add_node(_Node(name))
+        if value is not None:
+            self.set(name, value)
+
+    def add_stage(self, name, inputs, func):
+        """Declare a derived stage.
+
+        Args:
+            name (str): Stage name
+            inputs (list[str]): Names of already declared stages it depends on
+            func (callable): Computes the value from the input values, in order
+
+        Raises:
+            ValueError: If an input stage has not been declared.
+        """
+        missing = [input_name for input_name in inputs if input_name not in self._nodes]
+        if missing:
+            raise ValueError(f"Stage {name!r} depends on undeclared stages {missing}")
+
+        node = _Node(name, inputs, func)
+        self._add_node(node)
+        for input_name in inputs:
+            self._nodes[input_name].dependents.append(node)
+
+    def set(self, name, value):
+        """Set an input, invalidating every stage downstream of it.
+
+        Setting an input to a value equal to its current one is a no-op, so
+        downstream results stay valid.
+
+        Args:
+            name (str): Input stage name
+            value: New value
+        """
+        node = self._nodes[name]
+        with self._lock:
+            if node.version and _same(node.value, value):
+                return
+            node.value = value
+            node.version = next(self._versions)
+            self._drop_dependents(node)
+
+    def get(self, name):
+        """Return a stage's value, computing it and any out-of-date inputs first.
+
+        Args:
+            name (str): Stage name
+
+        Returns:
+            The up-to-date value.
+
+        Raises:
+            ValueError: If an input stage upstream has not been set.
+        """
+        return self._get(name)[0]
+
+    def _get(self, name):
+        """Return a stage's up-to-date value with the version stamp it was read at.
+
+        The value and its stamp are read together under the graph lock, so a
+        stamp always identifies the value it is returned with. A result whose
+        inputs changed while it was computed is returned with stamp 0, which
+        matches no current version.
+        """
+        node = self._nodes[name]
+        if node.func is None:
+            with self._lock:
+                if not node.version:
+                    raise ValueError(f"Input {name!r} has not been set")
+                return node.value, node.version
+
+        with node.lock:
+            with self._lock:
+                if self._is_current(node):
+                    return node.value, node.version
+
+            values, input_versions = [], []
+            for input_name in node.inputs:
+                value, version = self._get(input_name)
+                values.append(value)
+                input_versions.append(version)
+            input_versions = tuple(input_versions)
+
+            value = node.func(*values)
+
+            with self._lock:
+                self.computations[name] = self.computations.get(name, 0) + 1
+                # Keep the result only if every input is still the value it was computed from
+                if all(self._is_current(self._nodes[input_name]) for input_name in node.inputs) and \
+                        input_versions == tuple(self._nodes[input_name].version for input_name in node.inputs):
+                    node.value = value
+                    node.version = next(self._versions)
+                    node.input_versions = input_versions
+                    return value, node.version
+            return value, 0
+
+    def peek(self, name):
+        """Return a stage's value if it is up to date, without computing anything.
+
+        Args:
+            name (str): Stage name
+
+        Returns:
+            The value, or None if the stage is unset or out of date.
+        """
+        node = self._nodes[name]
+        with self._lock:
+            return node.value if self._is_current(node) else None
+
+    def version(self, name):
+        """Return the version stamp of a stage's current value.
+
+        Args:
+            name (str): Stage name
+
+        Returns:
+            int or None: Version stamp, or None if the stage is unset or out of date.
+        """
+        node = self._nodes[name]
+        with self._lock:
+            return node.version if self._is_current(node) else None
+
+    def is_current(self, name):
+        """Check whether a stage holds an up-to-date value.
+
+        Args:
+            name (str): Stage name
+
+        Returns:
+            bool: True if ``get`` would return without computing.
+        """
+        with self._lock:
+            return self._is_current(self._nodes[name])
+
+    def _add_node(self, node):
+        """Register a node under a unique name."""
+        if node.name in self._nodes:
+            raise ValueError(f"Stage {node.name!r} already declared")
+        self._nodes[node.name] = node
+
+    def _is_current(self, node):
+        """Whether a node's value is valid for the current input versions (lock held)."""
+        if not node.version:
+            return False
+        if node.func is None:
+            return True
+        for input_name, stamped in zip(node.inputs, node.input_versions):
+            upstream = self._nodes[input_name]
+            if not self._is_current(upstream) or upstream.version != stamped:
+                return False
+        return True
+
+    def _drop_dependents(self, node):
+        """Release the values of every stage downstream of a node (lock held)."""
+        for dependent in node.dependents:
+            if dependent.version:
+                dependent.value = None
+                dependent.version = 0
+                dependent.input_versions = None
+                self._drop_dependents(dependent)
+
+
+def _same(old, new):
+    """Whether two input values are interchangeable (identity, or equality for plain values)."""
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,89 @@
+"""Row-band parallelism for per-pixel image stages.
+
+LUT gathers, inversion, the 12-bit split and dither compares touch every
+pixel independently, and numpy releases the GIL while it runs them. A tile
+executor splits such a stage into horizontal row bands and runs the bands
+on a thread pool. Each band writes its own rows of a shared output, so the
+result is byte-identical to running the stage over the whole image at once.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TileExecutor:
+    """Runs a per-pixel stage over row bands of an image on a thread pool.
+
+    With one worker (the default for components created without an
+    executor) stages run inline over the whole image, exactly as before.
+    """
+
+    # Images smaller than this many pixels per band are not worth splitting
+    min_band_pixels = 1 << 18
+
+    def __init__(self, workers=None):
+        """Initialize the executor.
+
+        Args:
+            workers (int, optional): Number of threads. Defaults to os.cpu_count().
+
+        Raises:
+            ValueError: If workers is less than one.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enlarger-tile") if workers > 1 else None
+
+    def bands(self, shape):
+        """Split an image shape into contiguous row bands.
+
+        Args:
+            shape (tuple): Image shape; rows are split along the first axis
+
+        Returns:
+            list[slice]: Row slices covering every row exactly once
+        """
+        height = shape[0] if shape else 1
+        pixels = 1
+        for extent in shape:
+            pixels *= extent
+
+        count = max(1, min(self.workers, height, pixels // self.min_band_pixels))
+        edges = [height * i // count for i in range(count + 1)]
+        return [slice(edges[i], edges[i + 1]) for i in range(count)]
+
+    def run(self, func, shape):
+        """Call ``func(rows)`` for every row band of ``shape`` and wait for all of them.
+
+        ``func`` must only read and write the rows it is given.
+
+        Args:
+            func (callable): Stage body taking a row ``slice``
+            shape (tuple): Shape of the image being processed
+
+        Raises:
+            Exception: The first exception raised by any band.
+        """
+        bands = self.bands(shape)
+        if self._pool is None or len(bands) == 1:
+            for rows in bands:
+                func(rows)
+            return
+
+        futures = [self._pool.submit(func, rows) for rows in bands]
+        for future in futures:
+            future.result()
+
+    def shutdown(self, wait=True):
+        """Stop the thread pool.
+
+        Args:
+            wait (bool): Wait for bands already running; bands not yet started
+                are cancelled when False.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=not wait)
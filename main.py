@@ -21,6 +21,7 @@ if __name__ == '__main__':
     app = QApplication(sys.argv)
     main_window = MainWindow()
     controller = Controller(main_window) # Instantiate controller
+    app.aboutToQuit.connect(controller.shutdown)  # Stop background threads on exit
     main_window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,131 @@
+import threading
+import time
+import pytest
+from app.background_worker import BackgroundWorker, CancellationToken, TaskCancelled
+
+
+# -------------------- BackgroundWorker Tests --------------------
+
+def _wait_until(qapp, condition, timeout_s=5.0):
+    deadline = time.monotonic() + timeout_s
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.001)
+    return condition()
+
+
+def test_cancellation_token_raises_once_cancelled():
+    # Given a fresh token
+    token = CancellationToken()
+    token.raise_if_cancelled()
+
+    # When it is cancelled
+    token.cancel()
+
+    # Then it should report and raise the cancellation
+    assert token.cancelled
+    with pytest.raises(TaskCancelled):
+        token.raise_if_cancelled()
+
+
+def test_worker_delivers_result_on_ui_thread(qapp):
+    # Given a worker and a task computed off the UI thread
+    worker = BackgroundWorker()
+    results = []
+    task_threads = []
+
+    def task(token, report_progress):
+        task_threads.append(threading.current_thread())
+        return 42
+
+    # When the task completes
+    worker.submit('load', task, lambda value: results.append((value, threading.current_thread())))
+
+    # Then the result should arrive on the UI thread
+    assert _wait_until(qapp, lambda: results)
+    assert results[0] == (42, threading.main_thread())
+    assert task_threads[0] is not threading.main_thread()
+    assert not worker.is_busy('load')
+    worker.shutdown()
+
+
+def test_worker_delivers_errors_and_progress(qapp):
+    # Given a task that reports progress then fails
+    worker = BackgroundWorker()
+    progress = []
+    errors = []
+    worker.progress.connect(lambda name, percent: progress.append((name, percent)))
+
+    def task(token, report_progress):
+        report_progress(50)
+        raise ValueError("bad image")
+
+    # When it runs
+    worker.submit('process', task, lambda value: None, errors.append)
+
+    # Then the error and progress should reach the UI thread
+    assert _wait_until(qapp, lambda: errors)
+    assert isinstance(errors[0], ValueError)
+    assert ('process', 50) in progress
+    worker.shutdown()
+
+
+def test_worker_supersedes_task_with_same_name(qapp):
+    # Given a slow task that is still running
+    worker = BackgroundWorker()
+    release = threading.Event()
+    results = []
+
+    def slow(token, report_progress):
+        release.wait(5)
+        token.raise_if_cancelled()
+        return "old"
+
+    worker.submit('print', slow, results.append)
+
+    # When a newer task with the same name is submitted
+    worker.submit('print', lambda token, report_progress: "new", results.append)
+    release.set()
+
+    # Then only the newer result should be delivered
+    assert _wait_until(qapp, lambda: results)
+    _wait_until(qapp, lambda: False, timeout_s=0.05)
+    assert results == ["new"]
+    worker.shutdown()
+
+
+def test_worker_cancel_discards_outcome(qapp):
+    # Given a running task
+    worker = BackgroundWorker()
+    release = threading.Event()
+    results = []
+    token = worker.submit('load', lambda token, report_progress: release.wait(5), results.append)
+
+    # When it is cancelled before finishing
+    worker.cancel('load')
+    release.set()
+    _wait_until(qapp, lambda: False, timeout_s=0.05)
+
+    # Then nothing should be delivered
+    assert token.cancelled
+    assert results == []
+    assert not worker.is_busy('load')
+    worker.shutdown()
+
+
+def test_shutdown_cancels_running_tasks(qapp):
+    # Given a running task
+    worker = BackgroundWorker()
+    release = threading.Event()
+    results = []
+    token = worker.submit('print', lambda token, report_progress: release.wait(5), results.append)
+
+    # When the worker is shut down before it finishes
+    worker.shutdown()
+    release.set()
+    _wait_until(qapp, lambda: False, timeout_s=0.05)
+
+    # Then the task should be cancelled and its outcome never delivered
+    assert token.cancelled
+    assert results == []
+    assert not worker.is_busy('print')
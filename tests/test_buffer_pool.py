@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from app.buffer_pool import BufferPool
+from app.dithered_frame_source import DitheredFrameSource
+from app.print_image_manager import PrintImageManager
+
+
+# -------------------- BufferPool Tests --------------------
+
+def test_released_buffer_is_reused():
+    # Given a pool and a released buffer
+    pool = BufferPool()
+    buffer = pool.acquire((4, 6), np.uint8)
+    pool.release(buffer)
+
+    # When acquiring the same shape and dtype, then another dtype
+    again = pool.acquire((4, 6), np.uint8)
+    other = pool.acquire((4, 6), np.uint16)
+
+    # Then only the matching request should reuse the buffer
+    assert again is buffer
+    assert other is not buffer
+    assert pool.get_stats()['hits'] == 1
+    assert pool.get_stats()['misses'] == 2
+
+
+def test_zeroed_reuse_is_blackened():
+    # Given a released buffer holding data
+    pool = BufferPool()
+    buffer = pool.acquire((3, 3), np.uint8)
+    buffer.fill(200)
+    pool.release(buffer)
+
+    # When acquiring it zeroed
+    again = pool.acquire((3, 3), np.uint8, zeroed=True)
+
+    # Then it should be all black
+    assert again is buffer
+    assert not again.any()
+
+
+def test_pool_drops_oldest_beyond_max_bytes():
+    # Given a pool keeping at most two 100-byte buffers
+    pool = BufferPool(max_bytes=200)
+    first, second, third = (pool.acquire((100,), np.uint8) for _ in range(3))
+
+    # When releasing three
+    pool.release(first, second, third)
+
+    # Then the least recently released should have been dropped
+    assert pool.get_stats()['free_bytes'] == 200
+    assert pool.acquire((100,), np.uint8) is third
+    assert pool.acquire((100,), np.uint8) is second
+
+
+def test_release_rejects_views_and_double_release():
+    # Given a pool and a buffer
+    pool = BufferPool()
+    buffer = pool.acquire((4, 4), np.uint8)
+
+    # When / Then releasing a view of it, or releasing it twice, should fail
+    with pytest.raises(ValueError, match="views"):
+        pool.release(buffer[1:3])
+    pool.release(buffer)
+    with pytest.raises(ValueError, match="already"):
+        pool.release(buffer)
+
+
+def test_back_to_back_prints_reuse_frame_buffers():
+    # Given a print manager sharing a pool, and a frame source whose ring was used
+    pool = BufferPool()
+    manager = PrintImageManager(buffer_pool=pool)
+    image = np.full((40, 60), 30000, dtype=np.uint16)
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    first = manager.create_frame_source(image, lut, target_width=96, target_height=54, screen_size=(64, 36))
+    expected = first.materialize()
+    ring = {id(first[f]) for f in range(2)}
+
+    # When the print ends and a second print of another image starts
+    first.release()
+    misses = pool.get_stats()['misses']
+    second = manager.create_frame_source(image // 2, lut, target_width=96, target_height=54, screen_size=(64, 36))
+    frames = [second[f] for f in range(2)]
+
+    # Then the ring and the resampling temporaries should all come from the pool
+    assert {id(frame) for frame in frames} == ring
+    assert pool.get_stats()['misses'] == misses
+    # And the first source should still produce the same frames from a fresh ring
+    assert all(np.array_equal(first[f], expected[f]) for f in range(len(first)))
+
+
+def test_frame_source_without_pool_drops_ring_on_release():
+    # Given a frame source without a pool that has filled a frame
+    source = DitheredFrameSource(np.zeros((2, 2), np.uint8), np.zeros((2, 2), np.uint8))
+    source[0]
+
+    # When releasing it
+    source.release()
+
+    # Then it should hold only its planes
+    assert source.nbytes == 8
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+from app import compiled_lut
+from app.compiled_lut import CompiledLUT, gather
+from app.print_image_manager import PrintImageManager
+
+
+# -------------------- CompiledLUT Tests --------------------
+
+def test_apply_matches_lut_then_inversion():
+    # Given a non-trivial LUT and an image covering every 16-bit value
+    lut = (np.arange(65536, dtype=np.uint32) * 3 // 4).astype(np.uint16).reshape((256, 256))
+    image = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    manager = PrintImageManager()
+
+    # When applying the compiled print table
+    result = CompiledLUT(lut).apply(image)
+
+    # Then it should equal LUT application followed by inversion
+    expected = manager.invert_image(manager.apply_lut(image, lut))
+    assert np.array_equal(result, expected)
+
+
+def test_split_never_needs_clipping():
+    # Given an identity LUT without inversion so bright values saturate the base
+    lut = np.arange(65536, dtype=np.uint16)
+    compiled = CompiledLUT(lut, invert=False)
+
+    # When splitting the brightest values
+    base, remainder = compiled.split(np.array([[65535, 65280]], dtype=np.uint16))
+
+    # Then base + 1 must stay within 8 bits on every frame
+    assert base.dtype == np.uint8 and remainder.dtype == np.uint8
+    assert int(base.max()) + 1 <= 255
+    assert np.all(remainder == 15)
+
+
+def test_compiled_lut_rejects_wrong_size():
+    # Given a LUT with the wrong number of entries
+    # When compiling it
+    # Then it should raise ValueError
+    with pytest.raises(ValueError, match="65536"):
+        CompiledLUT(np.arange(256, dtype=np.uint16))
+
+
+def _baseline_frames(image, lut, target_width, target_height, num_frames=16):
+    # LUT → invert → pad → 12-bit split → dither, as originally written, with a black letterbox
+    printed = ~lut.flatten()[image]
+    height, width = printed.shape
+    y_offset, x_offset = (target_height - height) // 2, (target_width - width) // 2
+    window = (slice(y_offset, y_offset + height), slice(x_offset, x_offset + width))
+    canvas = np.zeros((target_height, target_width), dtype=np.uint16)
+    canvas[window] = printed
+
+    image_12bit = canvas >> 4
+    base = (image_12bit >> 4).astype(np.uint8)
+    remainder = image_12bit & 0xF
+    frames = []
+    for f in range(num_frames):
+        dithered = np.clip(base.astype(np.uint16) + (remainder >= f), 0, 255).astype(np.uint8)
+        letterboxed = np.zeros_like(dithered)
+        letterboxed[window] = dithered[window]
+        frames.append(letterboxed)
+    return frames
+
+
+def test_generate_print_frames_matches_legacy_pipeline():
+    # Given a random image smaller than the target and a non-linear LUT
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 65536, size=(60, 90), dtype=np.uint16)
+    image[0, :4] = [0, 65535, 255, 256]
+    lut = (np.sqrt(np.arange(65536) / 65535.0) * 65535).astype(np.uint16).reshape((256, 256))
+    manager = PrintImageManager()
+
+    # When generating frames through the compiled tables, and from the print-ready image
+    frames = manager.generate_print_frames(image, lut, target_width=128, target_height=72)
+    from_array = manager.generate_dithered_frames_from_array(
+        manager.prepare_print_image(image, lut), target_width=128, target_height=72
+    )
+
+    # Then both should be byte-identical to the original LUT → invert → dither arithmetic
+    expected = _baseline_frames(image, lut, 128, 72)
+    assert len(frames) == len(from_array) == len(expected)
+    for frame, array_frame, reference in zip(frames, from_array, expected):
+        assert frame.dtype == np.uint8
+        assert np.array_equal(frame, reference)
+        assert np.array_equal(array_frame, reference)
+
+
+def test_compile_lut_reuses_cached_tables():
+    # Given a print manager and two equal LUT arrays
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    manager = PrintImageManager()
+
+    # When compiling both
+    first = manager.compile_lut(lut)
+    second = manager.compile_lut(lut.copy())
+
+    # Then the compiled tables should be shared
+    assert first is second
+
+
+def test_split_turns_rotated_view_into_canvas():
+    # Given a portrait image turned to landscape as a view
+    stored = np.random.default_rng(5).integers(0, 65536, size=(30, 20), dtype=np.uint16)
+    compiled = CompiledLUT(np.arange(65536, dtype=np.uint16).reshape(256, 256))
+    manager = PrintImageManager()
+
+    # When preparing dither planes from the view and from a turned copy
+    view_planes = manager.prepare_dither_window(np.rot90(stored, -1), compiled, 64, 48)
+    copy_planes = manager.prepare_dither_window(np.ascontiguousarray(np.rot90(stored, -1)), compiled, 64, 48)
+
+    # Then the gather should produce identical planes and placement
+    assert all(np.array_equal(a, b) for a, b in zip(view_planes, copy_planes))
+
+
+def test_gather_in_row_chunks_matches_take(monkeypatch):
+    # Given chunks of a few rows and a rotated (non-contiguous) view to index
+    monkeypatch.setattr(compiled_lut, "GATHER_CHUNK_PIXELS", 20)
+    table = (np.arange(65536, dtype=np.uint32) * 7 % 65536).astype(np.uint16)
+    image = np.rot90(np.random.default_rng(2).integers(0, 65536, size=(13, 9), dtype=np.uint16))
+    out = np.empty(image.shape, dtype=np.uint16)
+
+    # When gathering into a destination chunk by chunk
+    result = gather(table, image, out)
+
+    # Then every row should be looked up exactly as one full take would
+    assert result is out
+    assert np.array_equal(result, np.take(table, image))
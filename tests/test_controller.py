@@ -0,0 +1,122 @@
+import numpy as np
+import tifffile
+from app.background_worker import CancellationToken
+from app.controller import Controller
+from app.main_window import MainWindow
+from app.view_interfaces import MockFileDialog
+
+
+# -------------------- Controller Pipeline Tests --------------------
+
+class _SyncWorker:
+    """Runs each task to completion as soon as it is submitted."""
+
+    def __init__(self):
+        self.cancelled = []
+
+    def submit(self, name, func, on_result, on_error=None):
+        token = CancellationToken()
+        on_result(func(token, lambda percent: None))
+        return token
+
+    def cancel(self, *names):
+        self.cancelled.extend(names)
+
+    def is_busy(self, name):
+        return False
+
+    def shutdown(self):
+        pass
+
+
+def _controller():
+    dialog = MockFileDialog()
+    controller = Controller(MainWindow(file_dialog=dialog), frame_cache_max_bytes=0)
+    controller.worker.shutdown()
+    controller.worker = _SyncWorker()
+    controller.proxy_processing = False
+    controller.main_window.is_test_mode_enabled = lambda: False
+    started = []
+    controller._start_secondary_print = lambda *args: started.append(args)
+    return controller, dialog, started
+
+
+def _write_image(tmp_path, name, seed):
+    path = str(tmp_path / name)
+    tifffile.imwrite(path, np.random.default_rng(seed).integers(0, 65536, size=(48, 64), dtype=np.uint16))
+    return path
+
+
+def _write_lut(tmp_path, name, scale):
+    path = str(tmp_path / name)
+    tifffile.imwrite(path, (np.arange(65536, dtype=np.uint32) * scale // 4).astype(np.uint16).reshape((256, 256)))
+    return path
+
+
+def _select(controller, dialog, image_path=None, lut_path=None):
+    if image_path is not None:
+        dialog.return_path = image_path
+        controller.select_image()
+    if lut_path is not None:
+        dialog.return_path = lut_path
+        controller.select_lut()
+
+
+def _print(controller, exposure_s):
+    controller.main_window.exposure_input.setText(str(exposure_s))
+    controller.start_print()
+
+
+def test_reprint_with_new_exposure_reuses_frames(qapp, tmp_path):
+    # Given a printed image and LUT
+    controller, dialog, started = _controller()
+    _select(controller, dialog, _write_image(tmp_path, "a.tif", 1), _write_lut(tmp_path, "lut.tif", 3))
+    _print(controller, 10)
+    computations = dict(controller.pipeline.computations)
+
+    # When printing again with only the exposure time changed
+    _print(controller, 20)
+
+    # Then the prepared frames should be reused without recomputing any stage
+    assert controller.pipeline.computations == computations
+    assert started[1][0] is started[0][0]
+    assert started[1][-2:] == (20000, True)
+    controller.shutdown()
+
+
+def test_selecting_a_lut_keeps_the_decoded_image(qapp, tmp_path):
+    # Given a processed and printed image
+    controller, dialog, started = _controller()
+    _select(controller, dialog, _write_image(tmp_path, "a.tif", 1), _write_lut(tmp_path, "lut.tif", 3))
+    controller.process_image()
+    _print(controller, 10)
+
+    # When another LUT is selected
+    _select(controller, dialog, lut_path=_write_lut(tmp_path, "other.tif", 2))
+
+    # Then LUT-dependent stages should be invalidated without re-decoding the image
+    pipeline = controller.pipeline
+    assert pipeline.computations['image'] == 1 and pipeline.is_current('image')
+    assert pipeline.computations['print_table'] == 2
+    assert not pipeline.is_current('processed')
+    assert not pipeline.is_current('frames')
+    controller.shutdown()
+
+
+def test_selecting_an_image_invalidates_its_results(qapp, tmp_path):
+    # Given a processed and printed image
+    controller, dialog, started = _controller()
+    _select(controller, dialog, _write_image(tmp_path, "a.tif", 1), _write_lut(tmp_path, "lut.tif", 3))
+    controller.process_image()
+    _print(controller, 10)
+
+    # When another image is selected
+    _select(controller, dialog, image_path=_write_image(tmp_path, "b.tif", 2))
+
+    # Then it should be decoded and everything computed from the old image dropped
+    pipeline = controller.pipeline
+    assert pipeline.computations['image'] == 2
+    assert pipeline.computations['pyramid'] == 2
+    for stage in ('processed', 'processed_pyramid', 'image_hash', 'frames'):
+        assert not pipeline.is_current(stage)
+    controller.shutdown()
@@ -0,0 +1,193 @@
+import numpy as np
+import pytest
+from app.dithered_frame_source import DitheredFrameSource
+from app.print_image_manager import PrintImageManager
+
+
+# -------------------- DitheredFrameSource Tests --------------------
+
+def _gradient_image():
+    return np.tile(np.linspace(0, 65535, 256, dtype=np.uint16), (64, 1))
+
+
+def test_frame_source_matches_materialized_frames():
+    # Given a gradient image and an identity LUT
+    image = _gradient_image()
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    manager = PrintImageManager()
+
+    # When creating a frame source and the equivalent frame list
+    source = manager.create_frame_source(image, lut, target_width=320, target_height=96)
+    frames = manager.generate_print_frames(image, lut, target_width=320, target_height=96)
+
+    # Then every on-demand frame should equal the materialized one
+    assert len(source) == len(frames) == 16
+    for f, expected in enumerate(frames):
+        assert np.array_equal(source[f], expected)
+
+
+def test_frame_source_reuses_ring_buffers():
+    # Given a frame source with a two-buffer ring
+    base = np.zeros((4, 4), dtype=np.uint8)
+    remainder = np.full((4, 4), 7, dtype=np.uint8)
+    source = DitheredFrameSource(base, remainder, ring_size=2)
+
+    # When requesting three frames
+    first = source[0]
+    second = source[1]
+    third = source[2]
+
+    # Then the third frame should reuse the first buffer
+    assert third is first
+    assert second is not first
+    assert source.nbytes == base.nbytes + remainder.nbytes + 2 * base.nbytes
+
+
+def test_frame_source_raises_index_error_past_cycle():
+    # Given a frame source with 16 frames
+    source = DitheredFrameSource(np.zeros((2, 2), np.uint8), np.zeros((2, 2), np.uint8))
+
+    # When indexing past the cycle
+    # Then it should raise IndexError
+    with pytest.raises(IndexError):
+        source[16]
+
+
+def test_frame_source_rejects_mismatched_planes():
+    # Given planes of different shapes
+    # When creating a frame source
+    # Then it should raise ValueError
+    with pytest.raises(ValueError, match="equal shapes"):
+        DitheredFrameSource(np.zeros((2, 2), np.uint8), np.zeros((2, 3), np.uint8))
+
+
+def test_bitplane_mode_delivers_same_dose_as_temporal():
+    # Given planes covering every remainder value, including a saturated pixel
+    image = np.arange(0, 65536, 17, dtype=np.uint16)[:3840].reshape((60, 64))
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    manager = PrintImageManager()
+    temporal = manager.create_frame_source(image, lut, 64, 60, dither_mode=PrintImageManager.DITHER_TEMPORAL)
+    bitplane = manager.create_frame_source(image, lut, 64, 60, dither_mode=PrintImageManager.DITHER_BITPLANE)
+
+    # When integrating each frame's value over its display duration
+    def dose(source):
+        return sum(
+            duration * source[f].astype(np.int64)
+            for f, duration in enumerate(source.frame_durations)
+        )
+
+    # Then both modes should expose every pixel identically in 16 units with fewer bit-plane frames
+    assert len(bitplane) == 5
+    assert temporal.cycle_units == bitplane.cycle_units == 16
+    assert np.array_equal(dose(temporal), dose(bitplane))
+
+
+def test_bitplane_mode_rejects_custom_frame_count():
+    # Given bit-plane mode with a non-default frame count
+    # When creating the source
+    # Then it should raise ValueError
+    with pytest.raises(ValueError, match="Bit-plane"):
+        DitheredFrameSource(np.zeros((2, 2), np.uint8), np.zeros((2, 2), np.uint8),
+                            num_frames=16, mode=DitheredFrameSource.MODE_BITPLANE)
+
+
+@pytest.mark.parametrize("mode", DitheredFrameSource.MODES)
+def test_dirty_tiles_cover_every_changed_pixel(mode):
+    # Given planes that are uniform except for a noisy patch
+    rng = np.random.default_rng(1)
+    base = np.full((300, 500), 100, dtype=np.uint8)
+    remainder = np.full((300, 500), 5, dtype=np.uint8)
+    remainder[140:160, 260:300] = rng.integers(0, 16, size=(20, 40), dtype=np.uint8)
+    source = DitheredFrameSource(base, remainder, mode=mode)
+    frames = source.materialize()
+
+    for f in range(len(frames)):
+        # When looking up the dirty tiles of each transition
+        covered = np.zeros(base.shape, dtype=bool)
+        for x, y, width, height in source.dirty_tiles(f):
+            covered[y:y + height, x:x + width] = True
+
+        # Then every changed pixel should lie inside them
+        changed = frames[f] != frames[f - 1]
+        assert not np.any(changed & ~covered)
+
+    # And in temporal mode, transitions that leave the uniform area untouched should stay local
+    if mode == DitheredFrameSource.MODE_TEMPORAL:
+        assert sum(w * h for _, _, w, h in source.dirty_tiles(2)) < base.size // 4
+
+
+@pytest.mark.parametrize("mode", DitheredFrameSource.MODES)
+def test_letterbox_stays_black_and_clean(mode):
+    # Given planes covering a window in the middle of a wider canvas
+    rng = np.random.default_rng(3)
+    base = rng.integers(0, 255, size=(40, 60), dtype=np.uint8)
+    remainder = rng.integers(0, 16, size=(40, 60), dtype=np.uint8)
+    source = DitheredFrameSource(base, remainder, mode=mode, canvas_shape=(40, 100), offset=(0, 20))
+    full = DitheredFrameSource(base, remainder, mode=mode).materialize()
+
+    for f in range(len(source)):
+        # When filling each frame into the ring
+        frame = source[f]
+
+        # Then the window should hold the frame and the letterbox should be black
+        assert frame.shape == (40, 100)
+        assert np.array_equal(frame[:, 20:80], full[f])
+        assert not frame[:, :20].any() and not frame[:, 80:].any()
+
+        # And no dirty tile should reach into the letterbox
+        assert all(20 <= x and x + width <= 80 for x, _, width, _ in source.dirty_tiles(f))
+
+
+def test_frame_source_rejects_window_outside_canvas():
+    # Given planes wider than the remaining canvas
+    # When creating a frame source
+    # Then it should raise ValueError
+    with pytest.raises(ValueError, match="does not fit"):
+        DitheredFrameSource(np.zeros((4, 8), np.uint8), np.zeros((4, 8), np.uint8),
+                            canvas_shape=(4, 10), offset=(0, 4))
+
+
+@pytest.mark.parametrize("mode", DitheredFrameSource.MODES)
+def test_deduplicated_source_merges_identical_frames(mode):
+    # Given a low-key window whose remainders only take the values 0, 3 and 4
+    rng = np.random.default_rng(5)
+    base = rng.integers(0, 20, size=(200, 300), dtype=np.uint8)
+    remainder = rng.choice(np.array([0, 3, 4], dtype=np.uint8), size=(200, 300))
+    full = DitheredFrameSource(base, remainder, mode=mode)
+    expected = full.materialize()
+
+    # When creating a deduplicated frame source
+    source = DitheredFrameSource(base, remainder, mode=mode, deduplicate=True)
+    frames = source.materialize()
+
+    # Then fewer frames should cover the cycle, each shown for its merged duration
+    assert len(source) < len(full)
+    assert source.cycle_units == full.cycle_units
+    assert len(source.schedule) == len(full)
+    for position, index in enumerate(source.schedule):
+        assert np.array_equal(frames[index], expected[position])
+    assert all(not np.array_equal(frames[f], frames[f - 1]) for f in range(1, len(frames)))
+    durations = [sum(d for p, d in enumerate(full.frame_durations) if source.schedule[p] == f)
+                 for f in range(len(source))]
+    assert list(source.frame_durations) == durations
+
+    # And the dirty tiles should still cover every changed pixel
+    for f in range(len(frames)):
+        covered = np.zeros(base.shape, dtype=bool)
+        for x, y, width, height in source.dirty_tiles(f):
+            covered[y:y + height, x:x + width] = True
+        assert not np.any((frames[f] != frames[f - 1]) & ~covered)
+
+
+def test_generated_frame_list_shares_identical_frames():
+    # Given a uniform image, whose remainders all share one value
+    image = np.full((40, 60), 30000, dtype=np.uint16)
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    manager = PrintImageManager()
+
+    # When generating the frame list
+    frames = manager.generate_print_frames(image, lut, target_width=96, target_height=54)
+
+    # Then it should still list every cycle position, built from two unique frames
+    assert len(frames) == 16
+    assert len({id(frame) for frame in frames}) == 2
@@ -0,0 +1,96 @@
+import pytest
+from app.exposure_scheduler import ExposureScheduler
+
+
+# -------------------- ExposureScheduler Tests --------------------
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000
+
+    def __call__(self):
+        return self.now
+
+
+def test_scheduler_follows_frame_boundaries_on_time():
+    # Given four 10 ms frames and a 100 ms exposure on a controllable clock
+    clock = _FakeClock()
+    scheduler = ExposureScheduler([10_000_000] * 4, 100_000_000, clock=clock)
+
+    # When ticking exactly on each boundary
+    frame, delay = scheduler.start()
+    shown = [frame]
+    while True:
+        clock.now += delay
+        result = scheduler.tick()
+        if result is None:
+            break
+        frame, delay = result
+        shown.append(frame)
+
+    # Then every frame should be shown in order and the exposure end on time
+    assert shown == [0, 1, 2, 3] * 2 + [0, 1]
+    stats = scheduler.get_timing_stats()
+    assert stats['max_lateness_ms'] == 0
+    assert stats['elapsed_ms'] == 100
+    assert stats['frames_skipped'] == 0
+
+
+def test_scheduler_skips_frames_after_a_stall():
+    # Given four 10 ms frames and a 100 ms exposure
+    clock = _FakeClock()
+    scheduler = ExposureScheduler([10_000_000] * 4, 100_000_000, clock=clock)
+    scheduler.start()
+
+    # When the first tick arrives 25 ms late
+    clock.now += 35_000_000
+    frame, delay = scheduler.tick()
+
+    # Then it should jump to the frame due now and keep the original phase
+    assert frame == 3
+    assert delay == 5_000_000
+    stats = scheduler.get_timing_stats()
+    assert stats['frames_skipped'] == 2
+    assert stats['max_lateness_ms'] == 25
+
+
+def test_scheduler_holds_frame_on_early_wakeup():
+    # Given a running schedule
+    clock = _FakeClock()
+    scheduler = ExposureScheduler([10_000_000, 20_000_000], 100_000_000, clock=clock)
+    scheduler.start()
+
+    # When the timer fires 1 ms before the boundary
+    clock.now += 9_000_000
+    frame, delay = scheduler.tick()
+
+    # Then the current frame should be kept until the boundary
+    assert frame == 0
+    assert delay == 1_000_000
+    assert scheduler.get_timing_stats()['ticks'] == 0
+
+
+def test_scheduler_stops_on_wall_clock_time():
+    # Given a 50 ms exposure with long frames
+    clock = _FakeClock()
+    scheduler = ExposureScheduler([40_000_000, 40_000_000], 50_000_000, clock=clock)
+    scheduler.start()
+
+    # When ticking at the first boundary, the second frame is cut to the exposure end
+    clock.now += 40_000_000
+    frame, delay = scheduler.tick()
+    clock.now += delay
+
+    # Then the exposure should finish at exactly 50 ms
+    assert frame == 1
+    assert delay == 10_000_000
+    assert scheduler.tick() is None
+    assert scheduler.get_timing_stats()['elapsed_ms'] == 50
+
+
+def test_scheduler_rejects_empty_schedule():
+    # Given no frames
+    # When creating a scheduler
+    # Then it should raise ValueError
+    with pytest.raises(ValueError):
+        ExposureScheduler([], 1000)
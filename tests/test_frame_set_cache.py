@@ -0,0 +1,132 @@
+import os
+import numpy as np
+from app.frame_set_cache import FrameSetCache
+from app.print_image_manager import PrintImageManager
+
+
+# -------------------- FrameSetCache Tests --------------------
+
+def _planes(value, shape=(8, 10)):
+    return np.full(shape, value, dtype=np.uint8), np.full(shape, value % 16, dtype=np.uint8)
+
+
+def test_put_then_get_returns_memory_mapped_planes(tmp_path):
+    # Given a cache with one stored frame set
+    cache = FrameSetCache(str(tmp_path))
+    base, remainder = _planes(7)
+    cache.put("k1", base, remainder, {'canvas_shape': [12, 16], 'offset': [2, 3]})
+
+    # When looking it up, and looking up an unknown key
+    hit = cache.get("k1")
+    miss = cache.get("k2")
+
+    # Then the planes should come back read-only from disk
+    cached_base, cached_remainder, metadata = hit
+    assert isinstance(cached_base, np.memmap) and not cached_base.flags.writeable
+    assert np.array_equal(cached_base, base) and np.array_equal(cached_remainder, remainder)
+    assert metadata == {'canvas_shape': [12, 16], 'offset': [2, 3]}
+    assert miss is None
+    assert cache.get_stats()['hits'] == 1 and cache.get_stats()['misses'] == 1
+
+
+def test_least_recently_used_entry_is_evicted_over_size_bound(tmp_path):
+    # Given a cache with room for two entries, holding "old" and "new"
+    entry_bytes = sum(plane.nbytes for plane in _planes(0)) + 2 * 128  # planes + .npy headers
+    cache = FrameSetCache(str(tmp_path), max_bytes=2 * entry_bytes)
+    cache.put("old", *_planes(1), {})
+    cache.put("new", *_planes(2), {})
+    os.utime(tmp_path / "old.json", (1, 1))
+    os.utime(tmp_path / "new.json", (2, 2))
+
+    # When "old" is used again and a third entry is stored
+    cache.get("old")
+    cache.put("third", *_planes(3), {})
+
+    # Then the least recently used entry should have been evicted
+    assert cache.get("new") is None
+    assert cache.get("old") is not None and cache.get("third") is not None
+    assert cache.get_stats()['entries'] == 2
+
+
+def test_corrupt_entry_is_dropped(tmp_path):
+    # Given a stored entry whose base plane was truncated
+    cache = FrameSetCache(str(tmp_path))
+    cache.put("k1", *_planes(5), {})
+    (tmp_path / "k1.base.npy").write_bytes(b"\x93NUMPY")
+
+    # When looking it up
+    # Then it should be a miss and be removed
+    assert cache.get("k1") is None
+    assert not (tmp_path / "k1.json").exists()
+
+
+def test_entry_from_another_format_version_is_dropped(tmp_path, monkeypatch):
+    # Given an entry stored by a build with an older frame set format
+    cache = FrameSetCache(str(tmp_path))
+    monkeypatch.setattr(FrameSetCache, "FORMAT_VERSION", FrameSetCache.FORMAT_VERSION - 1)
+    old_key = FrameSetCache.make_key("image", "lut")
+    cache.put("k1", *_planes(5), {})
+    monkeypatch.undo()
+
+    # When keying and looking it up with the current format
+    # Then the key should differ, and the stale entry be a miss that is removed
+    assert FrameSetCache.make_key("image", "lut") != old_key
+    assert cache.get("k1") is None
+    assert not (tmp_path / "k1.json").exists()
+
+
+def test_hash_image_identifies_content_and_orientation():
+    # Given a portrait image and its landscape view
+    stored = np.arange(12, dtype=np.uint16).reshape(4, 3)
+    view = np.rot90(stored, -1)
+
+    # When hashing
+    # Then equal content should hash equally, different content or orientation differently
+    assert FrameSetCache.hash_image(view, 1) == FrameSetCache.hash_image(np.rot90(stored.copy(), -1), 1)
+    assert FrameSetCache.hash_image(view, 1) != FrameSetCache.hash_image(np.ascontiguousarray(view), 0)
+    assert FrameSetCache.hash_image(stored, 0) != FrameSetCache.hash_image(stored + 1, 0)
+
+
+def test_reprint_in_new_session_loads_planes_from_cache(tmp_path):
+    # Given frames prepared once through a frame cache
+    image = np.random.default_rng(4).integers(0, 65536, size=(30, 40), dtype=np.uint16)
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    key = FrameSetCache.hash_image(image)
+    first = PrintImageManager(frame_cache=FrameSetCache(str(tmp_path)))
+    expected = first.create_frame_source(image, lut, 64, 36, image_key=key).materialize()
+
+    # When a new session prints the same image and LUT, for another dither mode
+    manager = PrintImageManager(frame_cache=FrameSetCache(str(tmp_path)))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("planes rebuilt")
+
+    manager.prepare_dither_window = fail
+    source = manager.create_frame_source(image, lut, 64, 36, image_key=key)
+    bitplane = manager.create_frame_source(image, lut, 64, 36, dither_mode=PrintImageManager.DITHER_BITPLANE,
+                                           image_key=key)
+
+    # Then the planes should come from disk and give identical frames
+    assert manager.last_frame_cache_hit
+    assert all(np.array_equal(a, b) for a, b in zip(source.materialize(), expected))
+    assert len(bitplane) == 5
+
+
+def test_deferred_store_leaves_the_cache_untouched_until_stored(tmp_path):
+    # Given a print manager with a frame cache
+    image = np.random.default_rng(6).integers(0, 65536, size=(30, 40), dtype=np.uint16)
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    key = FrameSetCache.hash_image(image)
+    cache = FrameSetCache(str(tmp_path))
+    manager = PrintImageManager(frame_cache=cache)
+
+    # When preparing a frame source with the store deferred
+    manager.create_frame_source(image, lut, 64, 36, image_key=key, defer_cache_store=True)
+    entry = manager.last_frame_cache_entry
+
+    # Then nothing should be written until the entry is stored
+    assert entry is not None
+    assert cache.get_stats()['entries'] == 0
+    assert manager.store_frame_set(entry)
+    manager.create_frame_source(image, lut, 64, 36, image_key=key, defer_cache_store=True)
+    assert manager.last_frame_cache_hit and manager.last_frame_cache_entry is None
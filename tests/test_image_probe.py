@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+import tifffile
+from app.image_probe import ImageProbe
+from app.image_processor import ImageProcessor
+from app.print_image_manager import PrintImageManager
+
+
+# -------------------- ImageProbe Tests --------------------
+
+def test_probe_reads_format_from_header(tmp_path):
+    # Given an uncompressed portrait 16-bit TIFF
+    path = str(tmp_path / "portrait.tif")
+    tifffile.imwrite(path, np.zeros((40, 30), dtype=np.uint16))
+
+    # When probing it
+    probe = ImageProbe.from_file(path)
+
+    # Then the header should describe the image as it will be loaded
+    assert probe.stored_shape == (40, 30)
+    assert probe.shape == (30, 40)
+    assert probe.is_portrait
+    assert probe.dtype == np.uint16
+    assert probe.itemsize == 2
+    assert not probe.compressed and not probe.tiled
+    assert probe.memmappable
+
+
+def test_probe_reports_compressed_tiles(tmp_path):
+    # Given a tiled, compressed TIFF
+    path = str(tmp_path / "tiled.tif")
+    tifffile.imwrite(path, np.zeros((64, 64), dtype=np.uint16), tile=(16, 16), compression='zlib')
+
+    # When probing it
+    probe = ImageProbe.from_file(path)
+
+    # Then it should not be treated as memory-mappable
+    assert probe.tiled and probe.compressed
+    assert not probe.memmappable
+
+
+class _FakePage:
+    dtype = None
+    sampleformat = 5
+    bitspersample = 16
+
+
+class _FakeTiffFile:
+    def __init__(self, path):
+        self.pages = type("Pages", (), {"first": _FakePage()})()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_probe_rejects_sample_format_without_numpy_dtype(monkeypatch):
+    # Given a TIFF whose sample layout tifffile cannot map to a dtype
+    monkeypatch.setattr(tifffile, "TiffFile", _FakeTiffFile)
+
+    # When probing it
+    # Then it should be rejected as an unsupported format
+    with pytest.raises(ValueError, match="Unsupported TIFF sample format"):
+        ImageProbe.from_file("complex.tif")
+
+
+def test_probe_image_rejects_wrong_format_without_decoding(tmp_path):
+    # Given an 8-bit TIFF and a decoder that must not be called
+    path = str(tmp_path / "eight_bit.tif")
+    tifffile.imwrite(path, np.zeros((10, 10), dtype=np.uint8))
+
+    def reader(p, flag):
+        raise AssertionError("decoded")
+
+    processor = ImageProcessor(cv2_reader=reader)
+
+    # When probing or loading it
+    # Then it should be rejected from the header alone
+    with pytest.raises(ValueError, match="16-bit"):
+        processor.probe_image(path)
+    with pytest.raises(ValueError, match="16-bit"):
+        processor.load_image(path)
+
+
+def test_preflight_checks_accept_probe_in_place_of_pixels():
+    # Given a probe and the equivalent loaded image
+    probe = ImageProbe("scan.tif", (5000, 4000), np.uint16)
+    image = np.zeros((4000, 5000), dtype=np.uint16)
+    manager = PrintImageManager()
+
+    # When running the pre-flight checks on both
+    # Then the results should be identical
+    assert manager.calculate_8k_display_info(probe) == manager.calculate_8k_display_info(image)
+    assert manager.validate_print_readiness(probe) == manager.validate_print_readiness(image)
@@ -1,5 +1,7 @@
 import pytest
 import numpy as np
+import tifffile
+import cv2
 from app.image_processor import ImageProcessor
 
 
@@ -18,8 +20,115 @@ def test_load_image_successful_when_valid_16bit_grayscale_tiff():
     result = processor.load_image(dummy_path)
 
     # Then it should return the image unchanged
-    assert result.shape == (100, 100)
-    assert result.dtype == np.uint16
+    assert result.image.shape == (100, 100)
+    assert result.image.dtype == np.uint16
+    assert not result.rotation_applied
+
+def test_load_image_rotates_portrait_with_single_decode():
+    # Given a portrait image and a reader that counts decodes
+    portrait = np.arange(6, dtype=np.uint16).reshape(3, 2)
+    reads = []
+
+    def reader(path, flag):
+        reads.append(path)
+        return portrait
+
+    processor = ImageProcessor(
+        file_checker=lambda p: True,
+        cv2_reader=reader,
+        size_getter=lambda p: 1234
+    )
+
+    # When loading the image
+    result = processor.load_image("portrait.tif")
+
+    # Then one decode should yield the rotated image and its metadata
+    assert len(reads) == 1
+    assert result.image.shape == (2, 3)
+    assert result.original_shape == (3, 2)
+    assert result.was_portrait and result.rotation_applied
+    assert result.bytes_read == 1234
+    assert result.decode_time_ms >= 0
+
+def test_load_image_turns_portrait_without_copying():
+    # Given a portrait image
+    portrait = np.arange(12, dtype=np.uint16).reshape(4, 3)
+    processor = ImageProcessor(file_checker=lambda p: True, cv2_reader=lambda p, f: portrait)
+
+    # When loading it and applying a LUT
+    result = processor.load_image("portrait.tif")
+    lut = np.arange(65536, dtype=np.uint16)[::-1].reshape(256, 256)
+    processed = processor.apply_lut(result.image, lut)
+
+    # Then the image should be a turned view of the decoded pixels, and the
+    # LUT gather should write the turned result contiguously
+    assert np.shares_memory(result.image, portrait)
+    assert result.quarter_turns == 1
+    assert np.array_equal(result.image, cv2.rotate(portrait, cv2.ROTATE_90_CLOCKWISE))
+    assert processed.flags.c_contiguous
+    assert np.array_equal(processed, 65535 - result.image)
+
+def test_load_image_memory_maps_uncompressed_tiff(tmp_path):
+    # Given an uncompressed 16-bit TIFF on disk
+    path = str(tmp_path / "scan.tif")
+    data = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    tifffile.imwrite(path, data)
+    processor = ImageProcessor()
+
+    # When loading it
+    result = processor.load_image(path)
+
+    # Then the pixels should be mapped from the file, not decoded
+    assert result.decoder == "memmap"
+    assert isinstance(result.image, np.memmap)
+    assert np.array_equal(result.image, data)
+
+def test_load_image_decodes_compressed_tiff_in_parallel(tmp_path):
+    # Given a compressed, tiled 16-bit TIFF on disk
+    path = str(tmp_path / "scan.tif")
+    data = np.arange(48 * 64, dtype=np.uint16).reshape(48, 64)
+    tifffile.imwrite(path, data, tile=(16, 16), compression='zlib')
+    processor = ImageProcessor()
+
+    # When loading it
+    result = processor.load_image(path)
+
+    # Then its tiles should be decoded by tifffile
+    assert result.decoder == "tifffile"
+    assert np.array_equal(result.image, data)
+
+def test_load_image_decodes_bigtiff_with_tifffile(tmp_path):
+    # Given a compressed BigTIFF
+    path = str(tmp_path / "big.tif")
+    data = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    tifffile.imwrite(path, data, bigtiff=True, compression='zlib')
+    processor = ImageProcessor()
+
+    # When loading it
+    result = processor.load_image(path)
+
+    # Then tifffile should read it
+    assert result.decoder == "tifffile"
+    assert result.probe.bigtiff
+    assert np.array_equal(result.image, data)
+
+def test_load_image_falls_back_to_cv2_when_parallel_decode_fails(tmp_path):
+    # Given a compressed TIFF and a parallel decoder lacking its codec
+    path = str(tmp_path / "scan.tif")
+    data = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    tifffile.imwrite(path, data, compression='zlib')
+
+    def missing_codec(p, maxworkers):
+        raise ValueError("requires the 'imagecodecs' package")
+
+    processor = ImageProcessor(parallel_reader=missing_codec)
+
+    # When loading it
+    result = processor.load_image(path)
+
+    # Then OpenCV should decode it instead
+    assert result.decoder == "cv2"
+    assert np.array_equal(result.image, data)
 
 def test_load_image_raises_when_file_not_found():
     # Given an image processor with a failing file checker
@@ -0,0 +1,76 @@
+import numpy as np
+import cv2
+from app.image_pyramid import ImagePyramid
+from app.preview_image_manager import PreviewImageManager
+
+
+# -------------------- ImagePyramid Tests --------------------
+
+def _gradient(height, width):
+    return (np.arange(height * width) % 65536).astype(np.uint16).reshape(height, width)
+
+
+def test_pyramid_halves_until_min_level_size():
+    # Given a 1000x600 image
+    image = _gradient(600, 1000)
+
+    # When building a pyramid with 128-pixel smallest level
+    pyramid = ImagePyramid(image, min_level_size=128)
+
+    # Then each level should halve the previous one, sharing level 0
+    assert pyramid.levels[0] is image
+    assert [level.shape for level in pyramid.levels] == [(600, 1000), (300, 500), (150, 250), (75, 125)]
+
+
+def test_turned_view_downsamples_in_stored_layout():
+    # Given a portrait image turned to landscape as a view, and a resize that records its inputs
+    stored = _gradient(1000, 600)
+    calls = []
+
+    def resize(src, size, interpolation):
+        calls.append(src.flags.c_contiguous)
+        return cv2.resize(src, size, interpolation=interpolation)
+
+    # When building its pyramid
+    pyramid = ImagePyramid(np.rot90(stored, -1), cv2_resize=resize, min_level_size=128, quarter_turns=1)
+
+    # Then every level should match the pyramid of a turned copy, built from contiguous data only
+    expected = ImagePyramid(cv2.rotate(stored, cv2.ROTATE_90_CLOCKWISE), min_level_size=128)
+    assert np.shares_memory(pyramid.image, stored)
+    assert all(calls)
+    assert all(np.array_equal(a, b) for a, b in zip(pyramid.levels, expected.levels))
+    assert len(pyramid.levels) == len(expected.levels)
+
+
+def test_preview_comes_from_nearest_level():
+    # Given a pyramid and a resize that records its inputs
+    calls = []
+
+    def resize(src, size, interpolation):
+        calls.append(src.shape)
+        return np.zeros((size[1], size[0]), dtype=src.dtype)
+
+    pyramid = ImagePyramid(_gradient(800, 1600), cv2_resize=resize, min_level_size=128)
+    calls.clear()
+
+    # When asking for a 300-pixel-wide preview
+    preview = pyramid.image_for_size((300, 150))
+
+    # Then it should be resampled from the 400-pixel level, not full resolution
+    assert preview.shape == (150, 300)
+    assert calls == [(200, 400)]
+
+
+def test_preview_manager_prepares_same_size_from_pyramid():
+    # Given a preview manager, an image and its pyramid
+    manager = PreviewImageManager()
+    image = _gradient(2000, 3000)
+    pyramid = manager.build_pyramid(image)
+
+    # When preparing previews from the array and from the pyramid
+    direct = manager.prepare_preview_image(image)
+    from_pyramid = manager.prepare_preview_image(pyramid)
+
+    # Then both should have the container-fitted size
+    assert from_pyramid.shape == direct.shape == (432, 648)
+    assert from_pyramid.dtype == np.uint16
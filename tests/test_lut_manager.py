@@ -42,4 +42,112 @@ def test_load_lut_raises_when_wrong_shape():
     # When loading it
     # Then it should raise ValueError about 256x256 shape
     with pytest.raises(ValueError, match="256x256"):
-        manager.load_lut(dummy_path)
\ No newline at end of file
+        manager.load_lut(dummy_path)
+
+
+class _FakeStat:
+    def __init__(self, mtime_ns, size=131072):
+        self.st_mtime_ns = mtime_ns
+        self.st_size = size
+
+
+def test_load_lut_serves_unchanged_file_from_cache():
+    # Given a LUT file whose stats do not change between loads
+    dummy_path = "/mock/path/lut.tif"
+    reads = []
+    manager = LUTManager(
+        file_checker=lambda p: True,
+        tiff_reader=lambda p: reads.append(p) or np.ones((256, 256), dtype=np.uint16),
+        stat_func=lambda p: _FakeStat(1)
+    )
+
+    # When loading it twice
+    first = manager.load_lut(dummy_path)
+    second = manager.load_lut(dummy_path)
+
+    # Then the TIFF should be read once and the second load counted as a hit
+    assert len(reads) == 1
+    assert np.array_equal(first, second)
+    assert manager.get_cache_stats()['hits'] == 1
+    assert manager.get_cache_stats()['misses'] == 1
+
+
+def test_load_lut_rereads_when_mtime_changes():
+    # Given a LUT file that is modified between loads
+    mtimes = iter([1, 2])
+    reads = []
+    manager = LUTManager(
+        file_checker=lambda p: True,
+        tiff_reader=lambda p: reads.append(p) or np.ones((256, 256), dtype=np.uint16),
+        stat_func=lambda p: _FakeStat(next(mtimes))
+    )
+
+    # When loading it twice
+    manager.load_lut("/mock/path/lut.tif")
+    manager.load_lut("/mock/path/lut.tif")
+
+    # Then it should be read again but share the entry for identical content
+    assert len(reads) == 2
+    assert manager.get_cache_stats()['entries'] == 1
+
+
+def test_lut_cache_evicts_least_recently_used():
+    # Given a cache holding two LUTs with distinct contents
+    luts = {f"/mock/lut{i}.tif": np.full((256, 256), i, dtype=np.uint16) for i in range(3)}
+    manager = LUTManager(
+        file_checker=lambda p: True,
+        tiff_reader=lambda p: luts[p],
+        stat_func=lambda p: _FakeStat(1),
+        cache_size=2
+    )
+
+    # When loading three LUTs, touching the first again before the third
+    manager.load_lut("/mock/lut0.tif")
+    manager.load_lut("/mock/lut1.tif")
+    manager.load_lut("/mock/lut0.tif")
+    manager.load_lut("/mock/lut2.tif")
+
+    # Then the least recently used LUT should have been evicted
+    manager.load_lut("/mock/lut0.tif")
+    manager.load_lut("/mock/lut1.tif")
+    stats = manager.get_cache_stats()
+    assert stats['entries'] == 2
+    assert stats['hits'] == 2
+    assert stats['misses'] == 4
+
+
+def test_get_derived_builds_once_per_lut():
+    # Given a cached LUT and a builder that counts invocations
+    builds = []
+    manager = LUTManager(
+        file_checker=lambda p: True,
+        tiff_reader=lambda p: np.ones((256, 256), dtype=np.uint16),
+        stat_func=lambda p: _FakeStat(1)
+    )
+
+    # When asking for the same derived form twice
+    first = manager.get_derived("/mock/lut.tif", "sum", lambda lut: builds.append(1) or int(lut.sum()))
+    second = manager.get_derived("/mock/lut.tif", "sum", lambda lut: builds.append(1) or int(lut.sum()))
+
+    # Then it should be built only once
+    assert first == second == 65536
+    assert len(builds) == 1
+
+
+def test_get_derived_for_entry_does_not_count_a_second_hit():
+    # Given a LUT loaded once
+    manager = LUTManager(
+        file_checker=lambda p: True,
+        tiff_reader=lambda p: np.ones((256, 256), dtype=np.uint16),
+        stat_func=lambda p: _FakeStat(1)
+    )
+    entry = manager.load_lut_entry("/mock/lut.tif")
+
+    # When deriving a form from its entry
+    total = manager.get_derived_for(entry, "sum", lambda lut: int(lut.sum()))
+
+    # Then the LUT should not be looked up again
+    assert total == 65536
+    assert entry.derived["sum"] == 65536
+    assert manager.get_cache_stats()['hits'] == 0
+    assert manager.get_cache_stats()['misses'] == 1
@@ -17,3 +17,66 @@ def test_create_preview_pixmap_returns_qpixmap(qapp):
     # Then it should return a QPixmap (scaled preview) and quit cleanly
     assert isinstance(result, QPixmap)
 
+
+
+def test_display_table_fuses_lut_inversion_and_8bit_conversion():
+    # Given a LUT and a preview manager
+    lut = np.random.default_rng(0).integers(0, 65536, size=(256, 256), dtype=np.uint16)
+    manager = PreviewImageManager()
+
+    # When building the fused display table
+    table = manager.build_display_table(lut, invert=True)
+
+    # Then each entry should equal LUT, inversion and rounding applied in turn
+    values = np.arange(65536)
+    expected = np.round((65535 - lut.reshape(-1)[values].astype(np.float64)) / 257).astype(np.uint8)
+    assert table.dtype == np.uint8
+    assert np.array_equal(table, expected)
+    assert manager.build_display_table(lut, invert=True) is table
+
+
+def test_create_preview_pixmap_renders_through_display_table(qapp):
+    # Given a uniform 16-bit image
+    image = np.full((100, 100), 65535, dtype=np.uint16)
+    manager = PreviewImageManager()
+
+    # When rendering it inverted
+    pixmap = manager.create_preview_pixmap(image, container_size=(50, 50), invert=True)
+
+    # Then the 8-bit preview should be black at the container size
+    rendered = pixmap.toImage()
+    assert (rendered.width(), rendered.height()) == (50, 50)
+    assert rendered.pixelColor(25, 25).red() == 0
+
+
+def test_preview_cache_reuses_rendered_states(qapp):
+    # Given a preview manager and an image
+    image = (np.random.rand(200, 300) * 65535).astype(np.uint16)
+    lut = np.arange(65536, dtype=np.uint16).reshape(256, 256)
+    manager = PreviewImageManager()
+
+    # When rendering original, processed, then original again
+    original = manager.get_preview_pixmap(image, 1, container_size=(150, 100))
+    manager.get_preview_pixmap(image, 1, container_size=(150, 100), lut=lut, invert=True)
+    again = manager.get_preview_pixmap(image, 1, container_size=(150, 100))
+
+    # Then the repeated state should come from the cache
+    assert again is original
+    assert manager.get_preview_cache_stats()['hits'] == 1
+    assert manager.get_preview_cache_stats()['misses'] == 2
+
+
+def test_preview_cache_renders_new_sizes_and_versions(qapp):
+    # Given a cached preview
+    image = (np.random.rand(200, 300) * 65535).astype(np.uint16)
+    manager = PreviewImageManager()
+    first = manager.get_preview_pixmap(image, 1, container_size=(150, 100))
+
+    # When the container resizes or the image version changes
+    resized = manager.get_preview_pixmap(image, 1, container_size=(300, 200))
+    new_version = manager.get_preview_pixmap(image, 2, container_size=(150, 100))
+
+    # Then each should be rendered afresh
+    assert resized is not first and new_version is not first
+    assert resized.width() == 300
+    assert manager.get_preview_cache_stats()['misses'] == 3
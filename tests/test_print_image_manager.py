@@ -198,4 +198,51 @@ def test_generate_dithered_frames_from_array_outputs_expected_structure():
     assert first_shape[0] == PrintImageManager.DISPLAY_HEIGHT
     assert first_shape[1] == PrintImageManager.DISPLAY_WIDTH
     assert all(f.shape == first_shape for f in frames)
-    assert len(frames) == 16
\ No newline at end of file
+    assert len(frames) == 16
+
+
+def test_generated_frames_shared_across_positions_are_read_only():
+    # Given a uniform image, whose frames repeat within the cycle
+    image = np.full((40, 60), 30000, dtype=np.uint16)
+    manager = PrintImageManager()
+
+    # When generating the frame list
+    frames = manager.generate_dithered_frames_from_array(image, target_width=96, target_height=54)
+
+    # Then a shared frame should refuse in-place edits such as an overlay
+    shared = [frame for frame in frames if sum(other is frame for other in frames) > 1]
+    assert shared
+    with pytest.raises(ValueError):
+        shared[0][0, 0] = 255
+
+
+def test_generate_dithered_frames_from_array_rejects_unsupported_input():
+    # Given a print manager
+    manager = PrintImageManager()
+    image = np.zeros((40, 60), dtype=np.uint16)
+
+    # When / Then non-16-bit images and more than 16 frames should be rejected
+    with pytest.raises(ValueError, match="16-bit"):
+        manager.generate_dithered_frames_from_array(image.astype(np.uint8), target_width=96, target_height=54)
+    with pytest.raises(ValueError, match="num_frames"):
+        manager.generate_dithered_frames_from_array(image, target_width=96, target_height=54, num_frames=17)
+
+
+def test_create_frame_source_dithers_at_screen_resolution():
+    # Given a uniform 3840x2160 image and a 4K print screen
+    image = np.full((2160, 3840), 30000, dtype=np.uint16)
+    lut = np.arange(65536, dtype=np.uint16).reshape((256, 256))
+    manager = PrintImageManager()
+
+    # When creating a frame source for the 4K screen
+    source = manager.create_frame_source(image, lut, screen_size=(3840, 2160))
+
+    # Then frames should be screen-sized, with the image resampled once to half size
+    assert source.shape == (2160, 3840)
+    info = manager.last_resample_info
+    assert info['scale'] == 0.5
+    assert info['resampled_size'] == (1920, 1080)
+    print_value = 65535 - 30000
+    frame = source[source.schedule[15]]
+    assert frame[1080, 1920] == (print_value >> 8) + ((print_value >> 4) & 0xF == 15)
+    assert frame[100, 100] == 0
@@ -0,0 +1,56 @@
+import numpy as np
+from PyQt6.QtGui import QImage, QPixmap
+from app.print_surface import PrintSurface
+
+
+# -------------------- PrintSurface Tests --------------------
+
+def _gray_pixmap(width, height, value):
+    frame = np.full((height, width), value, dtype=np.uint8)
+    qimage = QImage(frame.data, width, height, width, QImage.Format.Format_Grayscale8)
+    return QPixmap.fromImage(qimage)
+
+
+def test_print_surface_centers_frame_without_scaling(qapp):
+    # Given a 40x20 surface showing a 20x10 grey frame
+    surface = PrintSurface()
+    surface.resize(40, 20)
+    surface.set_pixmap(_gray_pixmap(20, 10, 200))
+
+    # When rendering the surface
+    image = surface.grab().toImage()
+
+    # Then the frame should be centered at 1:1 on a black background
+    assert image.pixelColor(20, 10).red() == 200
+    assert image.pixelColor(10, 5).red() == 200
+    assert image.pixelColor(9, 5).red() == 0
+    assert image.pixelColor(20, 4).red() == 0
+
+
+def test_print_surface_records_paint_cost(qapp):
+    # Given a surface showing a frame
+    surface = PrintSurface()
+    surface.resize(16, 16)
+    surface.set_pixmap(_gray_pixmap(16, 16, 10))
+
+    # When it is painted
+    surface.grab()
+
+    # Then the paint should be measured
+    stats = surface.get_paint_stats()
+    assert stats['paints'] >= 1
+    assert stats['max_ms'] >= stats['mean_ms'] >= 0
+
+
+def test_print_surface_repaints_only_dirty_rects(qapp):
+    # Given a surface already showing a frame
+    surface = PrintSurface()
+    surface.resize(64, 64)
+    surface.set_pixmap(_gray_pixmap(64, 64, 10))
+    surface.reset_paint_stats()
+
+    # When the next frame changes only inside one small rectangle
+    surface.set_pixmap(_gray_pixmap(64, 64, 10), dirty_rects=[(0, 0, 8, 8)])
+
+    # Then only that rectangle should be scheduled for repaint
+    assert surface.get_paint_stats()['mean_pixels_per_frame'] == 64
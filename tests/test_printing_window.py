@@ -0,0 +1,177 @@
+import numpy as np
+from app.dithered_frame_source import DitheredFrameSource
+from app.PrintingWindow import PrintingWindow
+
+
+# -------------------- PrintingWindow Tests --------------------
+
+class FakeClock:
+    def __init__(self):
+        self.now_ns = 0
+
+    def __call__(self):
+        return self.now_ns
+
+
+def _window(clock=None, **kwargs):
+    window = PrintingWindow(screen_index=0, clock=clock, **kwargs)
+    window.winId()  # Create the native window that start_printing moves to the screen
+    width, height = window.get_target_screen_size()
+    return window, (height, width)
+
+
+def _pixmap_bytes(qapp):
+    geometry = qapp.screens()[0].geometry()
+    return geometry.width() * geometry.height() * 4
+
+
+def _start(window, frames, duration_ms):
+    # Start the loop directly instead of waiting for the window's show delay
+    window.start_printing(frames, duration_ms)
+    window._begin_printing_frame_loop()
+
+
+def _planes(shape, remainder_values):
+    base = np.full(shape, 100, dtype=np.uint8)
+    remainder = np.resize(np.asarray(remainder_values, dtype=np.uint8), shape[0] * shape[1]).reshape(shape)
+    return base, remainder
+
+
+def test_pixmaps_are_cached_when_the_cycle_fits_the_budget(qapp):
+    # Given a window whose budget fits two screen-sized pixmaps, and a two-frame print
+    clock = FakeClock()
+    window, shape = _window(clock, pixmap_cache_bytes=2 * _pixmap_bytes(qapp))
+    frames = [np.full(shape, value, dtype=np.uint8) for value in (10, 20)]
+    _start(window, frames, 1000)
+
+    # When the second cycle is shown
+    for _ in range(3):
+        clock.now_ns += 1_000_000_000 // window.fps
+        window.update_frame()
+
+    # Then both pixmaps should be cached, and the second cycle should reuse them
+    report = window.get_frame_timing_report()
+    assert report['pixmap_cache']
+    assert set(window._pixmap_cache) == {0, 1}
+    assert report['first_cycle']['count'] == 2
+    assert report['steady_state']['count'] == 2
+    window.stop_printing()
+
+
+def test_temporal_cycle_over_budget_is_not_cached(qapp):
+    # Given a window whose budget fits five pixmaps, and a 16-frame temporal source
+    clock = FakeClock()
+    window, shape = _window(clock, pixmap_cache_bytes=5 * _pixmap_bytes(qapp))
+    source = DitheredFrameSource(*_planes(shape, range(16)))
+
+    # When printing a full cycle
+    _start(window, source, 2000)
+    for _ in range(16):
+        clock.now_ns += 1_000_000_000 // window.fps
+        window.update_frame()
+
+    # Then no pixmap should be kept
+    assert window.pixmap_cycle_bytes() > window.pixmap_cache_bytes
+    assert not window.get_frame_timing_report()['pixmap_cache']
+    assert window._pixmap_cache == {}
+    window.stop_printing()
+
+
+def test_frames_follow_variable_durations(qapp):
+    # Given a bit-plane source, whose frames last 1, 1, 2, 4 and 8 units
+    clock = FakeClock()
+    window, shape = _window(clock)
+    source = DitheredFrameSource(*_planes(shape, range(16)), mode=DitheredFrameSource.MODE_BITPLANE)
+    _start(window, source, 1000)
+    unit_ns = 1_000_000_000 // window.fps
+
+    # When ticking once per unit through one cycle
+    shown = [window.current_frame]
+    for _ in range(15):
+        clock.now_ns += unit_ns
+        window.update_frame()
+        shown.append(window.current_frame)
+
+    # Then each frame should stay on screen for its duration
+    assert shown == [0, 1, 2, 2, 3, 3, 3, 3] + [4] * 8
+    window.stop_printing()
+
+
+def test_consecutive_frames_hand_dirty_tiles_to_the_surface(qapp):
+    # Given a frame source, and a surface that records what it is given
+    clock = FakeClock()
+    window, shape = _window(clock)
+    source = DitheredFrameSource(*_planes(shape, [0, 5]))
+    calls = []
+    window.print_surface.set_pixmap = lambda pixmap, dirty_rects=None: calls.append(dirty_rects)
+    _start(window, source, 1000)
+
+    # When the next frame and then a frame two slots later are shown
+    clock.now_ns += 1_000_000_000 // window.fps
+    window.update_frame()
+    clock.now_ns += 2 * 1_000_000_000 // window.fps
+    window.update_frame()
+
+    # Then only the consecutive transition should repaint just its dirty tiles
+    assert calls[0] is None
+    assert calls[1] == source.dirty_tiles(1) and calls[1]
+    assert calls[2] is None
+    window.stop_printing()
+
+
+def test_exposure_ends_on_wall_clock_time(qapp):
+    # Given a running 500 ms print
+    clock = FakeClock()
+    window, shape = _window(clock)
+    finished = []
+    window.finished.connect(lambda: finished.append(True))
+    _start(window, [np.zeros(shape, dtype=np.uint8)], 500)
+
+    # When the exposure time has elapsed
+    clock.now_ns = 500_000_000
+    window.update_frame()
+
+    # Then printing should stop and the frames should be released
+    assert finished == [True]
+    assert window.frames == []
+    assert window.get_timing_stats()['frames_shown'] == 1
+
+
+def test_stopping_twice_finishes_once(qapp):
+    # Given a running print
+    window, shape = _window(FakeClock())
+    finished = []
+    window.finished.connect(lambda: finished.append(True))
+    _start(window, [np.zeros(shape, dtype=np.uint8)], 500)
+
+    # When it is stopped, then stopped again
+    window.stop_printing()
+    window.stop_printing()
+
+    # Then it should report finishing only once
+    assert finished == [True]
+
+
+def test_restarting_mid_exposure_drops_the_pending_tick(qapp):
+    # Given a print that is still exposing
+    clock = FakeClock()
+    window, shape = _window(clock)
+    finished = []
+    window.finished.connect(lambda: finished.append(True))
+    _start(window, [np.zeros(shape, dtype=np.uint8)], 500)
+    clock.now_ns = 100_000_000
+
+    # When a new print is started before the old one ends
+    window.start_printing([np.full(shape, 255, dtype=np.uint8)], 500)
+
+    # Then the old timer should be stopped and a stray tick ignored
+    assert not window.timer.isActive()
+    assert window.scheduler is None
+    window.update_frame()
+    assert finished == []
+
+    # And the new print should run from its own start
+    window._begin_printing_frame_loop()
+    assert window.get_timing_stats()['frames_shown'] == 1
+    window.stop_printing()
+    assert finished == [True]
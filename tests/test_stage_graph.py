@@ -0,0 +1,151 @@
+import threading
+import pytest
+from app.stage_graph import StageGraph
+
+
+# -------------------- StageGraph Tests --------------------
+
+def _print_pipeline(calls):
+    # image → processed → frames ← screen; exposure only feeds presentation
+    graph = StageGraph()
+    graph.add_input('image_file')
+    graph.add_input('lut_file')
+    graph.add_input('screen')
+
+    def stage(name, func):
+        def run(*values):
+            calls.append(name)
+            return func(*values)
+        return run
+
+    graph.add_stage('image', ['image_file'], stage('image', lambda path: f"decoded {path}"))
+    graph.add_stage('processed', ['image', 'lut_file'], stage('processed', lambda image, lut: (image, lut)))
+    graph.add_stage('frames', ['processed', 'screen'], stage('frames', lambda processed, screen: (processed, screen)))
+    return graph
+
+
+def test_get_computes_each_stage_once():
+    # Given a pipeline with all inputs set
+    calls = []
+    graph = _print_pipeline(calls)
+    graph.set('image_file', "scan.tif")
+    graph.set('lut_file', "grade2.tif")
+    graph.set('screen', (7680, 4320))
+
+    # When requesting the frames twice
+    first = graph.get('frames')
+    second = graph.get('frames')
+
+    # Then every stage should have run exactly once
+    assert first is second
+    assert calls == ['image', 'processed', 'frames']
+
+
+def test_changing_lut_does_not_redecode_image():
+    # Given a computed pipeline
+    calls = []
+    graph = _print_pipeline(calls)
+    graph.set('image_file', "scan.tif")
+    graph.set('lut_file', "grade2.tif")
+    graph.set('screen', (7680, 4320))
+    graph.get('frames')
+    calls.clear()
+
+    # When selecting another LUT
+    graph.set('lut_file', "grade3.tif")
+
+    # Then only the stages downstream of the LUT should be dropped and recomputed
+    assert graph.is_current('image')
+    assert graph.peek('processed') is None and graph.peek('frames') is None
+    assert graph.get('frames') == (("decoded scan.tif", "grade3.tif"), (7680, 4320))
+    assert calls == ['processed', 'frames']
+
+
+def test_setting_an_equal_input_keeps_results():
+    # Given a computed pipeline
+    calls = []
+    graph = _print_pipeline(calls)
+    graph.set('image_file', "scan.tif")
+    graph.set('lut_file', "grade2.tif")
+    graph.set('screen', (7680, 4320))
+    frames = graph.get('frames')
+    version = graph.version('frames')
+    calls.clear()
+
+    # When setting the screen to the same size again
+    graph.set('screen', (7680, 4320))
+
+    # Then the frames should be reused as they are
+    assert graph.get('frames') is frames
+    assert graph.version('frames') == version
+    assert calls == []
+
+
+def test_get_rejects_unset_input():
+    # Given a pipeline without a LUT
+    graph = _print_pipeline([])
+    graph.set('image_file', "scan.tif")
+    graph.set('screen', (7680, 4320))
+
+    # When / Then computing the frames should fail
+    with pytest.raises(ValueError, match="lut_file"):
+        graph.get('frames')
+
+
+def test_add_stage_rejects_undeclared_inputs():
+    # Given an empty graph
+    graph = StageGraph()
+
+    # When / Then a stage depending on an unknown stage should be rejected
+    with pytest.raises(ValueError, match="undeclared"):
+        graph.add_stage('image', ['image_file'], lambda path: path)
+
+
+def test_result_of_superseded_input_is_not_stored():
+    # Given a stage that is computing while its input changes
+    graph = StageGraph()
+    graph.add_input('image_file', "old.tif")
+    started, release = threading.Event(), threading.Event()
+
+    def load(path):
+        started.set()
+        release.wait(5)
+        return f"decoded {path}"
+
+    graph.add_stage('image', ['image_file'], load)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(graph.get('image')))
+    thread.start()
+    started.wait(5)
+
+    # When a new file is selected before the old one finishes
+    graph.set('image_file', "new.tif")
+    release.set()
+    thread.join(5)
+
+    # Then the caller should get the old result but the graph should not keep it
+    assert results == ["decoded old.tif"]
+    assert graph.peek('image') is None
+    assert graph.get('image') == "decoded new.tif"
+
+
+def test_input_changed_while_gathering_inputs_is_not_kept():
+    # Given a stage reading 'x' and then a stage during which 'x' is set anew
+    graph = StageGraph()
+    graph.add_input('x', 1)
+    graph.add_input('w', "w")
+
+    def set_x(w):
+        graph.set('x', 2)  # Another thread selecting a new value mid-computation
+        return w
+
+    graph.add_stage('z', ['w'], set_x)
+    graph.add_stage('y', ['x', 'z'], lambda x, z: x * 10)
+
+    # When computing the stage
+    first = graph.get('y')
+
+    # Then the result from the old value should not be kept as current
+    assert first == 10
+    assert not graph.is_current('y')
+    assert graph.get('y') == 20
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+from app.tile_executor import TileExecutor
+from app.compiled_lut import CompiledLUT
+from app.dithered_frame_source import DitheredFrameSource
+from app.image_processor import ImageProcessor
+from app.print_image_manager import PrintImageManager
+
+
+# -------------------- TileExecutor Tests --------------------
+
+def _parallel_executor(workers=4):
+    executor = TileExecutor(workers)
+    executor.min_band_pixels = 1  # Split even tiny test images
+    return executor
+
+
+def _random_image(shape, seed=0):
+    return np.random.default_rng(seed).integers(0, 65536, size=shape, dtype=np.uint16)
+
+
+def test_bands_cover_every_row_once():
+    # Given an executor with four workers
+    executor = _parallel_executor(4)
+
+    # When splitting 10 rows into bands
+    bands = executor.bands((10, 3))
+
+    # Then the bands should tile the rows without gaps or overlaps
+    rows = [row for band in bands for row in range(10)[band]]
+    assert len(bands) == 4
+    assert rows == list(range(10))
+
+
+def test_small_images_run_as_one_band():
+    # Given an executor with the default band threshold
+    executor = TileExecutor(4)
+
+    # When splitting a small image
+    # Then it should not be split
+    assert executor.bands((64, 64)) == [slice(0, 64)]
+    executor.shutdown()
+
+
+def test_run_propagates_band_errors():
+    # Given a stage that fails on one band
+    executor = _parallel_executor(2)
+
+    def stage(rows):
+        if rows.start > 0:
+            raise ValueError("bad band")
+
+    # When running it
+    # Then the error should reach the caller
+    with pytest.raises(ValueError, match="bad band"):
+        executor.run(stage, (8, 8))
+    executor.shutdown()
+
+
+def test_rejects_zero_workers():
+    # Given / When / Then an executor without workers should be rejected
+    with pytest.raises(ValueError, match="workers"):
+        TileExecutor(0)
+
+
+def test_compiled_lut_is_byte_identical_with_executor():
+    # Given compiled tables and a random image
+    lut = _random_image((256, 256), seed=1)
+    compiled = CompiledLUT(lut)
+    image = _random_image((37, 53))
+    executor = _parallel_executor()
+
+    # When applying and splitting over row bands
+    applied = compiled.apply(image, executor=executor)
+    base, remainder = compiled.split(image, executor=executor)
+
+    # Then the output should match the single-pass result exactly
+    expected_base, expected_remainder = compiled.split(image)
+    assert np.array_equal(applied, compiled.apply(image))
+    assert np.array_equal(base, expected_base)
+    assert np.array_equal(remainder, expected_remainder)
+    executor.shutdown()
+
+
+@pytest.mark.parametrize("mode", DitheredFrameSource.MODES)
+def test_frame_source_is_byte_identical_with_executor(mode):
+    # Given dither planes and a parallel executor
+    rng = np.random.default_rng(2)
+    base = rng.integers(0, 255, size=(29, 41), dtype=np.uint8)
+    remainder = rng.integers(0, 16, size=(29, 41), dtype=np.uint8)
+    executor = _parallel_executor()
+
+    # When materializing frames with and without the executor
+    serial = DitheredFrameSource(base, remainder, mode=mode).materialize()
+    parallel = DitheredFrameSource(base, remainder, mode=mode, executor=executor).materialize()
+
+    # Then every frame should be identical
+    assert all(np.array_equal(a, b) for a, b in zip(serial, parallel))
+    executor.shutdown()
+
+
+def test_processors_are_byte_identical_with_executor():
+    # Given LUT data, an image and processors with and without an executor
+    lut = _random_image((256, 256), seed=3)
+    image = _random_image((31, 47), seed=4)
+    executor = _parallel_executor()
+
+    # When running LUT and inversion both ways
+    # Then the results should be identical
+    for serial, parallel in ((ImageProcessor(), ImageProcessor(executor=executor)),
+                             (PrintImageManager(), PrintImageManager(executor=executor))):
+        assert np.array_equal(parallel.apply_lut(image, lut), serial.apply_lut(image, lut))
+        assert np.array_equal(parallel.invert_image(image), serial.invert_image(image))
+
+    serial_planes = PrintImageManager().prepare_dither_window(image, lut, 64, 48)
+    parallel_planes = PrintImageManager(executor=executor).prepare_dither_window(image, lut, 64, 48)
+    assert all(np.array_equal(a, b) for a, b in zip(serial_planes, parallel_planes))
+    executor.shutdown()